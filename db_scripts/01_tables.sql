@@ -1,3 +1,11 @@
+CREATE EXTENSION IF NOT EXISTS unaccent;
+
+-- Spanish stemming with accents folded, so "bogota" matches "Bogotá".
+CREATE TEXT SEARCH CONFIGURATION es_unaccent (COPY = spanish);
+
+ALTER TEXT SEARCH CONFIGURATION es_unaccent
+    ALTER MAPPING FOR hword, hword_part, word WITH unaccent, spanish_stem;
+
 CREATE TABLE records (
     id BIGSERIAL PRIMARY KEY,
     address TEXT NOT NULL,
@@ -7,14 +15,50 @@ CREATE TABLE records (
         housing_type IN ('apartamento', 'casa', 'comercial')
     ),
     monthly_rent NUMERIC(12, 2) NOT NULL CHECK (monthly_rent > 0),
+    latitude DOUBLE PRECISION CHECK (latitude BETWEEN -90 AND 90),
+    longitude DOUBLE PRECISION CHECK (longitude BETWEEN -180 AND 180),
+    reviews_count INT NOT NULL DEFAULT 0,
+    rating_sum BIGINT NOT NULL DEFAULT 0,
+    -- Sort key for `sort=rating`: average rating, 0 without reviews (the API reports null).
+    rating_score DOUBLE PRECISION GENERATED ALWAYS AS (
+        CASE WHEN reviews_count > 0 THEN rating_sum::DOUBLE PRECISION / reviews_count ELSE 0 END
+    ) STORED,
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
-    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+    updated_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+    -- Soft-delete marker; `make purge-deleted-records` removes the row and its dependents.
+    deleted_at TIMESTAMPTZ,
+    search_vector TSVECTOR GENERATED ALWAYS AS (
+        setweight(to_tsvector('es_unaccent'::regconfig, coalesce(city, '')), 'A')
+        || setweight(to_tsvector('es_unaccent'::regconfig, coalesce(country, '')), 'B')
+        || setweight(to_tsvector('es_unaccent'::regconfig, coalesce(address, '')), 'C')
+    ) STORED,
+    -- x = longitude, y = latitude; NULL when the record has no coordinates.
+    location POINT GENERATED ALWAYS AS (point(longitude, latitude)) STORED,
+    CHECK ((latitude IS NULL) = (longitude IS NULL))
 );
 
 CREATE INDEX idx_records_country_city ON records(country, city);
 
 CREATE INDEX idx_records_housing_type ON records(housing_type);
 
+CREATE INDEX idx_records_created_id ON records(created_at DESC, id DESC);
+
+-- One (key, id) index per `sort=` option, so ordered pages and keyset cursors are index scans.
+-- idx_records_rent_id serves rent_asc forwards and rent_desc backwards.
+CREATE INDEX idx_records_rent_id ON records(monthly_rent, id);
+
+CREATE INDEX idx_records_rating_id ON records(rating_score DESC, id DESC);
+
+CREATE INDEX idx_records_reviews_id ON records(reviews_count DESC, id DESC);
+
+CREATE INDEX idx_records_search ON records USING GIN (search_vector);
+
+-- Serves `location <@ box(...)` viewport queries and `ORDER BY location <-> point(...)` k-NN scans.
+CREATE INDEX idx_records_location ON records USING GIST (location);
+
+-- Only pending purges are indexed, so the purge job finds them without scanning records.
+CREATE INDEX idx_records_deleted_at ON records(deleted_at) WHERE deleted_at IS NOT NULL;
+
 CREATE TABLE record_images (
     id BIGSERIAL PRIMARY KEY,
     record_id BIGINT NOT NULL REFERENCES records(id) ON DELETE CASCADE,
@@ -22,7 +66,55 @@ CREATE TABLE record_images (
     created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_record_images_record ON record_images(record_id);
+-- (record_id, id) also returns images in upload order, so the cover is the first index entry.
+CREATE INDEX idx_record_images_record ON record_images(record_id, id);
+
+-- Live record counts per segment for the browse facets (`GET /records:facets`). The records
+-- repository adjusts them in the same transaction as each create/update/delete;
+-- `make rebuild-facet-counts` recomputes them from scratch.
+CREATE TABLE record_facet_counts (
+    country VARCHAR(80) NOT NULL,
+    city VARCHAR(80) NOT NULL,
+    housing_type VARCHAR(20) NOT NULL,
+    records_count BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (country, city, housing_type)
+);
+
+-- Rent analytics rollups. Refreshed on a schedule (`make refresh-rent-stats`) so the
+-- analytics endpoints read a handful of pre-aggregated rows instead of scanning records.
+CREATE MATERIALIZED VIEW rent_stats_by_segment AS
+SELECT
+    country,
+    city,
+    housing_type,
+    COUNT(*) AS records_count,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY monthly_rent)::NUMERIC(12, 2) AS median_rent,
+    percentile_cont(0.9) WITHIN GROUP (ORDER BY monthly_rent)::NUMERIC(12, 2) AS p90_rent,
+    now() AS refreshed_at
+FROM records
+WHERE deleted_at IS NULL
+GROUP BY country, city, housing_type;
+
+-- Unique indexes are required by REFRESH MATERIALIZED VIEW CONCURRENTLY and serve lookups.
+CREATE UNIQUE INDEX uq_rent_stats_by_segment
+    ON rent_stats_by_segment(country, city, housing_type);
+
+CREATE MATERIALIZED VIEW rent_stats_monthly AS
+SELECT
+    country,
+    city,
+    housing_type,
+    date_trunc('month', created_at AT TIME ZONE 'UTC')::DATE AS month,
+    COUNT(*) AS records_count,
+    percentile_cont(0.5) WITHIN GROUP (ORDER BY monthly_rent)::NUMERIC(12, 2) AS median_rent,
+    percentile_cont(0.9) WITHIN GROUP (ORDER BY monthly_rent)::NUMERIC(12, 2) AS p90_rent,
+    now() AS refreshed_at
+FROM records
+WHERE created_at IS NOT NULL AND deleted_at IS NULL
+GROUP BY country, city, housing_type, month;
+
+CREATE UNIQUE INDEX uq_rent_stats_monthly
+    ON rent_stats_monthly(country, city, housing_type, month);
 
 CREATE TABLE reviews (
     id BIGSERIAL PRIMARY KEY,
@@ -41,7 +133,9 @@ CREATE TABLE reviews (
     updated_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
-CREATE INDEX idx_reviews_record ON reviews(record_id);
+-- Serves the record's review pages (ORDER BY created_at DESC, id DESC, keyset or OFFSET)
+-- straight from the index, and the record_id lookups the old single-column index handled.
+CREATE INDEX idx_reviews_record_created ON reviews(record_id, created_at DESC, id DESC);
 
 CREATE TABLE review_images (
     id BIGSERIAL PRIMARY KEY,
@@ -71,4 +165,25 @@ CREATE TABLE saved_records (
     CONSTRAINT uq_saved_records_record UNIQUE (record_id)
 );
 
-CREATE INDEX idx_saved_records_record_saved_at ON saved_records(record_id, saved_at DESC);
\ No newline at end of file
+CREATE INDEX idx_saved_records_record_saved_at ON saved_records(record_id, saved_at DESC);
+
+-- Transactional outbox: rows are inserted in the same transaction as the write that triggers
+-- the email and delivered by app.shared.infrastructure.email.dispatch_outbox.
+CREATE TABLE email_outbox (
+    id BIGSERIAL PRIMARY KEY,
+    recipients TEXT[] NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    html_body TEXT,
+    reply_to TEXT,
+    from_email TEXT,
+    status VARCHAR(16) NOT NULL DEFAULT 'pending' CHECK (status IN ('pending', 'sent', 'dead')),
+    attempts INT NOT NULL DEFAULT 0,
+    last_error TEXT,
+    next_attempt_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    sent_at TIMESTAMPTZ
+);
+
+-- Only pending rows are polled; sent and dead rows never enter the index.
+CREATE INDEX idx_email_outbox_due ON email_outbox(next_attempt_at, id) WHERE status = 'pending';
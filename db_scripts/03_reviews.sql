@@ -348,4 +348,24 @@ VALUES
     (
         20,
         'https://cdn.pixabay.com/photo/2021/12/16/09/03/alaska-6874179_1280.jpg'
-    );
\ No newline at end of file
+    );
+
+-- Seeds bypass the application, so derive the denormalized review stats once here.
+UPDATE
+    records AS r
+SET
+    reviews_count = s.reviews_count,
+    rating_sum = s.rating_sum
+FROM
+    (
+        SELECT
+            record_id,
+            COUNT(*) AS reviews_count,
+            SUM(rating) AS rating_sum
+        FROM
+            reviews
+        GROUP BY
+            record_id
+    ) AS s
+WHERE
+    s.record_id = r.id;
@@ -0,0 +1,4 @@
+-- The rollups are created empty in 01_tables.sql; populate them once the sample data is loaded.
+REFRESH MATERIALIZED VIEW rent_stats_by_segment;
+
+REFRESH MATERIALIZED VIEW rent_stats_monthly;
@@ -0,0 +1,7 @@
+-- record_facet_counts is created empty in 01_tables.sql; fill it from the sample records, which
+-- are inserted directly and so skip the repository's incremental upkeep.
+INSERT INTO record_facet_counts (country, city, housing_type, records_count)
+SELECT country, city, housing_type, COUNT(*)
+FROM records
+WHERE deleted_at IS NULL
+GROUP BY country, city, housing_type;
@@ -1,14 +1,28 @@
+from collections.abc import Collection
 from typing import Protocol
 
 from app.features.comments.domain.exceptions import InvalidPaginationError
 from app.features.comments.domain.models import Comment, SavedRecord
-from app.shared.domain.pagination import PageOutOfRangeError, PaginatedResult
+from app.shared.domain.pagination import (
+    CountMode,
+    PageOutOfRangeError,
+    PaginatedResult,
+    window_size,
+)
 
 
 class CommentsRepository(Protocol):
     def create(self, review_id: int, body: str) -> Comment: ...
 
-    def list(self, review_id: int, limit: int, offset: int) -> tuple[list[Comment], int]: ...
+    def list(
+        self,
+        review_id: int,
+        limit: int,
+        offset: int,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[Comment], int | None]: ...
+
+    def count_by_review_ids(self, review_ids: Collection[int]) -> dict[int, int]: ...
 
     def update(self, comment_id: int, review_id: int, body: str) -> Comment: ...
 
@@ -18,7 +32,11 @@ class CommentsRepository(Protocol):
 class SavedRecordsRepository(Protocol):
     def save(self, record_id: int) -> tuple[SavedRecord, bool]: ...
 
-    def list(self, limit: int, offset: int) -> tuple[list[SavedRecord], int]: ...
+    def list(
+        self, limit: int, offset: int, count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[list[SavedRecord], int | None]: ...
+
+    def saved_record_ids(self, record_ids: Collection[int]) -> set[int]: ...
 
     def delete(self, record_id: int) -> bool: ...
 
@@ -31,7 +49,12 @@ class CommentsService:
         return self._repository.create(review_id=review_id, body=body)
 
     def list_comments(
-        self, review_id: int, *, page: int = 1, page_size: int = 20
+        self,
+        review_id: int,
+        *,
+        page: int = 1,
+        page_size: int = 20,
+        count_mode: CountMode = CountMode.EXACT,
     ) -> PaginatedResult[Comment]:
         if page < 1:
             raise InvalidPaginationError("page must be at least 1")
@@ -39,22 +62,30 @@ class CommentsService:
             raise InvalidPaginationError("page_size must be between 1 and 100")
 
         offset = (page - 1) * page_size
-        items, total = self._repository.list(review_id=review_id, limit=page_size, offset=offset)
+        window, total = self._repository.list(
+            review_id=review_id,
+            limit=window_size(page_size, count_mode),
+            offset=offset,
+            count_mode=count_mode,
+        )
+        result = PaginatedResult.from_window(
+            window, total=total, page=page, page_size=page_size, count_mode=count_mode
+        )
 
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        if total == 0 and page > 1:
+        if count_mode is CountMode.EXACT:
+            total_pages = result.total_pages or 0
+            if result.total == 0 and page > 1:
+                raise PageOutOfRangeError(
+                    "No hay comentarios disponibles para la página solicitada"
+                )
+            if total_pages > 0 and page > total_pages:
+                raise PageOutOfRangeError(
+                    f"La página solicitada {page} excede el total de páginas {total_pages}"
+                )
+        elif not result.items and page > 1:
             raise PageOutOfRangeError("No hay comentarios disponibles para la página solicitada")
-        if total_pages > 0 and page > total_pages:
-            raise PageOutOfRangeError(
-                f"La página solicitada {page} excede el total de páginas {total_pages}"
-            )
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-        )
+
+        return result
 
     def update_comment(self, comment_id: int, review_id: int, body: str) -> Comment:
         return self._repository.update(comment_id=comment_id, review_id=review_id, body=body)
@@ -70,29 +101,34 @@ class SavedRecordsService:
     def save_record(self, record_id: int) -> tuple[SavedRecord, bool]:
         return self._repository.save(record_id=record_id)
 
-    def list_saved(self, *, page: int = 1, page_size: int = 50) -> PaginatedResult[SavedRecord]:
+    def list_saved(
+        self, *, page: int = 1, page_size: int = 50, count_mode: CountMode = CountMode.EXACT
+    ) -> PaginatedResult[SavedRecord]:
         if page < 1:
             raise InvalidPaginationError("page must be at least 1")
         if page_size <= 0 or page_size > 200:
             raise InvalidPaginationError("page_size must be between 1 and 200")
 
         offset = (page - 1) * page_size
-        items, total = self._repository.list(limit=page_size, offset=offset)
+        window, total = self._repository.list(
+            limit=window_size(page_size, count_mode), offset=offset, count_mode=count_mode
+        )
+        result = PaginatedResult.from_window(
+            window, total=total, page=page, page_size=page_size, count_mode=count_mode
+        )
 
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        if total == 0 and page > 1:
+        if count_mode is CountMode.EXACT:
+            total_pages = result.total_pages or 0
+            if result.total == 0 and page > 1:
+                raise PageOutOfRangeError("No hay registros guardados para la página solicitada")
+            if total_pages > 0 and page > total_pages:
+                raise PageOutOfRangeError(
+                    f"La página solicitada {page} excede el total de páginas {total_pages}"
+                )
+        elif not result.items and page > 1:
             raise PageOutOfRangeError("No hay registros guardados para la página solicitada")
-        if total_pages > 0 and page > total_pages:
-            raise PageOutOfRangeError(
-                f"La página solicitada {page} excede el total de páginas {total_pages}"
-            )
-
-        return PaginatedResult(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
-        )
+
+        return result
 
     def remove_saved_record(self, record_id: int) -> bool:
         return self._repository.delete(record_id=record_id)
@@ -3,6 +3,7 @@ from fastapi import (
     Depends,
     HTTPException,
     Query,
+    Request,
     Response,
     status,
 )
@@ -31,7 +32,13 @@ from app.features.comments.infrastructure.repository import (
     SqlAlchemyCommentsRepository,
     SqlAlchemySavedRecordsRepository,
 )
-from app.shared.domain.pagination import PageOutOfRangeError
+from app.shared.domain.pagination import CountMode, PageOutOfRangeError
+from app.shared.infrastructure.conditional import (
+    is_not_modified,
+    not_modified_response,
+    page_validators,
+    with_validators,
+)
 from app.shared.infrastructure.database import get_db
 from app.shared.infrastructure.pagination import PaginationMeta
 
@@ -73,15 +80,21 @@ def create_comment(
 @comments_router.get("", response_model=PaginatedCommentsResponse)
 def list_comments(
     review_id: int,
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
+    count: CountMode = Query(
+        default=CountMode.EXACT,
+        description="Cálculo de `total`: exacto, estimado por el planificador o ninguno",
+    ),
     service: CommentsService = Depends(get_comments_service),
-) -> PaginatedCommentsResponse:
+) -> Response:
     try:
         result = service.list_comments(
             review_id=review_id,
             page=page,
             page_size=page_size,
+            count_mode=count,
         )
     except PageOutOfRangeError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
@@ -90,15 +103,19 @@ def list_comments(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
         ) from exc
     comments = [CommentResponse.model_validate(comment) for comment in result.items]
-    return PaginatedCommentsResponse(
+    response = PaginatedCommentsResponse(
         items=comments,
-        meta=PaginationMeta(
-            page=result.page,
-            page_size=result.page_size,
-            total=result.total,
-            total_pages=result.total_pages,
-        ),
+        meta=PaginationMeta.from_result(result),
+    )
+    validators = page_validators(
+        "comments",
+        [(item.id, item.updated_at) for item in response.items],
+        review_id,
+        response.meta.model_dump(),
     )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    return with_validators(response, validators)
 
 
 @comments_router.put(
@@ -163,10 +180,14 @@ def save_record(
 def list_saved_records(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=50, ge=1, le=200),
+    count: CountMode = Query(
+        default=CountMode.EXACT,
+        description="Cálculo de `total`: exacto, estimado por el planificador o ninguno",
+    ),
     service: SavedRecordsService = Depends(get_saved_records_service),
 ) -> PaginatedSavedRecordsResponse:
     try:
-        result = service.list_saved(page=page, page_size=page_size)
+        result = service.list_saved(page=page, page_size=page_size, count_mode=count)
     except PageOutOfRangeError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
     except InvalidPaginationError as exc:
@@ -178,12 +199,7 @@ def list_saved_records(
     ]
     return PaginatedSavedRecordsResponse(
         items=saved_records,
-        meta=PaginationMeta(
-            page=result.page,
-            page_size=result.page_size,
-            total=result.total,
-            total_pages=result.total_pages,
-        ),
+        meta=PaginationMeta.from_result(result),
     )
 
 
@@ -1,3 +1,5 @@
+from collections.abc import Collection
+
 from sqlalchemy import text
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
@@ -9,6 +11,8 @@ from app.features.comments.domain.exceptions import (
     ReviewNotFoundError,
 )
 from app.features.comments.domain.models import Comment, SavedRecord
+from app.shared.domain.pagination import CountMode
+from app.shared.infrastructure.counting import estimate_rows
 
 
 def _is_foreign_key_violation(exc: IntegrityError) -> bool:
@@ -21,16 +25,24 @@ class SqlAlchemyCommentsRepository(CommentsRepository):
         self._session = session
 
     def create(self, review_id: int, body: str) -> Comment:
+        # Inserting from the join makes a review of a soft-deleted record look missing; the FK
+        # still catches a review deleted concurrently.
         stmt = text(
             """
             INSERT INTO comments (review_id, body)
-            VALUES (:review_id, :body)
+            SELECT reviews.id, :body
+            FROM reviews
+            JOIN records ON records.id = reviews.record_id
+            WHERE reviews.id = :review_id AND records.deleted_at IS NULL
             RETURNING id, review_id, body, created_at, updated_at
             """
         )
         try:
             result = self._session.execute(stmt, {"review_id": review_id, "body": body})
-            row = result.mappings().one()
+            row = result.mappings().first()
+            if row is None:
+                self._session.rollback()
+                raise ReviewNotFoundError(f"Review {review_id} not found")
             self._session.commit()
             return Comment(**row)
         except IntegrityError as exc:
@@ -39,13 +51,23 @@ class SqlAlchemyCommentsRepository(CommentsRepository):
                 raise ReviewNotFoundError(f"Review {review_id} not found") from exc
             raise
 
-    def list(self, review_id: int, limit: int, offset: int) -> tuple[list[Comment], int]:
+    def list(
+        self,
+        review_id: int,
+        limit: int,
+        offset: int,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[Comment], int | None]:
+        # Comments on reviews of a soft-deleted record stay until the purge job removes them.
         stmt = text(
             """
-            SELECT id, review_id, body, created_at, updated_at
+            SELECT comments.id, comments.review_id, comments.body,
+                   comments.created_at, comments.updated_at
             FROM comments
-            WHERE review_id = :review_id
-            ORDER BY created_at DESC
+            JOIN reviews ON reviews.id = comments.review_id
+            JOIN records ON records.id = reviews.record_id
+            WHERE comments.review_id = :review_id AND records.deleted_at IS NULL
+            ORDER BY comments.created_at DESC
             LIMIT :limit OFFSET :offset
             """
         )
@@ -54,11 +76,27 @@ class SqlAlchemyCommentsRepository(CommentsRepository):
         )
         items = [Comment(**row) for row in result.mappings().all()]
 
+        if count_mode is CountMode.NONE:
+            return items, None
+        if count_mode is CountMode.ESTIMATED:
+            rows_stmt = text(
+                """
+                SELECT comments.id
+                FROM comments
+                JOIN reviews ON reviews.id = comments.review_id
+                JOIN records ON records.id = reviews.record_id
+                WHERE comments.review_id = :review_id AND records.deleted_at IS NULL
+                """
+            )
+            return items, estimate_rows(self._session, rows_stmt, {"review_id": review_id})
+
         total_stmt = text(
             """
             SELECT COUNT(*) AS total
             FROM comments
-            WHERE review_id = :review_id
+            JOIN reviews ON reviews.id = comments.review_id
+            JOIN records ON records.id = reviews.record_id
+            WHERE comments.review_id = :review_id AND records.deleted_at IS NULL
             """
         )
         total_result = self._session.execute(total_stmt, {"review_id": review_id}).scalar()
@@ -66,13 +104,33 @@ class SqlAlchemyCommentsRepository(CommentsRepository):
 
         return items, total
 
+    def count_by_review_ids(self, review_ids: Collection[int]) -> dict[int, int]:
+        if not review_ids:
+            return {}
+        stmt = text(
+            """
+            SELECT review_id, COUNT(*) AS total
+            FROM comments
+            WHERE review_id = ANY(:review_ids)
+            GROUP BY review_id
+            """
+        )
+        result = self._session.execute(stmt, {"review_ids": list(review_ids)})
+        return {row["review_id"]: int(row["total"]) for row in result.mappings().all()}
+
     def update(self, comment_id: int, review_id: int, body: str) -> Comment:
         stmt = text(
             """
             UPDATE comments
             SET body = :body, updated_at = CURRENT_TIMESTAMP
-            WHERE id = :comment_id AND review_id = :review_id
-            RETURNING id, review_id, body, created_at, updated_at
+            FROM reviews
+            JOIN records ON records.id = reviews.record_id
+            WHERE comments.id = :comment_id
+              AND comments.review_id = :review_id
+              AND reviews.id = comments.review_id
+              AND records.deleted_at IS NULL
+            RETURNING comments.id, comments.review_id, comments.body,
+                      comments.created_at, comments.updated_at
             """
         )
         result = self._session.execute(
@@ -90,8 +148,13 @@ class SqlAlchemyCommentsRepository(CommentsRepository):
         stmt = text(
             """
             DELETE FROM comments
-            WHERE id = :comment_id AND review_id = :review_id
-            RETURNING id
+            USING reviews
+            JOIN records ON records.id = reviews.record_id
+            WHERE comments.id = :comment_id
+              AND comments.review_id = :review_id
+              AND reviews.id = comments.review_id
+              AND records.deleted_at IS NULL
+            RETURNING comments.id
             """
         )
         result = self._session.execute(stmt, {"comment_id": comment_id, "review_id": review_id})
@@ -104,10 +167,12 @@ class SqlAlchemySavedRecordsRepository(SavedRecordsRepository):
         self._session = session
 
     def save(self, record_id: int) -> tuple[SavedRecord, bool]:
+        # A soft-deleted record inserts nothing and has no live saved row, so it reads as
+        # missing; the FK still catches a record purged concurrently.
         insert_stmt = text(
             """
             INSERT INTO saved_records (record_id)
-            VALUES (:record_id)
+            SELECT id FROM records WHERE id = :record_id AND deleted_at IS NULL
             ON CONFLICT (record_id) DO NOTHING
             RETURNING id, record_id, saved_at
             """
@@ -117,13 +182,23 @@ class SqlAlchemySavedRecordsRepository(SavedRecordsRepository):
             row = result.mappings().first()
             created = row is not None
 
-            if not created:
+            if row is None:
                 existing_stmt = text(
-                    "SELECT id, record_id, saved_at FROM saved_records WHERE record_id = :record_id"
+                    """
+                    SELECT saved_records.id, saved_records.record_id, saved_records.saved_at
+                    FROM saved_records
+                    JOIN records ON records.id = saved_records.record_id
+                    WHERE saved_records.record_id = :record_id AND records.deleted_at IS NULL
+                    """
                 )
                 row = (
-                    self._session.execute(existing_stmt, {"record_id": record_id}).mappings().one()
+                    self._session.execute(existing_stmt, {"record_id": record_id})
+                    .mappings()
+                    .first()
                 )
+                if row is None:
+                    self._session.rollback()
+                    raise RecordNotFoundError(f"Record {record_id} not found")
 
             self._session.commit()
             return SavedRecord(**row), created
@@ -133,26 +208,74 @@ class SqlAlchemySavedRecordsRepository(SavedRecordsRepository):
                 raise RecordNotFoundError(f"Record {record_id} not found") from exc
             raise
 
-    def list(self, limit: int, offset: int) -> tuple[list[SavedRecord], int]:
+    def list(
+        self, limit: int, offset: int, count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[list[SavedRecord], int | None]:
+        # Saved rows of soft-deleted records stay until the purge job removes them.
         stmt = text(
             """
-            SELECT id, record_id, saved_at
+            SELECT saved_records.id, saved_records.record_id, saved_records.saved_at
             FROM saved_records
-            ORDER BY saved_at DESC
+            JOIN records ON records.id = saved_records.record_id
+            WHERE records.deleted_at IS NULL
+            ORDER BY saved_records.saved_at DESC
             LIMIT :limit OFFSET :offset
             """
         )
         result = self._session.execute(stmt, {"limit": limit, "offset": offset})
         items = [SavedRecord(**row) for row in result.mappings().all()]
 
-        total_stmt = text("SELECT COUNT(*) AS total FROM saved_records")
+        if count_mode is CountMode.NONE:
+            return items, None
+        if count_mode is CountMode.ESTIMATED:
+            rows_stmt = text(
+                """
+                SELECT saved_records.id
+                FROM saved_records
+                JOIN records ON records.id = saved_records.record_id
+                WHERE records.deleted_at IS NULL
+                """
+            )
+            return items, estimate_rows(self._session, rows_stmt)
+
+        total_stmt = text(
+            """
+            SELECT COUNT(*) AS total
+            FROM saved_records
+            JOIN records ON records.id = saved_records.record_id
+            WHERE records.deleted_at IS NULL
+            """
+        )
         total_result = self._session.execute(total_stmt).scalar()
         total = int(total_result or 0)
 
         return items, total
 
+    def saved_record_ids(self, record_ids: Collection[int]) -> set[int]:
+        if not record_ids:
+            return set()
+        stmt = text(
+            """
+            SELECT saved_records.record_id
+            FROM saved_records
+            JOIN records ON records.id = saved_records.record_id
+            WHERE saved_records.record_id = ANY(:record_ids) AND records.deleted_at IS NULL
+            """
+        )
+        result = self._session.execute(stmt, {"record_ids": list(record_ids)})
+        return {row["record_id"] for row in result.mappings().all()}
+
     def delete(self, record_id: int) -> bool:
-        stmt = text("DELETE FROM saved_records WHERE record_id = :record_id RETURNING id")
+        stmt = text(
+            """
+            DELETE FROM saved_records
+            USING records
+            WHERE saved_records.record_id = :record_id
+              AND records.id = saved_records.record_id
+              AND records.deleted_at IS NULL
+            RETURNING saved_records.id
+            """
+        )
         result = self._session.execute(stmt, {"record_id": record_id})
         self._session.commit()
         return result.first() is not None
@@ -14,6 +14,7 @@ from app.features.comments.infrastructure.repository import (
     SqlAlchemyCommentsRepository,
     SqlAlchemySavedRecordsRepository,
 )
+from app.shared.domain.pagination import CountMode
 
 
 class FakeMappings:
@@ -31,14 +32,14 @@ class FakeMappings:
 
 
 class FakeResult:
-    def __init__(self, rows: list[dict] | None = None, scalar_value: int | None = None) -> None:
+    def __init__(self, rows: list[dict] | None = None, scalar_value: object = None) -> None:
         self._rows = rows or []
         self._scalar = scalar_value
 
     def mappings(self) -> FakeMappings:
         return FakeMappings(self._rows)
 
-    def scalar(self) -> int | None:
+    def scalar(self) -> object:
         return self._scalar
 
     def first(self) -> dict | None:
@@ -49,11 +50,13 @@ class FakeSession:
     def __init__(self, executes: list[object]) -> None:
         self._executes = list(executes)
         self.executed_params: list[dict] = []
+        self.executed_statements: list[object] = []
         self.commit_calls = 0
         self.rollback_calls = 0
 
     def execute(self, stmt, params=None):  # type: ignore[override]
         self.executed_params.append(params or {})
+        self.executed_statements.append(stmt)
         if not self._executes:
             raise AssertionError("No more fake results configured")
         action = self._executes.pop(0)
@@ -110,6 +113,18 @@ def test_create_comment_raises_review_not_found_on_foreign_key_violation() -> No
     assert session.rollback_calls == 1
 
 
+def test_create_comment_raises_review_not_found_when_record_is_deleted() -> None:
+    session = FakeSession([FakeResult(rows=[])])
+    repository = SqlAlchemyCommentsRepository(session)
+
+    with pytest.raises(ReviewNotFoundError):
+        repository.create(review_id=5, body="hidden")
+
+    assert "records.deleted_at IS NULL" in str(session.executed_statements[0])
+    assert session.commit_calls == 0
+    assert session.rollback_calls == 1
+
+
 def test_create_comment_propagates_unexpected_integrity_error() -> None:
     session = FakeSession([_integrity_error("other")])
     repository = SqlAlchemyCommentsRepository(session)
@@ -130,10 +145,53 @@ def test_list_comments_returns_items_and_total() -> None:
 
     assert items == [Comment(**row) for row in rows]
     assert total == 5
+    assert all("records.deleted_at IS NULL" in str(stmt) for stmt in session.executed_statements)
     assert session.executed_params[0] == {"review_id": 7, "limit": 2, "offset": 4}
     assert session.executed_params[1] == {"review_id": 7}
 
 
+def test_count_by_review_ids_groups_in_one_query() -> None:
+    rows = [{"review_id": 1, "total": 3}, {"review_id": 4, "total": 1}]
+    session = FakeSession([FakeResult(rows=rows)])
+    repository = SqlAlchemyCommentsRepository(session)
+
+    counts = repository.count_by_review_ids([1, 2, 4])
+
+    assert counts == {1: 3, 4: 1}
+    assert session.executed_params == [{"review_ids": [1, 2, 4]}]
+
+
+def test_count_by_review_ids_without_ids_skips_query() -> None:
+    session = FakeSession([])
+    repository = SqlAlchemyCommentsRepository(session)
+
+    assert repository.count_by_review_ids([]) == {}
+    assert session.executed_params == []
+
+
+def test_list_comments_skips_count_query_without_count() -> None:
+    rows = [_comment_row(idx=1)]
+    session = FakeSession([FakeResult(rows=rows)])
+    repository = SqlAlchemyCommentsRepository(session)
+
+    items, total = repository.list(review_id=7, limit=3, offset=0, count_mode=CountMode.NONE)
+
+    assert items == [Comment(**row) for row in rows]
+    assert total is None
+    assert len(session.executed_params) == 1
+
+
+def test_list_comments_reads_planner_estimate() -> None:
+    plan = [{"Plan": {"Node Type": "Index Scan", "Plan Rows": 42}}]
+    session = FakeSession([FakeResult(rows=[]), FakeResult(scalar_value=plan)])
+    repository = SqlAlchemyCommentsRepository(session)
+
+    _, total = repository.list(review_id=7, limit=3, offset=0, count_mode=CountMode.ESTIMATED)
+
+    assert total == 42
+    assert session.executed_params[1] == {"review_id": 7}
+
+
 def test_update_comment_updates_and_returns_entity() -> None:
     row = _comment_row(idx=3, review_id=8)
     session = FakeSession([FakeResult(rows=[row])])
@@ -153,6 +211,7 @@ def test_update_comment_raises_when_not_found() -> None:
     with pytest.raises(CommentNotFoundError):
         repository.update(comment_id=1, review_id=2, body="nope")
 
+    assert "records.deleted_at IS NULL" in str(session.executed_statements[0])
     assert session.commit_calls == 0
     assert session.rollback_calls == 1
 
@@ -175,6 +234,7 @@ def test_delete_comment_returns_false_when_missing() -> None:
     removed = repository.delete(comment_id=1, review_id=2)
 
     assert removed is False
+    assert "records.deleted_at IS NULL" in str(session.executed_statements[0])
     assert session.commit_calls == 1
 
 
@@ -216,6 +276,18 @@ def test_save_record_raises_record_not_found_on_foreign_key_violation() -> None:
     assert session.rollback_calls == 1
 
 
+def test_save_record_raises_record_not_found_when_record_is_deleted() -> None:
+    session = FakeSession([FakeResult(rows=[]), FakeResult(rows=[])])
+    repository = SqlAlchemySavedRecordsRepository(session)
+
+    with pytest.raises(RecordNotFoundError):
+        repository.save(record_id=123)
+
+    assert all("deleted_at IS NULL" in str(stmt) for stmt in session.executed_statements)
+    assert session.commit_calls == 0
+    assert session.rollback_calls == 1
+
+
 def test_list_saved_records_returns_items_and_total() -> None:
     rows = [_saved_record_row(idx=1)]
     session = FakeSession([FakeResult(rows=rows), FakeResult(scalar_value=2)])
@@ -227,6 +299,7 @@ def test_list_saved_records_returns_items_and_total() -> None:
     assert total == 2
     assert session.executed_params[0] == {"limit": 10, "offset": 5}
     assert session.executed_params[1] == {}
+    assert all("records.deleted_at IS NULL" in str(stmt) for stmt in session.executed_statements)
 
 
 def test_delete_saved_record_returns_true_when_removed() -> None:
@@ -238,6 +311,7 @@ def test_delete_saved_record_returns_true_when_removed() -> None:
     assert removed is True
     assert session.commit_calls == 1
     assert session.executed_params[0] == {"record_id": 111}
+    assert "records.deleted_at IS NULL" in str(session.executed_statements[0])
 
 
 def test_delete_saved_record_returns_false_when_missing() -> None:
@@ -248,3 +322,14 @@ def test_delete_saved_record_returns_false_when_missing() -> None:
 
     assert removed is False
     assert session.commit_calls == 1
+
+
+def test_saved_record_ids_returns_only_saved_ones() -> None:
+    session = FakeSession([FakeResult(rows=[{"record_id": 7}])])
+    repository = SqlAlchemySavedRecordsRepository(session)
+
+    saved = repository.saved_record_ids([7, 8])
+
+    assert saved == {7}
+    assert session.executed_params[0] == {"record_ids": [7, 8]}
+    assert "records.deleted_at IS NULL" in str(session.executed_statements[0])
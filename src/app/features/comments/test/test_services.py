@@ -1,3 +1,4 @@
+from collections.abc import Collection
 from datetime import datetime
 
 import pytest
@@ -10,7 +11,7 @@ from app.features.comments.application.services import (
 )
 from app.features.comments.domain.exceptions import InvalidPaginationError
 from app.features.comments.domain.models import Comment, SavedRecord
-from app.shared.domain.pagination import PageOutOfRangeError
+from app.shared.domain.pagination import CountMode, PageOutOfRangeError
 
 
 class StubCommentsRepository(CommentsRepository):
@@ -23,16 +24,25 @@ class StubCommentsRepository(CommentsRepository):
         self.update_return: Comment | None = None
         self.delete_return: bool = True
         self.list_items = items or []
-        self.list_total = total
+        self.list_total: int | None = total
 
     def create(self, review_id: int, body: str) -> Comment:
         self.created.append((review_id, body))
         return self.create_return or self.list_items[0]
 
-    def list(self, review_id: int, limit: int, offset: int) -> tuple[list[Comment], int]:
+    def list(
+        self,
+        review_id: int,
+        limit: int,
+        offset: int,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[list[Comment], int | None]:
         self.list_called_with.append({"review_id": review_id, "limit": limit, "offset": offset})
         return self.list_items, self.list_total
 
+    def count_by_review_ids(self, review_ids: Collection[int]) -> dict[int, int]:
+        return {review_id: self.list_total or 0 for review_id in review_ids}
+
     def update(self, comment_id: int, review_id: int, body: str) -> Comment:
         self.updated.append((comment_id, review_id, body))
         return self.update_return or self.list_items[0]
@@ -49,17 +59,22 @@ class StubSavedRecordsRepository(SavedRecordsRepository):
         self.delete_called_with: list[int] = []
         self.save_return: tuple[SavedRecord, bool] | None = None
         self.list_items = items or []
-        self.list_total = total
+        self.list_total: int | None = total
         self.delete_return: bool = True
 
     def save(self, record_id: int) -> tuple[SavedRecord, bool]:
         self.saved.append(record_id)
         return self.save_return or (self.list_items[0], True)
 
-    def list(self, limit: int, offset: int) -> tuple[list[SavedRecord], int]:
+    def list(
+        self, limit: int, offset: int, count_mode: CountMode = CountMode.EXACT
+    ) -> tuple[list[SavedRecord], int | None]:
         self.list_called_with.append({"limit": limit, "offset": offset})
         return self.list_items, self.list_total
 
+    def saved_record_ids(self, record_ids: Collection[int]) -> set[int]:
+        return {item.record_id for item in self.list_items} & set(record_ids)
+
     def delete(self, record_id: int) -> bool:
         self.delete_called_with.append(record_id)
         return self.delete_return
@@ -164,6 +179,29 @@ def test_list_comments_raises_when_page_exceeds_total_pages() -> None:
         service.list_comments(review_id=1, page=5, page_size=1)
 
 
+def test_list_comments_without_count_reports_has_more() -> None:
+    items = [_sample_comment(idx=1), _sample_comment(idx=2), _sample_comment(idx=3)]
+    repo = StubCommentsRepository(items=items)
+    repo.list_total = None
+    service = CommentsService(repo)
+
+    result = service.list_comments(review_id=10, page=1, page_size=2, count_mode=CountMode.NONE)
+
+    assert result.items == items[:2]
+    assert result.has_more is True
+    assert result.total is None
+    assert repo.list_called_with == [{"review_id": 10, "limit": 3, "offset": 0}]
+
+
+def test_list_comments_without_count_raises_on_empty_later_page() -> None:
+    repo = StubCommentsRepository(items=[])
+    repo.list_total = None
+    service = CommentsService(repo)
+
+    with pytest.raises(PageOutOfRangeError):
+        service.list_comments(review_id=1, page=3, page_size=10, count_mode=CountMode.NONE)
+
+
 def test_save_record_delegates_to_repository() -> None:
     saved_record = _sample_saved_record()
     repo = StubSavedRecordsRepository(items=[saved_record])
@@ -235,3 +273,16 @@ def test_list_saved_raises_when_page_exceeds_total_pages() -> None:
         match="La página solicitada 3 excede el total de páginas 2",
     ):
         service.list_saved(page=3, page_size=1)
+
+
+def test_list_saved_with_estimated_count_settles_total_on_last_page() -> None:
+    saved_records = [_sample_saved_record(idx=1)]
+    repo = StubSavedRecordsRepository(items=saved_records, total=40)
+    service = SavedRecordsService(repo)
+
+    result = service.list_saved(page=2, page_size=2, count_mode=CountMode.ESTIMATED)
+
+    assert result.items == saved_records
+    assert result.has_more is False
+    assert result.total == 3
+    assert result.total_pages == 2
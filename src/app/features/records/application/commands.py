@@ -14,6 +14,8 @@ class CreateRecordCommand:
     housing_type: HousingType
     monthly_rent: Decimal
     image_urls: list[str] = field(default_factory=list)
+    latitude: float | None = None
+    longitude: float | None = None
 
 
 @dataclass
@@ -24,3 +26,5 @@ class UpdateRecordCommand:
     housing_type: HousingType | str | None = None
     monthly_rent: Decimal | None = None
     image_urls: list[str] | None = None
+    latitude: float | None = None
+    longitude: float | None = None
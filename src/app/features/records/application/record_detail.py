@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from collections.abc import Collection, Sequence
+from dataclasses import dataclass, field
+from typing import Protocol
+
+from app.features.records.application.services import RecordService
+from app.features.records.domain.models import Record, RecordInclude
+from app.features.reviews.domain.review import Review
+from app.shared.domain.pagination import CountMode
+
+# Newest reviews embedded by ``include=reviews``; the full list stays on /reviews/records/{id}.
+DETAIL_REVIEWS_LIMIT = 20
+
+
+class RecordReviewsReader(Protocol):
+    def list_by_record(
+        self,
+        *,
+        record_id: int,
+        limit: int,
+        offset: int,
+        include_images: bool = True,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[Review], int | None]: ...
+
+
+class ReviewCommentsCounter(Protocol):
+    def count_by_review_ids(self, review_ids: Collection[int]) -> dict[int, int]: ...
+
+
+class SavedRecordsReader(Protocol):
+    def saved_record_ids(self, record_ids: Collection[int]) -> set[int]: ...
+
+
+@dataclass
+class RecordDetail:
+    record: Record
+    reviews: Sequence[Review] | None = None
+    comments_count: dict[int, int] = field(default_factory=dict)
+    saved: bool | None = None
+
+
+class RecordDetailService:
+    """Assemble a record plus its related data with a fixed number of queries.
+
+    Each include adds at most one batched query (two for reviews with their images), no
+    matter how many reviews the record has.
+    """
+
+    def __init__(
+        self,
+        records: RecordService,
+        reviews: RecordReviewsReader,
+        comments: ReviewCommentsCounter,
+        saved_records: SavedRecordsReader,
+    ) -> None:
+        self._records = records
+        self._reviews = reviews
+        self._comments = comments
+        self._saved_records = saved_records
+
+    def get_record_detail(
+        self,
+        record_id: int,
+        include: Collection[RecordInclude],
+        *,
+        include_images: bool = True,
+    ) -> RecordDetail:
+        record = self._records.get_record(record_id, include_images=include_images)
+        detail = RecordDetail(record=record)
+
+        # Comment counts are reported per embedded review, so they imply ``reviews``.
+        if RecordInclude.REVIEWS in include or RecordInclude.COMMENTS_COUNT in include:
+            reviews, _ = self._reviews.list_by_record(
+                record_id=record_id,
+                limit=DETAIL_REVIEWS_LIMIT,
+                offset=0,
+                count_mode=CountMode.NONE,
+            )
+            detail.reviews = reviews
+            if RecordInclude.COMMENTS_COUNT in include and reviews:
+                counts = self._comments.count_by_review_ids(
+                    [review.id for review in reviews if review.id is not None]
+                )
+                detail.comments_count = {
+                    review.id: counts.get(review.id, 0)
+                    for review in reviews
+                    if review.id is not None
+                }
+
+        if RecordInclude.SAVED in include:
+            detail.saved = record_id in self._saved_records.saved_record_ids([record_id])
+
+        return detail
@@ -1,101 +1,159 @@
 from __future__ import annotations
 
-from collections.abc import Iterable
-from decimal import Decimal
+from collections.abc import Iterable, Iterator
+from datetime import UTC, date, datetime
+from decimal import Decimal, InvalidOperation
 
 from app.features.records.application.commands import CreateRecordCommand, UpdateRecordCommand
 from app.features.records.domain import exceptions
-from app.features.records.domain.models import HousingType, PaginatedRecords, Record, RecordImage
+from app.features.records.domain.models import (
+    CursorPaginatedRecords,
+    GeoBounds,
+    HousingType,
+    MonthlyRentStats,
+    NearbyRecord,
+    PaginatedRecords,
+    Record,
+    RecordBatch,
+    RecordChanges,
+    RecordCursor,
+    RecordFacets,
+    RecordFilters,
+    RecordImage,
+    RecordImageMode,
+    RecordImportFailure,
+    RecordImportResult,
+    RecordsInBounds,
+    RecordSort,
+    RentStats,
+    RentStatsFilters,
+    haversine_km,
+)
 from app.features.records.domain.repository import RecordRepository
+from app.shared.domain.cache import CacheBackend
+from app.shared.domain.pagination import CountMode, decode_cursor, encode_cursor, window_size
 
 ALLOWED_IMAGE_EXTENSIONS = (".jpg", ".png")
+IMPORT_CHUNK_SIZE = 1_000
+MAX_BATCH_IDS = 100
+MAX_GEO_RESULTS = 500
+MAX_NEAREST_RESULTS = 100
+# The GiST index orders by planar distance in degrees, which drifts from great-circle distance
+# away from the equator; over-fetch candidates and re-rank them with haversine.
+NEAREST_CANDIDATE_FACTOR = 4
+DEFAULT_TREND_MONTHS = 12
+MAX_TREND_MONTHS = 60
+
+
+def record_cache_key(record_id: int) -> str:
+    return f"record:{record_id}"
+
+
+def _sort_value(record: Record, sort: RecordSort) -> datetime | Decimal | float | int | None:
+    """The record's key in ``sort``, as the repository orders by it."""
+    if sort is RecordSort.NEWEST:
+        return record.created_at
+    if sort in (RecordSort.RENT_ASC, RecordSort.RENT_DESC):
+        return record.monthly_rent
+    if sort is RecordSort.RATING:
+        # Same float division as the ``rating_score`` column, so the keyset compares exactly.
+        return record.average_rating if record.average_rating is not None else 0.0
+    return record.reviews_count
+
+
+def _parse_sort_value(sort: RecordSort, raw: str) -> datetime | Decimal | float | int:
+    if sort is RecordSort.NEWEST:
+        return datetime.fromisoformat(raw)
+    if sort in (RecordSort.RENT_ASC, RecordSort.RENT_DESC):
+        return Decimal(raw)
+    if sort is RecordSort.RATING:
+        return float(raw)
+    return int(raw)
 
 
 class RecordService:
-    def __init__(self, repository: RecordRepository) -> None:
+    def __init__(
+        self, repository: RecordRepository, cache: CacheBackend[Record] | None = None
+    ) -> None:
         self._repository = repository
+        self._cache = cache
 
     def create_record(self, command: CreateRecordCommand) -> Record:
-        housing_type = self._normalize_housing_type(command.housing_type)
-        self._validate_create_command(command, housing_type)
+        return self._repository.create(self._build_record(command))
 
-        record = Record(
-            address=command.address.strip(),
-            country=command.country.strip(),
-            city=command.city.strip(),
-            housing_type=housing_type,
-            monthly_rent=command.monthly_rent,
-            images=[RecordImage(image_url=image.strip()) for image in command.image_urls],
-        )
-
-        return self._repository.create(record)
+    def import_records(
+        self,
+        rows: Iterable[tuple[int, CreateRecordCommand]],
+        *,
+        chunk_size: int = IMPORT_CHUNK_SIZE,
+    ) -> RecordImportResult:
+        """Validate ``(line, command)`` rows like ``create_record`` and persist them in chunks.
+
+        Invalid rows are reported in the result instead of aborting the import; a chunk the
+        database rejects is reported row by row and the remaining chunks still load.
+        """
+        result = RecordImportResult()
+        pending: list[tuple[int, Record]] = []
+        for line, command in rows:
+            try:
+                pending.append((line, self._build_record(command)))
+            except exceptions.RecordError as exc:
+                result.failures.append(RecordImportFailure(line=line, detail=str(exc)))
+            if len(pending) >= chunk_size:
+                self._persist_import_chunk(pending, result)
+                pending = []
+        if pending:
+            self._persist_import_chunk(pending, result)
+        return result
 
     def delete_record(self, record_id: int) -> None:
-        record = self._repository.get(record_id)
-        if record is None:
+        if not self._repository.delete(record_id):
             raise exceptions.RecordNotFoundError(f"Record {record_id} does not exist")
-
-        self._repository.delete(record_id)
-
-    def get_record(self, record_id: int) -> Record:
-        record = self._repository.get(record_id)
+        self._invalidate(record_id)
+
+    def get_record(self, record_id: int, *, include_images: bool = True) -> Record:
+        """Read-through: a cached full record also serves requests that skip images."""
+        key = record_cache_key(record_id)
+        if self._cache is not None:
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+        record = self._repository.get(record_id, include_images=include_images)
         if record is None:
             raise exceptions.RecordNotFoundError(f"Record {record_id} does not exist")
+        if self._cache is not None and include_images:
+            self._cache.set(key, record)
         return record
 
-    def update_record(self, record_id: int, command: UpdateRecordCommand) -> Record:
-        existing_record = self._repository.get(record_id)
-        if existing_record is None:
-            raise exceptions.RecordNotFoundError(f"Record {record_id} does not exist")
-
-        housing_type = (
-            self._normalize_housing_type(command.housing_type)
-            if command.housing_type is not None
-            else existing_record.housing_type
-        )
-
-        address = existing_record.address if command.address is None else command.address.strip()
-        country = existing_record.country if command.country is None else command.country.strip()
-        city = existing_record.city if command.city is None else command.city.strip()
-        monthly_rent = (
-            existing_record.monthly_rent if command.monthly_rent is None else command.monthly_rent
-        )
-
-        self._validate_required_fields(
-            {
-                "address": address,
-                "country": country,
-                "city": city,
-            }
-        )
-
-        if monthly_rent <= Decimal("0"):
-            raise exceptions.InvalidMonthlyRentError("Monthly rent must be greater than zero")
-
-        if not isinstance(housing_type, HousingType):
-            raise exceptions.MissingRequiredFieldError("Housing type is required")
+    def get_record_version(self, record_id: int) -> datetime | None:
+        """``updated_at`` of the record (``None`` if missing), from the cache when possible."""
+        if self._cache is not None:
+            cached = self._cache.get(record_cache_key(record_id))
+            if cached is not None:
+                return cached.updated_at
+        return self._repository.get_updated_at(record_id)
+
+    def get_records(self, record_ids: list[int]) -> RecordBatch:
+        unique_ids = list(dict.fromkeys(record_ids))
+        if not unique_ids:
+            raise exceptions.MissingRequiredFieldError("ids is required")
+        if len(unique_ids) > MAX_BATCH_IDS:
+            raise exceptions.MissingRequiredFieldError(
+                f"At most {MAX_BATCH_IDS} ids can be requested at once"
+            )
 
-        replace_images = command.image_urls is not None
-        images = existing_record.images
-        if replace_images:
-            self._validate_images(command.image_urls or [])
-            images = [RecordImage(image_url=image.strip()) for image in command.image_urls or []]
-
-        updated_record = Record(
-            id=existing_record.id,
-            address=address,
-            country=country,
-            city=city,
-            housing_type=housing_type,
-            monthly_rent=monthly_rent,
-            reviews_count=existing_record.reviews_count,
-            average_rating=existing_record.average_rating,
-            images=images,
-            created_at=existing_record.created_at,
-            updated_at=existing_record.updated_at,
+        found = {record.id: record for record in self._repository.get_many(unique_ids)}
+        return RecordBatch(
+            items=[found[record_id] for record_id in unique_ids if record_id in found],
+            missing_ids=[record_id for record_id in unique_ids if record_id not in found],
         )
 
-        return self._repository.update(updated_record, replace_images=replace_images)
+    def update_record(self, record_id: int, command: UpdateRecordCommand) -> Record:
+        record = self._repository.update(record_id, self._build_changes(command))
+        self._invalidate(record_id)
+        if record is None:
+            raise exceptions.RecordNotFoundError(f"Record {record_id} does not exist")
+        return record
 
     def list_records(
         self,
@@ -104,14 +162,20 @@ class RecordService:
         offset: int = 0,
         page: int = 1,
         page_size: int = 20,
-    ) -> PaginatedRecords | list[Record] | tuple[list[Record], int]:
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        count_mode: CountMode = CountMode.EXACT,
+        sort: RecordSort | None = None,
+    ) -> PaginatedRecords | list[Record] | tuple[list[Record], int | None]:
+        filters = self._normalize_filters(filters)
         if limit is not None:
             if limit <= 0:
                 raise exceptions.MissingRequiredFieldError("limit must be greater than zero")
             if offset < 0:
                 raise exceptions.MissingRequiredFieldError("offset cannot be negative")
 
-            return self._repository.list(limit=limit, offset=offset)
+            return self._repository.list(limit=limit, offset=offset, filters=filters)
 
         if page < 1:
             raise exceptions.MissingRequiredFieldError("page must be at least 1")
@@ -119,23 +183,299 @@ class RecordService:
             raise exceptions.MissingRequiredFieldError("page_size must be between 1 and 100")
 
         offset = (page - 1) * page_size
-        items, total = self._repository.list(limit=page_size, offset=offset)
+        window, total = self._repository.list(
+            limit=window_size(page_size, count_mode),
+            offset=offset,
+            filters=filters,
+            include_images=include_images,
+            image_mode=image_mode,
+            count_mode=count_mode,
+            sort=sort,
+        )
+        result = PaginatedRecords.from_window(
+            window, total=total, page=page, page_size=page_size, count_mode=count_mode
+        )
 
-        total_pages = (total + page_size - 1) // page_size if total > 0 else 0
-        if total == 0 and page > 1:
+        if count_mode is CountMode.EXACT:
+            total_pages = result.total_pages or 0
+            if result.total == 0 and page > 1:
+                raise exceptions.PageOutOfRangeError("No results available for the requested page")
+            if total_pages > 0 and page > total_pages:
+                raise exceptions.PageOutOfRangeError(
+                    f"Requested page {page} exceeds total pages {total_pages}"
+                )
+        elif not result.items and page > 1:
             raise exceptions.PageOutOfRangeError("No results available for the requested page")
-        if total_pages > 0 and page > total_pages:
-            raise exceptions.PageOutOfRangeError(
-                f"Requested page {page} exceeds total pages {total_pages}"
+
+        # Relevance-ordered search pages (search without ``sort``) have no keyset continuation.
+        by_relevance = sort is None and filters is not None and filters.search is not None
+        if result.items and result.has_more and not by_relevance:
+            result.next_cursor = self._encode_cursor(result.items[-1], sort or RecordSort.NEWEST)
+        return result
+
+    def list_records_by_cursor(
+        self,
+        *,
+        cursor: str | None = None,
+        page_size: int = 20,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        sort: RecordSort | None = None,
+    ) -> CursorPaginatedRecords:
+        if page_size <= 0 or page_size > 100:
+            raise exceptions.MissingRequiredFieldError("page_size must be between 1 and 100")
+
+        filters = self._normalize_filters(filters)
+        after = self._decode_cursor(cursor) if cursor else None
+        # The cursor remembers its order; an explicit ``sort`` must agree with it.
+        if after is not None and sort is not None and after.sort is not sort:
+            raise exceptions.InvalidCursorError(
+                f"Cursor was issued for sort={after.sort.value}, not sort={sort.value}"
             )
+        sort = sort or (after.sort if after is not None else RecordSort.NEWEST)
+        # One extra row tells us whether another page exists without a COUNT(*).
+        items = self._repository.list_after(
+            limit=page_size + 1,
+            after=after,
+            filters=filters,
+            include_images=include_images,
+            image_mode=image_mode,
+            sort=sort,
+        )
+
+        next_cursor = None
+        if len(items) > page_size:
+            items = items[:page_size]
+            next_cursor = self._encode_cursor(items[-1], sort)
+
+        return CursorPaginatedRecords(items=items, page_size=page_size, next_cursor=next_cursor)
+
+    def _build_record(self, command: CreateRecordCommand) -> Record:
+        housing_type = self._normalize_housing_type(command.housing_type)
+        self._validate_create_command(command, housing_type)
 
-        return PaginatedRecords(
-            items=items,
-            total=total,
-            page=page,
-            page_size=page_size,
+        return Record(
+            address=command.address.strip(),
+            country=command.country.strip(),
+            city=command.city.strip(),
+            housing_type=housing_type,
+            monthly_rent=command.monthly_rent,
+            latitude=command.latitude,
+            longitude=command.longitude,
+            images=[RecordImage(image_url=image.strip()) for image in command.image_urls],
+        )
+
+    def _build_changes(self, command: UpdateRecordCommand) -> RecordChanges:
+        """Validate only the fields present in ``command``; absent ones stay untouched in SQL."""
+        texts = {
+            name: value.strip()
+            for name, value in (
+                ("address", command.address),
+                ("country", command.country),
+                ("city", command.city),
+            )
+            if value is not None
+        }
+        self._validate_required_fields(texts)
+
+        if command.monthly_rent is not None and command.monthly_rent <= Decimal("0"):
+            raise exceptions.InvalidMonthlyRentError("Monthly rent must be greater than zero")
+
+        housing_type = (
+            self._normalize_housing_type(command.housing_type)
+            if command.housing_type is not None
+            else None
+        )
+        self._validate_coordinates(command.latitude, command.longitude)
+
+        image_urls = None
+        if command.image_urls is not None:
+            self._validate_images(command.image_urls)
+            image_urls = tuple(image.strip() for image in command.image_urls)
+
+        return RecordChanges(
+            address=texts.get("address"),
+            country=texts.get("country"),
+            city=texts.get("city"),
+            housing_type=housing_type,
+            monthly_rent=command.monthly_rent,
+            latitude=command.latitude,
+            longitude=command.longitude,
+            image_urls=image_urls,
+        )
+
+    def _persist_import_chunk(
+        self, chunk: list[tuple[int, Record]], result: RecordImportResult
+    ) -> None:
+        try:
+            self._repository.create_many([record for _, record in chunk])
+        except exceptions.RecordPersistenceError as exc:
+            result.failures.extend(
+                RecordImportFailure(line=line, detail=str(exc)) for line, _ in chunk
+            )
+            return
+        result.imported += len(chunk)
+
+    def _invalidate(self, record_id: int) -> None:
+        if self._cache is not None:
+            self._cache.delete(record_cache_key(record_id))
+
+    def _normalize_rent_filters(self, filters: RentStatsFilters | None) -> RentStatsFilters:
+        if filters is None:
+            return RentStatsFilters()
+        return RentStatsFilters(
+            country=(filters.country or "").strip() or None,
+            city=(filters.city or "").strip() or None,
+            housing_type=filters.housing_type,
+        )
+
+    def _normalize_filters(self, filters: RecordFilters | None) -> RecordFilters | None:
+        if filters is None:
+            return None
+
+        country = filters.country.strip() if filters.country else None
+        city = filters.city.strip() if filters.city else None
+        search = filters.search.strip() if filters.search else None
+        housing_type = (
+            self._normalize_housing_type(filters.housing_type)
+            if filters.housing_type is not None
+            else None
+        )
+
+        for bound in (filters.min_rent, filters.max_rent):
+            if bound is not None and bound < Decimal("0"):
+                raise exceptions.InvalidRecordFilterError("Rent bounds cannot be negative")
+        if (
+            filters.min_rent is not None
+            and filters.max_rent is not None
+            and filters.min_rent > filters.max_rent
+        ):
+            raise exceptions.InvalidRecordFilterError("min_rent cannot be greater than max_rent")
+
+        return RecordFilters(
+            country=country or None,
+            city=city or None,
+            housing_type=housing_type,
+            min_rent=filters.min_rent,
+            max_rent=filters.max_rent,
+            search=search or None,
+        )
+
+    @staticmethod
+    def _encode_cursor(record: Record, sort: RecordSort) -> str | None:
+        value = _sort_value(record, sort)
+        if record.id is None or value is None:
+            return None
+        raw = value.isoformat() if isinstance(value, datetime) else str(value)
+        return encode_cursor({"sort": sort.value, "value": raw, "id": record.id})
+
+    @staticmethod
+    def _decode_cursor(cursor: str) -> RecordCursor:
+        try:
+            payload = decode_cursor(cursor)
+            if "created_at" in payload:
+                # Issued before ``sort=`` existed: always the newest-first order.
+                return RecordCursor(
+                    value=datetime.fromisoformat(str(payload["created_at"])),
+                    id=int(payload["id"]),
+                )
+            sort = RecordSort(payload["sort"])
+            return RecordCursor(
+                value=_parse_sort_value(sort, str(payload["value"])),
+                id=int(payload["id"]),
+                sort=sort,
+            )
+        except (KeyError, TypeError, ValueError, InvalidOperation) as exc:
+            raise exceptions.InvalidCursorError("Invalid pagination cursor") from exc
+
+    def list_records_in_bounds(
+        self,
+        bounds: GeoBounds,
+        *,
+        limit: int = MAX_GEO_RESULTS,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> RecordsInBounds:
+        if limit <= 0 or limit > MAX_GEO_RESULTS:
+            raise exceptions.InvalidRecordFilterError(
+                f"limit must be between 1 and {MAX_GEO_RESULTS}"
+            )
+        self._validate_coordinates(bounds.min_latitude, bounds.min_longitude)
+        self._validate_coordinates(bounds.max_latitude, bounds.max_longitude)
+        if bounds.min_latitude > bounds.max_latitude:
+            raise exceptions.InvalidCoordinatesError("min_lat cannot be greater than max_lat")
+
+        filters = self._normalize_filters(filters)
+        items = self._repository.list_in_bounds(
+            bounds, limit=limit + 1, filters=filters, include_images=include_images
+        )
+        return RecordsInBounds(items=items[:limit], truncated=len(items) > limit)
+
+    def list_nearest_records(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        limit: int = 10,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> list[NearbyRecord]:
+        if limit <= 0 or limit > MAX_NEAREST_RESULTS:
+            raise exceptions.InvalidRecordFilterError(
+                f"limit must be between 1 and {MAX_NEAREST_RESULTS}"
+            )
+        self._validate_coordinates(latitude, longitude)
+
+        filters = self._normalize_filters(filters)
+        candidates = self._repository.list_nearest(
+            latitude=latitude,
+            longitude=longitude,
+            limit=limit * NEAREST_CANDIDATE_FACTOR,
+            filters=filters,
+            include_images=include_images,
+        )
+        nearby = [
+            NearbyRecord(
+                record=record,
+                distance_km=haversine_km(latitude, longitude, record.latitude, record.longitude),
+            )
+            for record in candidates
+            if record.latitude is not None and record.longitude is not None
+        ]
+        nearby.sort(key=lambda item: (item.distance_km, item.record.id or 0))
+        return nearby[:limit]
+
+    def get_facets(self, filters: RentStatsFilters | None = None) -> RecordFacets:
+        return self._repository.facet_counts(self._normalize_rent_filters(filters))
+
+    def get_rent_stats(self, filters: RentStatsFilters | None = None) -> list[RentStats]:
+        return self._repository.rent_stats(self._normalize_rent_filters(filters))
+
+    def get_rent_trend(
+        self,
+        filters: RentStatsFilters | None = None,
+        *,
+        months: int = DEFAULT_TREND_MONTHS,
+        today: date | None = None,
+    ) -> list[MonthlyRentStats]:
+        """Monthly percentiles for the last ``months`` calendar months, current one included."""
+        if months <= 0 or months > MAX_TREND_MONTHS:
+            raise exceptions.InvalidRecordFilterError(
+                f"months must be between 1 and {MAX_TREND_MONTHS}"
+            )
+        today = today or datetime.now(UTC).date()
+        first_month = today.year * 12 + today.month - months
+        since = date(first_month // 12, first_month % 12 + 1, 1)
+        return self._repository.monthly_rent_stats(
+            self._normalize_rent_filters(filters), since=since
         )
 
+    def export_records(self, filters: RecordFilters | None = None) -> Iterator[Record]:
+        # Filters are validated here, before the caller starts streaming a response.
+        filters = self._normalize_filters(filters)
+        return self._repository.iter_all(filters=filters)
+
     def _validate_create_command(
         self, command: CreateRecordCommand, housing_type: HousingType
     ) -> None:
@@ -154,6 +494,19 @@ class RecordService:
             raise exceptions.MissingRequiredFieldError("Housing type is required")
 
         self._validate_images(command.image_urls)
+        self._validate_coordinates(command.latitude, command.longitude)
+
+    def _validate_coordinates(self, latitude: float | None, longitude: float | None) -> None:
+        if latitude is None and longitude is None:
+            return
+        if latitude is None or longitude is None:
+            raise exceptions.InvalidCoordinatesError(
+                "latitude and longitude must be provided together"
+            )
+        if not -90 <= latitude <= 90:
+            raise exceptions.InvalidCoordinatesError("latitude must be between -90 and 90")
+        if not -180 <= longitude <= 180:
+            raise exceptions.InvalidCoordinatesError("longitude must be between -180 and 180")
 
     def _normalize_housing_type(self, value: HousingType | str) -> HousingType:
         if isinstance(value, HousingType):
@@ -1,3 +1,4 @@
+from app.shared.domain.pagination import InvalidCursorError as SharedInvalidCursorError
 from app.shared.domain.pagination import PageOutOfRangeError as SharedPageOutOfRangeError
 
 
@@ -21,5 +22,21 @@ class InvalidMonthlyRentError(RecordError):
     """Raised when monthly rent is not a positive amount."""
 
 
+class RecordPersistenceError(RecordError):
+    """Raised when the database rejects a write, e.g. a bulk-import chunk."""
+
+
+class InvalidCoordinatesError(RecordError):
+    """Raised when latitude/longitude are out of range or only one of them is given."""
+
+
+class InvalidRecordFilterError(RecordError):
+    """Raised when listing filters are inconsistent, e.g. ``min_rent`` above ``max_rent``."""
+
+
 class PageOutOfRangeError(SharedPageOutOfRangeError, RecordError):
     """Raised when the requested page is beyond available results."""
+
+
+class InvalidCursorError(SharedInvalidCursorError, RecordError):
+    """Raised when a listing cursor is malformed or was not issued by this API."""
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from enum import Enum
 from typing import TypeAlias
 
-from app.shared.domain.pagination import PaginatedResult
+from app.shared.domain.pagination import CursorPaginatedResult, PaginatedResult
+
+EARTH_RADIUS_KM = 6371.0088
 
 
 class HousingType(str, Enum):
@@ -15,6 +18,31 @@ class HousingType(str, Enum):
     COMERCIAL = "comercial"
 
 
+class RecordInclude(str, Enum):
+    """Related data that ``GET /records/{id}?include=`` can embed in the detail."""
+
+    REVIEWS = "reviews"
+    COMMENTS_COUNT = "comments_count"
+    SAVED = "saved"
+
+
+class RecordSort(str, Enum):
+    """Listing orders; each one is served by an index on ``(sort key, id)``."""
+
+    NEWEST = "newest"
+    RENT_ASC = "rent_asc"
+    RENT_DESC = "rent_desc"
+    RATING = "rating"
+    REVIEWS = "reviews"
+
+
+class RecordImageMode(str, Enum):
+    """How many images a listing loads per record."""
+
+    ALL = "all"
+    COVER = "cover"
+
+
 @dataclass
 class RecordImage:
     image_url: str
@@ -31,10 +59,163 @@ class Record:
     monthly_rent: Decimal
     reviews_count: int = 0
     average_rating: float | None = None
+    latitude: float | None = None
+    longitude: float | None = None
     images: list[RecordImage] = field(default_factory=list)
     id: int | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+    # Total images of the record when ``images`` holds only the cover; ``None`` otherwise.
+    images_count: int | None = None
+
+
+@dataclass(frozen=True)
+class RecordChanges:
+    """Validated partial update: ``None`` leaves a column as is; ``image_urls`` replaces the set."""
+
+    address: str | None = None
+    country: str | None = None
+    city: str | None = None
+    housing_type: HousingType | None = None
+    monthly_rent: Decimal | None = None
+    latitude: float | None = None
+    longitude: float | None = None
+    image_urls: tuple[str, ...] | None = None
+
+
+@dataclass(frozen=True)
+class RecordFilters:
+    """Optional listing criteria; ``None`` means the criterion is not applied."""
+
+    country: str | None = None
+    city: str | None = None
+    housing_type: HousingType | str | None = None
+    min_rent: Decimal | None = None
+    max_rent: Decimal | None = None
+    search: str | None = None
+
+
+@dataclass(frozen=True)
+class RentStatsFilters:
+    """Segment selection for the rent rollups and facet counts; ``None`` matches every value."""
+
+    country: str | None = None
+    city: str | None = None
+    housing_type: HousingType | None = None
+
+
+@dataclass(frozen=True)
+class FacetCount:
+    value: str
+    count: int
+
+
+@dataclass(frozen=True)
+class RecordFacets:
+    """Live records per filter value; each facet applies the other active filters, not its own."""
+
+    country: list[FacetCount]
+    city: list[FacetCount]
+    housing_type: list[FacetCount]
+
+
+@dataclass(frozen=True)
+class RentStats:
+    """Rent percentiles of one country/city/housing_type segment, as of ``refreshed_at``."""
+
+    country: str
+    city: str
+    housing_type: HousingType
+    records_count: int
+    median_rent: Decimal
+    p90_rent: Decimal
+    refreshed_at: datetime
+
+
+@dataclass(frozen=True)
+class MonthlyRentStats(RentStats):
+    """``RentStats`` restricted to the records listed during ``month`` (first day, UTC)."""
+
+    month: date
+
+
+@dataclass(frozen=True)
+class RecordCursor:
+    """Keyset position: the sort key and id of the last row served, ``(value, id)``.
+
+    ``value`` is a ``datetime`` for ``newest``, a ``Decimal`` rent, a ``float`` rating score or
+    an ``int`` reviews count.
+    """
+
+    value: datetime | Decimal | float | int
+    id: int
+    sort: RecordSort = RecordSort.NEWEST
+
+
+@dataclass(frozen=True)
+class GeoBounds:
+    """Map viewport in degrees; ``min_longitude > max_longitude`` crosses the antimeridian."""
+
+    min_latitude: float
+    min_longitude: float
+    max_latitude: float
+    max_longitude: float
+
+    @property
+    def crosses_antimeridian(self) -> bool:
+        return self.min_longitude > self.max_longitude
+
+
+@dataclass
+class RecordsInBounds:
+    """Records inside a viewport; ``truncated`` means more matched than were returned."""
+
+    items: list[Record]
+    truncated: bool = False
+
+
+@dataclass(frozen=True)
+class NearbyRecord:
+    record: Record
+    distance_km: float
+
+
+def haversine_km(
+    latitude: float, longitude: float, other_latitude: float, other_longitude: float
+) -> float:
+    """Great-circle distance between two points given in degrees."""
+    phi1, phi2 = math.radians(latitude), math.radians(other_latitude)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(other_longitude - longitude)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+@dataclass
+class RecordBatch:
+    """Records fetched by id, in request order, plus the ids that do not exist."""
+
+    items: list[Record]
+    missing_ids: list[int] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class RecordImportFailure:
+    """A bulk-import row that was rejected, identified by its 1-based input line."""
+
+    line: int
+    detail: str
+
+
+@dataclass
+class RecordImportResult:
+    imported: int = 0
+    failures: list[RecordImportFailure] = field(default_factory=list)
+
+    def merge(self, other: RecordImportResult) -> None:
+        self.imported += other.imported
+        self.failures.extend(other.failures)
 
 
 PaginatedRecords: TypeAlias = PaginatedResult[Record]
+CursorPaginatedRecords: TypeAlias = CursorPaginatedResult[Record]
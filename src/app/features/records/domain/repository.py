@@ -1,17 +1,89 @@
 from __future__ import annotations
 
+import builtins
+from collections.abc import Iterator
+from datetime import date, datetime
 from typing import Protocol
 
-from app.features.records.domain.models import Record
+from app.features.records.domain.models import (
+    GeoBounds,
+    MonthlyRentStats,
+    Record,
+    RecordChanges,
+    RecordCursor,
+    RecordFacets,
+    RecordFilters,
+    RecordImageMode,
+    RecordSort,
+    RentStats,
+    RentStatsFilters,
+)
+from app.shared.domain.pagination import CountMode
 
 
 class RecordRepository(Protocol):
     def create(self, record: Record) -> Record: ...
 
-    def get(self, record_id: int) -> Record | None: ...
+    def create_many(self, records: list[Record]) -> list[int]: ...
 
-    def delete(self, record_id: int) -> None: ...
+    def get(self, record_id: int, *, include_images: bool = True) -> Record | None: ...
 
-    def list(self, limit: int = 20, offset: int = 0) -> tuple[list[Record], int]: ...
+    def get_updated_at(self, record_id: int) -> datetime | None: ...
 
-    def update(self, record: Record, *, replace_images: bool) -> Record: ...
+    def get_many(self, record_ids: list[int]) -> list[Record]: ...
+
+    def delete(self, record_id: int) -> bool: ...
+
+    def list(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        filters: RecordFilters | None = None,
+        *,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        count_mode: CountMode = CountMode.EXACT,
+        sort: RecordSort | None = None,
+    ) -> tuple[list[Record], int | None]: ...
+
+    def list_after(
+        self,
+        *,
+        limit: int,
+        after: RecordCursor | None = None,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        sort: RecordSort = RecordSort.NEWEST,
+    ) -> builtins.list[Record]: ...
+
+    def list_in_bounds(
+        self,
+        bounds: GeoBounds,
+        *,
+        limit: int,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> builtins.list[Record]: ...
+
+    def list_nearest(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> builtins.list[Record]: ...
+
+    def iter_all(self, *, filters: RecordFilters | None = None) -> Iterator[Record]: ...
+
+    def update(self, record_id: int, changes: RecordChanges) -> Record | None: ...
+
+    def facet_counts(self, filters: RentStatsFilters) -> RecordFacets: ...
+
+    def rent_stats(self, filters: RentStatsFilters) -> builtins.list[RentStats]: ...
+
+    def monthly_rent_stats(
+        self, filters: RentStatsFilters, *, since: date
+    ) -> builtins.list[MonthlyRentStats]: ...
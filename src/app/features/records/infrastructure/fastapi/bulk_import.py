@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import csv
+import json
+import math
+from collections.abc import AsyncIterable, AsyncIterator
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from app.features.records.application.commands import CreateRecordCommand
+from app.features.records.domain.models import HousingType
+from app.shared.infrastructure.export import CSV_LIST_SEPARATOR
+
+CSV_COLUMNS = ("address", "country", "city", "housing_type", "monthly_rent")
+CSV_IMAGE_SEPARATOR = CSV_LIST_SEPARATOR
+
+
+class RowParseError(ValueError):
+    """Raised when a single import line cannot be turned into a command."""
+
+
+class ImportFormatError(ValueError):
+    """Raised when the payload as a whole is unusable, e.g. a CSV without required columns."""
+
+
+async def iter_lines(chunks: AsyncIterable[bytes]) -> AsyncIterator[tuple[int, bytes]]:
+    """Split a byte stream into ``(line_number, raw_line)`` pairs without buffering the body."""
+    buffer = b""
+    line_number = 0
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for raw in lines:
+            line_number += 1
+            yield line_number, raw
+    if buffer:
+        yield line_number + 1, buffer
+
+
+def decode_line(line_number: int, raw: bytes) -> str:
+    try:
+        text = raw.decode("utf-8-sig" if line_number == 1 else "utf-8")
+    except UnicodeDecodeError as exc:
+        raise RowParseError("Line is not valid UTF-8") from exc
+    return text.rstrip("\r")
+
+
+class NdjsonRowParser:
+    """One JSON object per line with the same fields as ``CreateRecordRequest``."""
+
+    def parse(self, line: str) -> CreateRecordCommand | None:
+        if not line.strip():
+            return None
+        try:
+            payload = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise RowParseError(f"Invalid JSON: {exc.msg}") from exc
+        if not isinstance(payload, dict):
+            raise RowParseError("Each line must be a JSON object")
+        images = payload.get("images") or []
+        if not isinstance(images, list) or not all(isinstance(image, str) for image in images):
+            raise RowParseError("images must be a list of strings")
+        return _to_command(payload, images)
+
+
+class CsvRowParser:
+    """Header line first; ``images`` is an optional column of ``|``-separated URLs and
+    ``latitude``/``longitude`` are optional columns.
+
+    Each record must fit on a single physical line.
+    """
+
+    def __init__(self) -> None:
+        self._header: list[str] | None = None
+
+    def parse(self, line: str) -> CreateRecordCommand | None:
+        if not line.strip():
+            return None
+        values = next(csv.reader([line]))
+        if self._header is None:
+            header = [column.strip().lower() for column in values]
+            missing = [column for column in CSV_COLUMNS if column not in header]
+            if missing:
+                raise ImportFormatError(f"CSV header is missing columns: {', '.join(missing)}")
+            self._header = header
+            return None
+        if len(values) != len(self._header):
+            raise RowParseError(f"Expected {len(self._header)} columns, found {len(values)}")
+        payload = dict(zip(self._header, values, strict=True))
+        raw_images = payload.get("images") or ""
+        images = [image for image in raw_images.split(CSV_IMAGE_SEPARATOR) if image.strip()]
+        return _to_command(payload, images)
+
+
+def _to_command(payload: dict[str, Any], images: list[str]) -> CreateRecordCommand:
+    missing = [column for column in CSV_COLUMNS if payload.get(column) in (None, "")]
+    if missing:
+        raise RowParseError(f"Missing fields: {', '.join(missing)}")
+    try:
+        monthly_rent = Decimal(str(payload["monthly_rent"]))
+    except InvalidOperation as exc:
+        raise RowParseError("monthly_rent must be a number") from exc
+    if not monthly_rent.is_finite():
+        raise RowParseError("monthly_rent must be a number")
+    # Mirror the NUMERIC(12, 2) column so one bad row cannot fail its whole chunk.
+    exponent = monthly_rent.as_tuple().exponent
+    if isinstance(exponent, int) and exponent < -2:
+        raise RowParseError("monthly_rent allows at most 2 decimal places")
+    if monthly_rent.adjusted() >= 10:
+        raise RowParseError("monthly_rent allows at most 12 digits")
+    try:
+        housing_type = HousingType(str(payload["housing_type"]).strip().lower())
+    except ValueError as exc:
+        allowed = ", ".join(member.value for member in HousingType)
+        raise RowParseError(f"housing_type must be one of: {allowed}") from exc
+    return CreateRecordCommand(
+        address=str(payload["address"]),
+        country=str(payload["country"]),
+        city=str(payload["city"]),
+        housing_type=housing_type,
+        monthly_rent=monthly_rent,
+        image_urls=images,
+        latitude=_optional_float(payload, "latitude"),
+        longitude=_optional_float(payload, "longitude"),
+    )
+
+
+def _optional_float(payload: dict[str, Any], column: str) -> float | None:
+    value = payload.get(column)
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise RowParseError(f"{column} must be a number")
+    try:
+        number = float(value)
+    except (TypeError, ValueError) as exc:
+        raise RowParseError(f"{column} must be a number") from exc
+    if not math.isfinite(number):
+        raise RowParseError(f"{column} must be a number")
+    return number
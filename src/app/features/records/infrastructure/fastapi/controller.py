@@ -1,25 +1,163 @@
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, Query, status
+from decimal import Decimal
+from typing import Any, cast
+
+from fastapi import Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.orm import Session
 
+from app.features.comments.infrastructure.repository import (
+    SqlAlchemyCommentsRepository,
+    SqlAlchemySavedRecordsRepository,
+)
 from app.features.records.application.commands import CreateRecordCommand, UpdateRecordCommand
-from app.features.records.application.services import RecordService
+from app.features.records.application.record_detail import RecordDetailService
+from app.features.records.application.services import (
+    DEFAULT_TREND_MONTHS,
+    IMPORT_CHUNK_SIZE,
+    MAX_GEO_RESULTS,
+    MAX_NEAREST_RESULTS,
+    MAX_TREND_MONTHS,
+    RecordService,
+)
 from app.features.records.domain import exceptions
+from app.features.records.domain.models import (
+    GeoBounds,
+    HousingType,
+    PaginatedRecords,
+    Record,
+    RecordFilters,
+    RecordImageMode,
+    RecordImportFailure,
+    RecordImportResult,
+    RecordInclude,
+    RecordSort,
+    RentStatsFilters,
+)
+from app.features.records.infrastructure.fastapi.bulk_import import (
+    CSV_IMAGE_SEPARATOR,
+    CsvRowParser,
+    ImportFormatError,
+    NdjsonRowParser,
+    RowParseError,
+    decode_line,
+    iter_lines,
+)
 from app.features.records.infrastructure.fastapi.schemas import (
+    CacheStatsResponse,
     CreateRecordRequest,
+    CursorPaginatedRecordsResponse,
+    NearbyRecordResponse,
+    NearbyRecordsResponse,
     PaginatedRecordsResponse,
-    PaginationMeta,
+    RecordBatchResponse,
+    RecordDetailResponse,
+    RecordFacetsResponse,
+    RecordImportResponse,
     RecordResponse,
+    RecordsInBoundsResponse,
+    RentStatsListResponse,
+    RentTrendResponse,
     UpdateRecordRequest,
 )
 from app.features.records.infrastructure.persistence.repository import SQLAlchemyRecordRepository
+from app.features.records.infrastructure.record_cache import get_record_cache
+from app.features.reviews.infrastructure.repository import SqlAlchemyReviewRepository
+from app.shared.domain.pagination import CountMode
+from app.shared.infrastructure.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    item_validators,
+    not_modified_response,
+    page_validators,
+    with_validators,
+)
 from app.shared.infrastructure.database import get_db
+from app.shared.infrastructure.export import ExportFormat, streaming_export
+from app.shared.infrastructure.fields import (
+    parse_fields,
+    sparse_item_response,
+    sparse_page_response,
+)
+from app.shared.infrastructure.pagination import CursorPaginationMeta, PaginationMeta
+
+CSV_CONTENT_TYPES = ("text/csv", "application/csv")
+RECORD_EXPORT_COLUMNS = (
+    "id",
+    "address",
+    "country",
+    "city",
+    "housing_type",
+    "monthly_rent",
+    "latitude",
+    "longitude",
+    "reviews_count",
+    "average_rating",
+    "images",
+    "created_at",
+    "updated_at",
+)
 
 
 def _get_service(db: Session) -> RecordService:
     repository = SQLAlchemyRecordRepository(db)
-    return RecordService(repository)
+    return RecordService(repository, cache=get_record_cache())
+
+
+def _record_fields(
+    fields: str | None = Query(
+        default=None,
+        description="Campos a devolver separados por coma (`fields=id,city,monthly_rent`)",
+    ),
+) -> frozenset[str] | None:
+    return parse_fields(fields, RecordResponse.model_fields)
+
+
+def _record_include(
+    include: str | None = Query(
+        default=None,
+        description="Datos relacionados a incluir: `reviews`, `comments_count`, `saved`",
+    ),
+) -> frozenset[RecordInclude]:
+    if include is None:
+        return frozenset()
+    requested = {value.strip() for value in include.split(",") if value.strip()}
+    allowed = {option.value for option in RecordInclude}
+    unknown = requested - allowed
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown include: {', '.join(sorted(unknown))}",
+        )
+    return frozenset(RecordInclude(value) for value in requested)
+
+
+def _wants_images(fields: frozenset[str] | None) -> bool:
+    return fields is None or "images" in fields
+
+
+def _record_filters(
+    country: str | None = Query(default=None, min_length=1, description="País exacto"),
+    city: str | None = Query(default=None, min_length=1, description="Ciudad exacta"),
+    housing_type: HousingType | None = Query(default=None, description="Tipo de vivienda"),
+    min_rent: Decimal | None = Query(default=None, ge=0, description="Canon mínimo"),
+    max_rent: Decimal | None = Query(default=None, ge=0, description="Canon máximo"),
+    q: str | None = Query(
+        default=None,
+        min_length=1,
+        max_length=200,
+        description="Búsqueda de texto en dirección, ciudad y país (ignora tildes)",
+    ),
+) -> RecordFilters:
+    return RecordFilters(
+        country=country,
+        city=city,
+        housing_type=housing_type,
+        min_rent=min_rent,
+        max_rent=max_rent,
+        search=q,
+    )
 
 
 async def create_record(
@@ -33,6 +171,8 @@ async def create_record(
         housing_type=payload.housing_type,
         monthly_rent=payload.monthly_rent,
         image_urls=payload.images,
+        latitude=payload.latitude,
+        longitude=payload.longitude,
     )
 
     try:
@@ -43,6 +183,36 @@ async def create_record(
     return RecordResponse.from_domain(record)
 
 
+async def import_records(request: Request, db: Session = Depends(get_db)) -> RecordImportResponse:
+    service = _get_service(db)
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    parser = CsvRowParser() if content_type in CSV_CONTENT_TYPES else NdjsonRowParser()
+
+    result = RecordImportResult()
+    batch: list[tuple[int, CreateRecordCommand]] = []
+    try:
+        async for line_number, raw_line in iter_lines(request.stream()):
+            try:
+                command = parser.parse(decode_line(line_number, raw_line))
+            except RowParseError as exc:
+                result.failures.append(RecordImportFailure(line=line_number, detail=str(exc)))
+                continue
+            if command is not None:
+                batch.append((line_number, command))
+            if len(batch) >= IMPORT_CHUNK_SIZE:
+                result.merge(service.import_records(batch))
+                batch = []
+    except ImportFormatError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(exc)
+        ) from exc
+    if batch:
+        result.merge(service.import_records(batch))
+
+    result.failures.sort(key=lambda failure: failure.line)
+    return RecordImportResponse.from_domain(result)
+
+
 async def delete_record(record_id: int, db: Session = Depends(get_db)) -> None:
     service = _get_service(db)
     try:
@@ -51,13 +221,76 @@ async def delete_record(record_id: int, db: Session = Depends(get_db)) -> None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
 
 
-async def get_record(record_id: int, db: Session = Depends(get_db)) -> RecordResponse:
+async def get_record(
+    record_id: int,
+    request: Request,
+    fields: frozenset[str] | None = Depends(_record_fields),
+    include: frozenset[RecordInclude] = Depends(_record_include),
+    db: Session = Depends(get_db),
+) -> Response:
+    if include:
+        return _get_record_detail(record_id, fields, include, db)
     service = _get_service(db)
+    if has_conditional_headers(request):
+        # Answer revalidations from updated_at alone, before loading the row and its images.
+        validators = item_validators("record", record_id, service.get_record_version(record_id))
+        if validators is not None and is_not_modified(request, validators):
+            return not_modified_response(validators)
     try:
-        record = service.get_record(record_id)
+        record = service.get_record(record_id, include_images=_wants_images(fields))
     except exceptions.RecordNotFoundError as exc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
-    return RecordResponse.from_domain(record)
+    response = RecordResponse.from_domain(record)
+    payload = sparse_item_response(response, fields) if fields is not None else response
+    return with_validators(payload, item_validators("record", record_id, record.updated_at))
+
+
+def _get_record_detail(
+    record_id: int,
+    fields: frozenset[str] | None,
+    include: frozenset[RecordInclude],
+    db: Session,
+) -> JSONResponse:
+    service = RecordDetailService(
+        _get_service(db),
+        reviews=SqlAlchemyReviewRepository(db),
+        comments=SqlAlchemyCommentsRepository(db),
+        saved_records=SqlAlchemySavedRecordsRepository(db),
+    )
+    try:
+        detail = service.get_record_detail(record_id, include, include_images=_wants_images(fields))
+    except exceptions.RecordNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    response = RecordDetailResponse.from_detail(detail)
+    if fields is not None:
+        embedded = response.model_fields_set - set(RecordResponse.model_fields)
+        return sparse_item_response(response, fields | embedded)
+    return JSONResponse(response.model_dump(mode="json", by_alias=True, exclude_unset=True))
+
+
+async def get_records_batch(
+    ids: list[str] = Query(
+        ...,
+        description="Ids separados por coma (`ids=1,2,3`) o repetidos (`ids=1&ids=2`)",
+    ),
+    db: Session = Depends(get_db),
+) -> RecordBatchResponse:
+    try:
+        record_ids = [int(value) for raw in ids for value in raw.split(",") if value.strip()]
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="ids must be integers"
+        ) from exc
+
+    service = _get_service(db)
+    try:
+        batch = service.get_records(record_ids)
+    except exceptions.RecordError as exc:
+        raise _to_http_exception(exc) from exc
+    return RecordBatchResponse(
+        items=[RecordResponse.from_domain(record) for record in batch.items],
+        missing_ids=batch.missing_ids,
+    )
 
 
 async def update_record(
@@ -71,6 +304,8 @@ async def update_record(
         housing_type=payload.housing_type,
         monthly_rent=payload.monthly_rent,
         image_urls=payload.images,
+        latitude=payload.latitude,
+        longitude=payload.longitude,
     )
 
     try:
@@ -84,24 +319,228 @@ async def update_record(
 
 
 async def list_records(
+    request: Request,
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
+    cursor: str | None = Query(
+        default=None,
+        description="Cursor opaco (`meta.nextCursor`); si se envía, se ignora `page`",
+    ),
+    count: CountMode = Query(
+        default=CountMode.EXACT,
+        description="Cálculo de `total`: exacto, estimado por el planificador o ninguno",
+    ),
+    images: RecordImageMode = Query(
+        default=RecordImageMode.ALL,
+        description="`cover`: solo la imagen de portada de cada record más `images_count`",
+    ),
+    sort: RecordSort | None = Query(
+        default=None,
+        description="Orden: `newest` (por defecto; con `q`, relevancia), `rent_asc`, "
+        "`rent_desc`, `rating` o `reviews`",
+    ),
+    filters: RecordFilters = Depends(_record_filters),
+    fields: frozenset[str] | None = Depends(_record_fields),
     db: Session = Depends(get_db),
-) -> PaginatedRecordsResponse:
+) -> Response:
     service = _get_service(db)
+    include_images = _wants_images(fields)
+    response: PaginatedRecordsResponse | CursorPaginatedRecordsResponse
+    if cursor is not None:
+        try:
+            cursor_result = service.list_records_by_cursor(
+                cursor=cursor,
+                page_size=page_size,
+                filters=filters,
+                include_images=include_images,
+                image_mode=images,
+                sort=sort,
+            )
+        except exceptions.RecordError as exc:
+            raise _to_http_exception(exc) from exc
+        response = CursorPaginatedRecordsResponse(
+            items=[RecordResponse.from_domain(record) for record in cursor_result.items],
+            meta=CursorPaginationMeta(
+                page_size=cursor_result.page_size,
+                next_cursor=cursor_result.next_cursor,
+                has_more=cursor_result.has_more,
+            ),
+        )
+    else:
+        try:
+            # Without ``limit`` the service always answers with a page.
+            result = cast(
+                PaginatedRecords,
+                service.list_records(
+                    page=page,
+                    page_size=page_size,
+                    filters=filters,
+                    include_images=include_images,
+                    image_mode=images,
+                    count_mode=count,
+                    sort=sort,
+                ),
+            )
+        except exceptions.RecordError as exc:
+            raise _to_http_exception(exc) from exc
+        response = PaginatedRecordsResponse(
+            items=[RecordResponse.from_domain(record) for record in result.items],
+            meta=PaginationMeta.from_result(result),
+        )
+
+    validators = page_validators(
+        "records",
+        [(item.id, item.updated_at) for item in response.items],
+        response.meta.model_dump(),
+    )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    payload = sparse_page_response(response, fields) if fields is not None else response
+    return with_validators(payload, validators)
+
+
+async def list_records_in_bounds(
+    min_lat: float = Query(..., ge=-90, le=90, description="Latitud sur"),
+    min_lng: float = Query(..., ge=-180, le=180, description="Longitud oeste"),
+    max_lat: float = Query(..., ge=-90, le=90, description="Latitud norte"),
+    max_lng: float = Query(
+        ...,
+        ge=-180,
+        le=180,
+        description="Longitud este; menor que `min_lng` si el área cruza el antimeridiano",
+    ),
+    limit: int = Query(default=200, ge=1, le=MAX_GEO_RESULTS),
+    filters: RecordFilters = Depends(_record_filters),
+    fields: frozenset[str] | None = Depends(_record_fields),
+    db: Session = Depends(get_db),
+) -> RecordsInBoundsResponse | JSONResponse:
+    service = _get_service(db)
+    bounds = GeoBounds(
+        min_latitude=min_lat,
+        min_longitude=min_lng,
+        max_latitude=max_lat,
+        max_longitude=max_lng,
+    )
     try:
-        result = service.list_records(page=page, page_size=page_size)
+        result = service.list_records_in_bounds(
+            bounds, limit=limit, filters=filters, include_images=_wants_images(fields)
+        )
     except exceptions.RecordError as exc:
         raise _to_http_exception(exc) from exc
-    return PaginatedRecordsResponse(
-        items=[RecordResponse.from_domain(record) for record in result.items],
-        meta=PaginationMeta(
-            page=result.page,
-            page_size=result.page_size,
-            total=result.total,
-            total_pages=result.total_pages,
-        ),
+    response = RecordsInBoundsResponse.from_domain(result)
+    if fields is not None:
+        return sparse_page_response(response, fields)
+    return response
+
+
+async def list_nearest_records(
+    lat: float = Query(..., ge=-90, le=90, description="Latitud del punto de referencia"),
+    lng: float = Query(..., ge=-180, le=180, description="Longitud del punto de referencia"),
+    k: int = Query(default=10, ge=1, le=MAX_NEAREST_RESULTS, description="Cantidad de records"),
+    filters: RecordFilters = Depends(_record_filters),
+    fields: frozenset[str] | None = Depends(_record_fields),
+    db: Session = Depends(get_db),
+) -> NearbyRecordsResponse | JSONResponse:
+    service = _get_service(db)
+    try:
+        nearby = service.list_nearest_records(
+            latitude=lat,
+            longitude=lng,
+            limit=k,
+            filters=filters,
+            include_images=_wants_images(fields),
+        )
+    except exceptions.RecordError as exc:
+        raise _to_http_exception(exc) from exc
+    response = NearbyRecordsResponse(
+        items=[NearbyRecordResponse.from_nearby(item) for item in nearby]
+    )
+    if fields is not None:
+        return sparse_page_response(response, fields | {"distance_km"})
+    return response
+
+
+async def get_facets(
+    country: str | None = Query(default=None, min_length=1, description="País exacto"),
+    city: str | None = Query(default=None, min_length=1, description="Ciudad exacta"),
+    housing_type: HousingType | None = Query(default=None, description="Tipo de vivienda"),
+    db: Session = Depends(get_db),
+) -> RecordFacetsResponse:
+    service = _get_service(db)
+    facets = service.get_facets(
+        RentStatsFilters(country=country, city=city, housing_type=housing_type)
+    )
+    return RecordFacetsResponse.from_domain(facets)
+
+
+async def get_rent_stats(
+    country: str | None = Query(default=None, min_length=1, description="País exacto"),
+    city: str | None = Query(default=None, min_length=1, description="Ciudad exacta"),
+    housing_type: HousingType | None = Query(default=None, description="Tipo de vivienda"),
+    db: Session = Depends(get_db),
+) -> RentStatsListResponse:
+    service = _get_service(db)
+    stats = service.get_rent_stats(
+        RentStatsFilters(country=country, city=city, housing_type=housing_type)
     )
+    return RentStatsListResponse.from_domain(stats)
+
+
+async def get_rent_trend(
+    city: str = Query(..., min_length=1, description="Ciudad exacta"),
+    country: str | None = Query(default=None, min_length=1, description="País exacto"),
+    housing_type: HousingType | None = Query(default=None, description="Tipo de vivienda"),
+    months: int = Query(
+        default=DEFAULT_TREND_MONTHS,
+        ge=1,
+        le=MAX_TREND_MONTHS,
+        description="Meses a devolver, incluido el actual",
+    ),
+    db: Session = Depends(get_db),
+) -> RentTrendResponse:
+    service = _get_service(db)
+    try:
+        trend = service.get_rent_trend(
+            RentStatsFilters(country=country, city=city, housing_type=housing_type),
+            months=months,
+        )
+    except exceptions.RecordError as exc:
+        raise _to_http_exception(exc) from exc
+    return RentTrendResponse.from_domain(trend)
+
+
+async def get_cache_stats() -> CacheStatsResponse:
+    return CacheStatsResponse.from_stats(get_record_cache().stats())
+
+
+async def export_records(
+    export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+    filters: RecordFilters = Depends(_record_filters),
+    db: Session = Depends(get_db),
+) -> StreamingResponse:
+    service = _get_service(db)
+    try:
+        records = service.export_records(filters)
+    except exceptions.RecordError as exc:
+        raise _to_http_exception(exc) from exc
+
+    to_row = _record_csv_row if export_format is ExportFormat.CSV else _record_json_row
+    return streaming_export(
+        (to_row(record) for record in records),
+        export_format=export_format,
+        csv_columns=RECORD_EXPORT_COLUMNS,
+        filename="records",
+    )
+
+
+def _record_json_row(record: Record) -> dict[str, Any]:
+    return RecordResponse.from_domain(record).model_dump(mode="json")
+
+
+def _record_csv_row(record: Record) -> dict[str, Any]:
+    row = _record_json_row(record)
+    row["images"] = CSV_IMAGE_SEPARATOR.join(image["image_url"] for image in row["images"])
+    return row
 
 
 def _to_http_exception(error: exceptions.RecordError) -> HTTPException:
@@ -113,6 +552,9 @@ def _to_http_exception(error: exceptions.RecordError) -> HTTPException:
             exceptions.MissingRequiredFieldError,
             exceptions.InvalidImageFormatError,
             exceptions.InvalidMonthlyRentError,
+            exceptions.InvalidCursorError,
+            exceptions.InvalidRecordFilterError,
+            exceptions.InvalidCoordinatesError,
         ),
     ):
         return HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(error))
@@ -1,15 +1,35 @@
 from fastapi import APIRouter, status
+from fastapi.responses import StreamingResponse
 
 from app.features.records.infrastructure.fastapi.controller import (
     create_record,
     delete_record,
+    export_records,
+    get_cache_stats,
+    get_facets,
     get_record,
+    get_records_batch,
+    get_rent_stats,
+    get_rent_trend,
+    import_records,
+    list_nearest_records,
     list_records,
+    list_records_in_bounds,
     update_record,
 )
 from app.features.records.infrastructure.fastapi.schemas import (
+    CacheStatsResponse,
+    CursorPaginatedRecordsResponse,
+    NearbyRecordsResponse,
     PaginatedRecordsResponse,
+    RecordBatchResponse,
+    RecordDetailResponse,
+    RecordFacetsResponse,
+    RecordImportResponse,
     RecordResponse,
+    RecordsInBoundsResponse,
+    RentStatsListResponse,
+    RentTrendResponse,
 )
 
 records_router = APIRouter(prefix="/records", tags=["records"])
@@ -20,14 +40,77 @@ records_router.post(
     status_code=status.HTTP_201_CREATED,
 )(create_record)
 
+records_router.post(
+    "/import",
+    response_model=RecordImportResponse,
+    summary="Importar records en bloque (NDJSON o CSV)",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        }
+    },
+)(import_records)
+
 records_router.get(
     "",
-    response_model=PaginatedRecordsResponse,
+    response_model=PaginatedRecordsResponse | CursorPaginatedRecordsResponse,
 )(list_records)
 
+records_router.get(
+    ":export",
+    response_class=StreamingResponse,
+    summary="Exportar records en streaming (NDJSON o CSV)",
+)(export_records)
+
+records_router.get(
+    ":batch",
+    response_model=RecordBatchResponse,
+    summary="Obtener varios records por id",
+)(get_records_batch)
+
+records_router.get(
+    ":bbox",
+    response_model=RecordsInBoundsResponse,
+    summary="Records dentro de un rectángulo de coordenadas",
+)(list_records_in_bounds)
+
+records_router.get(
+    ":nearest",
+    response_model=NearbyRecordsResponse,
+    summary="Los k records más cercanos a un punto",
+)(list_nearest_records)
+
+records_router.get(
+    ":cache-stats",
+    response_model=CacheStatsResponse,
+    summary="Contadores de la caché de detalle de records (por proceso)",
+)(get_cache_stats)
+
+records_router.get(
+    ":facets",
+    response_model=RecordFacetsResponse,
+    summary="Número de records por país, ciudad y tipo de vivienda",
+)(get_facets)
+
+records_router.get(
+    ":rent-stats",
+    response_model=RentStatsListResponse,
+    summary="Mediana y p90 del canon por país, ciudad y tipo de vivienda",
+)(get_rent_stats)
+
+records_router.get(
+    ":rent-trend",
+    response_model=RentTrendResponse,
+    summary="Serie mensual de mediana y p90 del canon",
+)(get_rent_trend)
+
 records_router.get(
     "/{record_id}",
-    response_model=RecordResponse,
+    response_model=RecordResponse | RecordDetailResponse,
 )(get_record)
 
 records_router.put(
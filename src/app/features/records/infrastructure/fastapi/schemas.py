@@ -1,13 +1,29 @@
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Annotated
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
-from app.features.records.domain.models import HousingType, Record
-from app.shared.infrastructure.pagination import PaginationMeta
+from app.features.records.application.record_detail import RecordDetail
+from app.features.records.domain.models import (
+    FacetCount,
+    HousingType,
+    MonthlyRentStats,
+    NearbyRecord,
+    Record,
+    RecordFacets,
+    RecordImportResult,
+    RecordsInBounds,
+    RentStats,
+)
+from app.features.reviews.application.mappers import to_review_dto
+from app.features.reviews.domain.review import Review
+from app.features.reviews.infrastructure.fastapi.controllers import ReviewResponse
+from app.shared.domain.cache import CacheStats
+from app.shared.infrastructure.pagination import CursorPaginationMeta, PaginationMeta
 
 
 class CreateRecordRequest(BaseModel):
@@ -24,6 +40,8 @@ class CreateRecordRequest(BaseModel):
         Field(..., gt=0, max_digits=12, decimal_places=2, description="Canon mensual"),
     ]
     images: list[str] = Field(default_factory=list, description="URLs de imágenes opcionales")
+    latitude: float | None = Field(default=None, ge=-90, le=90, description="Latitud (grados)")
+    longitude: float | None = Field(default=None, ge=-180, le=180, description="Longitud (grados)")
 
     @field_validator("housing_type", mode="before")
     @classmethod
@@ -39,46 +57,6 @@ class CreateRecordRequest(BaseModel):
         return value or []
 
 
-class UpdateRecordRequest(BaseModel):
-    address: Annotated[str | None, Field(default=None, min_length=1)]
-    country: Annotated[str | None, Field(default=None, min_length=1)]
-    city: Annotated[str | None, Field(default=None, min_length=1)]
-    housing_type: HousingType | None = Field(default=None)
-    monthly_rent: Annotated[
-        Decimal | None,
-        Field(default=None, gt=0, max_digits=12, decimal_places=2),
-    ]
-    images: list[str] | None = Field(default=None, description="URLs de imágenes opcionales")
-
-    @field_validator("housing_type", mode="before")
-    @classmethod
-    def normalize_housing_type(cls, value: HousingType | str | None) -> HousingType | None:
-        if value is None:
-            return None
-        if isinstance(value, HousingType):
-            return value
-        normalized = str(value).strip().lower()
-        return HousingType(normalized)
-
-    @field_validator("images", mode="before")
-    @classmethod
-    def default_images(cls, value: list[str] | None) -> list[str] | None:
-        return value if value is not None else None
-
-    @model_validator(mode="after")
-    def ensure_at_least_one_field(self) -> UpdateRecordRequest:
-        if (
-            self.address is None
-            and self.country is None
-            and self.city is None
-            and self.housing_type is None
-            and self.monthly_rent is None
-            and self.images is None
-        ):
-            raise ValueError("Proporciona al menos un campo para actualizar")
-        return self
-
-
 class UpdateRecordRequest(BaseModel):
     address: Annotated[
         str | None, Field(None, min_length=1, description="Dirección de la vivienda")
@@ -98,6 +76,8 @@ class UpdateRecordRequest(BaseModel):
         default=None,
         description="URLs de imágenes; omite para mantenerlas, envía lista vacía para limpiar",
     )
+    latitude: float | None = Field(None, ge=-90, le=90, description="Latitud (grados)")
+    longitude: float | None = Field(None, ge=-180, le=180, description="Longitud (grados)")
 
     @field_validator("housing_type", mode="before")
     @classmethod
@@ -123,7 +103,10 @@ class RecordResponse(BaseModel):
     monthly_rent: Decimal
     reviews_count: int
     average_rating: float | None = None
+    latitude: float | None = None
+    longitude: float | None = None
     images: list[RecordImageResponse]
+    images_count: int | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
 
@@ -138,6 +121,8 @@ class RecordResponse(BaseModel):
             monthly_rent=record.monthly_rent,
             reviews_count=record.reviews_count,
             average_rating=record.average_rating,
+            latitude=record.latitude,
+            longitude=record.longitude,
             images=[
                 RecordImageResponse(
                     id=image.id,
@@ -146,6 +131,7 @@ class RecordResponse(BaseModel):
                 )
                 for image in record.images
             ],
+            images_count=record.images_count,
             created_at=record.created_at,
             updated_at=record.updated_at,
         )
@@ -156,3 +142,196 @@ class PaginatedRecordsResponse(BaseModel):
     meta: PaginationMeta
 
     model_config = ConfigDict(populate_by_name=True)
+
+
+class CursorPaginatedRecordsResponse(BaseModel):
+    items: list[RecordResponse]
+    meta: CursorPaginationMeta
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+class RecordsInBoundsResponse(BaseModel):
+    items: list[RecordResponse]
+    truncated: bool
+
+    @classmethod
+    def from_domain(cls, result: RecordsInBounds) -> RecordsInBoundsResponse:
+        return cls(
+            items=[RecordResponse.from_domain(record) for record in result.items],
+            truncated=result.truncated,
+        )
+
+
+class NearbyRecordResponse(RecordResponse):
+    distance_km: float
+
+    @classmethod
+    def from_nearby(cls, nearby: NearbyRecord) -> NearbyRecordResponse:
+        response = RecordResponse.from_domain(nearby.record)
+        return cls(**response.model_dump(), distance_km=round(nearby.distance_km, 3))
+
+
+class RecordReviewResponse(ReviewResponse):
+    comments_count: int | None = None
+
+    @classmethod
+    def from_review(cls, review: Review, comments_count: Mapping[int, int]) -> RecordReviewResponse:
+        response = cls.model_validate(to_review_dto(review))
+        if response.id in comments_count:
+            # Assigning marks the field as set, so it survives ``exclude_unset``.
+            response.comments_count = comments_count[response.id]
+        return response
+
+
+class RecordDetailResponse(RecordResponse):
+    """``RecordResponse`` plus whatever ``include=`` asked for; other keys are left unset."""
+
+    reviews: list[RecordReviewResponse] | None = None
+    saved: bool | None = None
+
+    @classmethod
+    def from_detail(cls, detail: RecordDetail) -> RecordDetailResponse:
+        embedded: dict[str, Any] = {}
+        if detail.reviews is not None:
+            embedded["reviews"] = [
+                RecordReviewResponse.from_review(review, detail.comments_count)
+                for review in detail.reviews
+            ]
+        if detail.saved is not None:
+            embedded["saved"] = detail.saved
+        response = RecordResponse.from_domain(detail.record)
+        return cls(**response.model_dump(), **embedded)
+
+
+class NearbyRecordsResponse(BaseModel):
+    items: list[NearbyRecordResponse]
+
+
+class FacetCountResponse(BaseModel):
+    value: str
+    count: int
+
+
+class RecordFacetsResponse(BaseModel):
+    country: list[FacetCountResponse]
+    city: list[FacetCountResponse]
+    housing_type: list[FacetCountResponse]
+
+    @classmethod
+    def from_domain(cls, facets: RecordFacets) -> RecordFacetsResponse:
+        def counts(items: list[FacetCount]) -> list[FacetCountResponse]:
+            return [FacetCountResponse(value=item.value, count=item.count) for item in items]
+
+        return cls(
+            country=counts(facets.country),
+            city=counts(facets.city),
+            housing_type=counts(facets.housing_type),
+        )
+
+
+class RentStatsResponse(BaseModel):
+    country: str
+    city: str
+    housing_type: HousingType
+    records_count: int
+    median_rent: Decimal
+    p90_rent: Decimal
+
+    @classmethod
+    def from_domain(cls, stats: RentStats) -> RentStatsResponse:
+        return cls(
+            country=stats.country,
+            city=stats.city,
+            housing_type=stats.housing_type,
+            records_count=stats.records_count,
+            median_rent=stats.median_rent,
+            p90_rent=stats.p90_rent,
+        )
+
+
+class MonthlyRentStatsResponse(RentStatsResponse):
+    month: date
+
+    @classmethod
+    def from_monthly(cls, stats: MonthlyRentStats) -> MonthlyRentStatsResponse:
+        response = RentStatsResponse.from_domain(stats)
+        return cls(**response.model_dump(), month=stats.month)
+
+
+class RentStatsListResponse(BaseModel):
+    items: list[RentStatsResponse]
+    refreshed_at: datetime | None = Field(
+        default=None, description="Momento del último refresco de las agregaciones"
+    )
+
+    @classmethod
+    def from_domain(cls, stats: list[RentStats]) -> RentStatsListResponse:
+        return cls(
+            items=[RentStatsResponse.from_domain(item) for item in stats],
+            refreshed_at=min((item.refreshed_at for item in stats), default=None),
+        )
+
+
+class RentTrendResponse(BaseModel):
+    items: list[MonthlyRentStatsResponse]
+    refreshed_at: datetime | None = Field(
+        default=None, description="Momento del último refresco de las agregaciones"
+    )
+
+    @classmethod
+    def from_domain(cls, stats: list[MonthlyRentStats]) -> RentTrendResponse:
+        return cls(
+            items=[MonthlyRentStatsResponse.from_monthly(item) for item in stats],
+            refreshed_at=min((item.refreshed_at for item in stats), default=None),
+        )
+
+
+class CacheStatsResponse(BaseModel):
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+    hit_ratio: float | None = None
+
+    @classmethod
+    def from_stats(cls, stats: CacheStats) -> CacheStatsResponse:
+        lookups = stats.hits + stats.misses
+        return cls(
+            hits=stats.hits,
+            misses=stats.misses,
+            evictions=stats.evictions,
+            expirations=stats.expirations,
+            size=stats.size,
+            max_entries=stats.max_entries,
+            hit_ratio=round(stats.hits / lookups, 4) if lookups else None,
+        )
+
+
+class RecordBatchResponse(BaseModel):
+    items: list[RecordResponse]
+    missing_ids: list[int]
+
+
+class RecordImportFailureResponse(BaseModel):
+    line: int
+    detail: str
+
+
+class RecordImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: list[RecordImportFailureResponse]
+
+    @classmethod
+    def from_domain(cls, result: RecordImportResult) -> RecordImportResponse:
+        return cls(
+            imported=result.imported,
+            failed=len(result.failures),
+            errors=[
+                RecordImportFailureResponse(line=failure.line, detail=failure.detail)
+                for failure in result.failures
+            ],
+        )
@@ -0,0 +1,134 @@
+"""Remove soft-deleted records and everything that hangs off them, a small batch at a time.
+
+``DELETE /records/{id}`` only stamps ``records.deleted_at``; the rows it hides are deleted here,
+children first, so no single transaction has to cascade through a popular record's reviews and
+comments. Run it on a schedule (e.g. every few minutes)::
+
+    python -m app.features.records.infrastructure.jobs.purge_deleted_records
+
+Each batch commits on its own, so an interrupted run simply resumes on the next one.
+"""
+
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, TextClause, text
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.database import get_session_factory
+from app.shared.infrastructure.logger import logger
+
+DEFAULT_BATCH_SIZE = 1_000
+
+_PURGE_COMMENTS = text(
+    """
+    DELETE FROM comments
+    WHERE id IN (
+        SELECT id FROM comments
+        WHERE review_id IN (
+            SELECT id FROM reviews
+            WHERE record_id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL)
+        )
+        LIMIT :batch_size
+    )
+    """
+)
+
+_PURGE_REVIEW_IMAGES = text(
+    """
+    DELETE FROM review_images
+    WHERE id IN (
+        SELECT id FROM review_images
+        WHERE review_id IN (
+            SELECT id FROM reviews
+            WHERE record_id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL)
+        )
+        LIMIT :batch_size
+    )
+    """
+)
+
+_PURGE_REVIEWS = text(
+    """
+    DELETE FROM reviews
+    WHERE id IN (
+        SELECT id FROM reviews
+        WHERE record_id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL)
+        LIMIT :batch_size
+    )
+    """
+)
+
+_PURGE_SAVED_RECORDS = text(
+    """
+    DELETE FROM saved_records
+    WHERE id IN (
+        SELECT id FROM saved_records
+        WHERE record_id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL)
+        LIMIT :batch_size
+    )
+    """
+)
+
+_PURGE_RECORD_IMAGES = text(
+    """
+    DELETE FROM record_images
+    WHERE id IN (
+        SELECT id FROM record_images
+        WHERE record_id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL)
+        LIMIT :batch_size
+    )
+    """
+)
+
+_PURGE_RECORDS = text(
+    """
+    DELETE FROM records
+    WHERE id IN (SELECT id FROM records WHERE deleted_at IS NOT NULL LIMIT :batch_size)
+    """
+)
+
+# Children before parents: by the time a parent row goes, its ON DELETE CASCADE finds nothing.
+_PURGE_STEPS: tuple[tuple[str, TextClause], ...] = (
+    ("comments", _PURGE_COMMENTS),
+    ("review_images", _PURGE_REVIEW_IMAGES),
+    ("reviews", _PURGE_REVIEWS),
+    ("saved_records", _PURGE_SAVED_RECORDS),
+    ("record_images", _PURGE_RECORD_IMAGES),
+    ("records", _PURGE_RECORDS),
+)
+
+
+def purge_deleted_records(
+    session: Session, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict[str, int]:
+    """Delete the dependents of soft-deleted records, then the records, committing per batch.
+
+    Returns the number of rows removed from each table.
+    """
+    purged: dict[str, int] = {}
+    for table, stmt in _PURGE_STEPS:
+        purged[table] = 0
+        while True:
+            result = cast(CursorResult[Any], session.execute(stmt, {"batch_size": batch_size}))
+            deleted = result.rowcount
+            session.commit()
+            purged[table] += deleted
+            if deleted < batch_size:
+                break
+    return purged
+
+
+def main() -> None:
+    session = get_session_factory()()
+    try:
+        purged = purge_deleted_records(session)
+    finally:
+        session.close()
+    logger.info(
+        "Deleted records purge finished. %s",
+        " ".join(f"{table}={count}" for table, count in purged.items()),
+    )
+
+
+if __name__ == "__main__":
+    main()
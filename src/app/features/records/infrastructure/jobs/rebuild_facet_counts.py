@@ -0,0 +1,51 @@
+"""Recompute ``record_facet_counts`` from the live records.
+
+The counts are adjusted incrementally by the records repository; rows written outside the
+application (seeds, manual SQL, restores) leave them stale. Run after such writes with::
+
+    python -m app.features.records.infrastructure.jobs.rebuild_facet_counts
+"""
+
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, text
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.database import get_session_factory
+from app.shared.infrastructure.logger import logger
+
+# EXCLUSIVE blocks the repository's upserts (not reads) until the rebuild commits; taking it
+# before the INSERT ... SELECT snapshot means no concurrent create/delete is counted twice or lost.
+_REBUILD_STATEMENTS = (
+    "LOCK TABLE record_facet_counts IN EXCLUSIVE MODE",
+    "DELETE FROM record_facet_counts",
+    """
+    INSERT INTO record_facet_counts (country, city, housing_type, records_count)
+    SELECT country, city, housing_type, COUNT(*)
+    FROM records
+    WHERE deleted_at IS NULL
+    GROUP BY country, city, housing_type
+    """,
+)
+
+
+def rebuild_facet_counts(session: Session) -> int:
+    """Replace every facet count in one transaction; returns the number of segments."""
+    result: CursorResult[Any] | None = None
+    for statement in _REBUILD_STATEMENTS:
+        result = cast(CursorResult[Any], session.execute(text(statement)))
+    session.commit()
+    return result.rowcount if result is not None else 0
+
+
+def main() -> None:
+    session = get_session_factory()()
+    try:
+        segments = rebuild_facet_counts(session)
+    finally:
+        session.close()
+    logger.info("Facet counts rebuild finished. segments=%s", segments)
+
+
+if __name__ == "__main__":
+    main()
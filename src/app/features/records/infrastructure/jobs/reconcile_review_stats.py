@@ -0,0 +1,87 @@
+"""Repair drift between ``records.reviews_count/rating_sum`` and the ``reviews`` table.
+
+The counters are maintained incrementally by the reviews repository; rows written outside
+the application (seeds, manual SQL, restores) can leave them stale. Run periodically with::
+
+    python -m app.features.records.infrastructure.jobs.reconcile_review_stats
+
+The job runs in its own process, so it cannot reach the API workers' in-memory record cache:
+a corrected record keeps its old counters in ``GET /records/{id}`` until its cache entry
+expires (``RECORD_CACHE_TTL_SECONDS``).
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.database import get_session_factory
+from app.shared.infrastructure.logger import logger
+
+DEFAULT_BATCH_SIZE = 5_000
+
+# Review writers update the record row before touching ``reviews``, so once the batch's rows are
+# locked no review change for them can be in flight. The lock must come from an earlier statement:
+# under READ COMMITTED the aggregate below then gets a fresh snapshot that includes every review
+# committed while the lock was awaited, instead of overwriting those increments with a stale sum.
+_LOCK_BATCH = text(
+    """
+    SELECT id
+    FROM records
+    WHERE id > :after_id AND id <= :until_id
+    ORDER BY id
+    FOR NO KEY UPDATE
+    """
+)
+
+_RECONCILE_BATCH = text(
+    """
+    UPDATE records AS r
+    SET reviews_count = COALESCE(s.reviews_count, 0),
+        rating_sum = COALESCE(s.rating_sum, 0)
+    FROM records AS target
+    LEFT JOIN (
+        SELECT record_id, COUNT(*) AS reviews_count, SUM(rating) AS rating_sum
+        FROM reviews
+        WHERE record_id > :after_id AND record_id <= :until_id
+        GROUP BY record_id
+    ) AS s ON s.record_id = target.id
+    WHERE r.id = target.id
+      AND target.id > :after_id AND target.id <= :until_id
+      AND (
+        r.reviews_count <> COALESCE(s.reviews_count, 0)
+        OR r.rating_sum <> COALESCE(s.rating_sum, 0)
+      )
+    RETURNING r.id
+    """
+)
+
+
+def reconcile_review_stats(session: Session, *, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """Recompute review stats in id-range batches, committing each one.
+
+    Returns the number of records whose counters were corrected.
+    """
+    max_id = session.execute(text("SELECT COALESCE(MAX(id), 0) FROM records")).scalar() or 0
+    fixed = 0
+    after_id = 0
+    while after_id < max_id:
+        until_id = after_id + batch_size
+        batch = {"after_id": after_id, "until_id": until_id}
+        session.execute(_LOCK_BATCH, batch)
+        result = session.execute(_RECONCILE_BATCH, batch)
+        fixed += len(result.all())
+        session.commit()
+        after_id = until_id
+    return fixed
+
+
+def main() -> None:
+    session = get_session_factory()()
+    try:
+        fixed = reconcile_review_stats(session)
+    finally:
+        session.close()
+    logger.info("Review stats reconciliation finished. records_fixed=%s", fixed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Rebuild the rent analytics rollups read by ``/records:rent-stats`` and ``/records:rent-trend``.
+
+The materialized views are not maintained on write; run this on a schedule (e.g. hourly cron)::
+
+    python -m app.features.records.infrastructure.jobs.refresh_rent_stats
+
+``CONCURRENTLY`` keeps the views readable while they are rebuilt; it relies on their unique
+indexes.
+"""
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.shared.infrastructure.database import get_session_factory
+from app.shared.infrastructure.logger import logger
+
+RENT_STATS_VIEWS = ("rent_stats_by_segment", "rent_stats_monthly")
+
+
+def refresh_rent_stats(session: Session, *, concurrently: bool = True) -> None:
+    """Refresh every rollup, committing after each one."""
+    mode = "CONCURRENTLY " if concurrently else ""
+    for view in RENT_STATS_VIEWS:
+        session.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{view}"))
+        session.commit()
+
+
+def main() -> None:
+    session = get_session_factory()()
+    try:
+        refresh_rent_stats(session)
+    finally:
+        session.close()
+    logger.info("Rent stats refresh finished. views=%s", ",".join(RENT_STATS_VIEWS))
+
+
+if __name__ == "__main__":
+    main()
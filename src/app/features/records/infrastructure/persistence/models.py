@@ -1,25 +1,45 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
+from typing import Any
 
 from sqlalchemy import (
     BigInteger,
     CheckConstraint,
+    Computed,
+    Date,
     DateTime,
+    Double,
     ForeignKey,
+    Integer,
     Numeric,
     String,
     Text,
     func,
+    text,
 )
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.types import UserDefinedType
+
+# Spanish stemming with accents folded by ``unaccent``; created in records.sql.
+SEARCH_CONFIG = "es_unaccent"
 
 
 class Base(DeclarativeBase):
     pass
 
 
+class Point(UserDefinedType[Any]):
+    """Native PostgreSQL ``point`` (x = longitude, y = latitude); only used in SQL expressions."""
+
+    cache_ok = True
+
+    def get_col_spec(self, **kw: object) -> str:
+        return "POINT"
+
+
 class RecordModel(Base):
     __tablename__ = "records"
     __table_args__ = (
@@ -28,6 +48,11 @@ class RecordModel(Base):
             "housing_type IN ('apartamento','casa','comercial')",
             name="ck_records_housing_type_allowed",
         ),
+        CheckConstraint(
+            "(latitude IS NULL) = (longitude IS NULL)", name="ck_records_coordinates_pair"
+        ),
+        CheckConstraint("latitude BETWEEN -90 AND 90", name="ck_records_latitude_range"),
+        CheckConstraint("longitude BETWEEN -180 AND 180", name="ck_records_longitude_range"),
     )
     __mapper_args__ = {"eager_defaults": True}
 
@@ -37,12 +62,45 @@ class RecordModel(Base):
     city: Mapped[str] = mapped_column(String(80), nullable=False)
     housing_type: Mapped[str] = mapped_column(String(20), nullable=False)
     monthly_rent: Mapped[Decimal] = mapped_column(Numeric(12, 2), nullable=False)
+    latitude: Mapped[float | None] = mapped_column(Double, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Double, nullable=True)
+    # Denormalized review aggregates, kept in sync by the reviews repository on every write.
+    reviews_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    rating_sum: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+    # Sort key for ``sort=rating``: the average rating, 0 without reviews (the API reports null).
+    rating_score: Mapped[float] = mapped_column(
+        Double,
+        Computed(
+            "CASE WHEN reviews_count > 0 "
+            "THEN rating_sum::DOUBLE PRECISION / reviews_count ELSE 0 END",
+            persisted=True,
+        ),
+    )
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
         onupdate=func.now(),
     )
+    # Set by DELETE /records/{id}; the purge job removes the row and its dependents later.
+    deleted_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        Computed(
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(city, '')), 'A') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(country, '')), 'B') || "
+            f"setweight(to_tsvector('{SEARCH_CONFIG}'::regconfig, coalesce(address, '')), 'C')",
+            persisted=True,
+        ),
+        deferred=True,
+    )
+    # GiST-indexed (idx_records_location) for bounding-box and nearest-neighbour lookups.
+    location: Mapped[Any] = mapped_column(
+        Point,
+        Computed("point(longitude, latitude)", persisted=True),
+        nullable=True,
+        deferred=True,
+    )
 
     images: Mapped[list[RecordImageModel]] = relationship(
         "RecordImageModel",
@@ -65,3 +123,43 @@ class RecordImageModel(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
 
     record: Mapped[RecordModel] = relationship("RecordModel", back_populates="images")
+
+
+class RecordFacetCountModel(Base):
+    """Live records per segment, adjusted by the records repository in the same transaction."""
+
+    __tablename__ = "record_facet_counts"
+
+    country: Mapped[str] = mapped_column(String(80), primary_key=True)
+    city: Mapped[str] = mapped_column(String(80), primary_key=True)
+    housing_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    records_count: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default=text("0"))
+
+
+class RentStatsBySegmentModel(Base):
+    """Read-only mapping of the ``rent_stats_by_segment`` materialized view."""
+
+    __tablename__ = "rent_stats_by_segment"
+
+    country: Mapped[str] = mapped_column(String(80), primary_key=True)
+    city: Mapped[str] = mapped_column(String(80), primary_key=True)
+    housing_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    records_count: Mapped[int] = mapped_column(BigInteger)
+    median_rent: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    p90_rent: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
+
+
+class RentStatsMonthlyModel(Base):
+    """Read-only mapping of the ``rent_stats_monthly`` materialized view."""
+
+    __tablename__ = "rent_stats_monthly"
+
+    country: Mapped[str] = mapped_column(String(80), primary_key=True)
+    city: Mapped[str] = mapped_column(String(80), primary_key=True)
+    housing_type: Mapped[str] = mapped_column(String(20), primary_key=True)
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    records_count: Mapped[int] = mapped_column(BigInteger)
+    median_rent: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    p90_rent: Mapped[Decimal] = mapped_column(Numeric(12, 2))
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
@@ -1,13 +1,71 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+import builtins
+from collections import Counter
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime
+from typing import Any
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    cast,
+    func,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    union_all,
+    update,
+)
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, raiseload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 
 from app.features.records.domain import exceptions
-from app.features.records.domain.models import HousingType, Record, RecordImage
+from app.features.records.domain.models import (
+    FacetCount,
+    GeoBounds,
+    HousingType,
+    MonthlyRentStats,
+    Record,
+    RecordChanges,
+    RecordCursor,
+    RecordFacets,
+    RecordFilters,
+    RecordImage,
+    RecordImageMode,
+    RecordSort,
+    RentStats,
+    RentStatsFilters,
+)
 from app.features.records.domain.repository import RecordRepository
-from app.features.records.infrastructure.persistence.models import RecordImageModel, RecordModel
-from app.features.reviews.infrastructure.models import ReviewModel
+from app.features.records.infrastructure.persistence.models import (
+    SEARCH_CONFIG,
+    RecordFacetCountModel,
+    RecordImageModel,
+    RecordModel,
+    RentStatsBySegmentModel,
+    RentStatsMonthlyModel,
+)
+from app.shared.domain.pagination import CountMode
+from app.shared.infrastructure.counting import estimate_rows
+from app.shared.infrastructure.images import replace_images
+
+EXPORT_YIELD_PER = 1_000
+
+# Sort key column and whether it descends; ``id`` breaks ties in the same direction so every
+# order matches one (key, id) index and a keyset cursor is a single row-value comparison.
+_SORT_KEYS: dict[RecordSort, tuple[Any, bool]] = {
+    RecordSort.NEWEST: (RecordModel.created_at, True),
+    RecordSort.RENT_ASC: (RecordModel.monthly_rent, False),
+    RecordSort.RENT_DESC: (RecordModel.monthly_rent, True),
+    RecordSort.RATING: (RecordModel.rating_score, True),
+    RecordSort.REVIEWS: (RecordModel.reviews_count, True),
+}
 
 
 class SQLAlchemyRecordRepository(RecordRepository):
@@ -21,6 +79,8 @@ class SQLAlchemyRecordRepository(RecordRepository):
             city=record.city,
             housing_type=record.housing_type.value,
             monthly_rent=record.monthly_rent,
+            latitude=record.latitude,
+            longitude=record.longitude,
         )
 
         if record.images:
@@ -30,107 +90,539 @@ class SQLAlchemyRecordRepository(RecordRepository):
 
         with self._session.begin():
             self._session.add(record_model)
+            self._adjust_facets(Counter([self._segment(record_model)]))
 
         self._session.refresh(record_model)
         return self._to_domain(record_model)
 
-    def get(self, record_id: int) -> Record | None:
+    def create_many(self, records: list[Record]) -> list[int]:
+        if not records:
+            return []
+
+        # Executemany INSERT ... RETURNING is batched by SQLAlchemy into multi-row VALUES
+        # statements; sort_by_parameter_order keeps ids aligned with ``records``.
+        insert_records = insert(RecordModel).returning(RecordModel.id, sort_by_parameter_order=True)
+        try:
+            record_ids = self._session.scalars(
+                insert_records,
+                [
+                    {
+                        "address": record.address,
+                        "country": record.country,
+                        "city": record.city,
+                        "housing_type": record.housing_type.value,
+                        "monthly_rent": record.monthly_rent,
+                        "latitude": record.latitude,
+                        "longitude": record.longitude,
+                    }
+                    for record in records
+                ],
+            ).all()
+            image_rows = [
+                {"record_id": record_id, "image_url": image.image_url}
+                for record_id, record in zip(record_ids, records, strict=True)
+                for image in record.images
+            ]
+            if image_rows:
+                self._session.execute(insert(RecordImageModel), image_rows)
+            self._adjust_facets(
+                Counter(
+                    (record.country, record.city, record.housing_type.value) for record in records
+                )
+            )
+            self._session.commit()
+        except SQLAlchemyError as exc:
+            self._session.rollback()
+            raise exceptions.RecordPersistenceError("Database rejected the record batch") from exc
+
+        return list(record_ids)
+
+    def get(self, record_id: int, *, include_images: bool = True) -> Record | None:
         stmt = (
             select(RecordModel)
-            .options(selectinload(RecordModel.images))
-            .where(RecordModel.id == record_id)
+            .options(self._images_loader(include_images))
+            .where(RecordModel.id == record_id, RecordModel.deleted_at.is_(None))
         )
         record_model = self._session.scalar(stmt)
         if record_model is None:
             return None
-        stats = self._load_review_stats([record_id])
-        return self._to_domain(record_model, stats)
-
-    def delete(self, record_id: int) -> None:
-        record_model = self._session.get(RecordModel, record_id)
-        if record_model is None:
-            return
+        return self._to_domain(record_model, images=None if include_images else ())
 
-        self._session.delete(record_model)
-        self._session.commit()
+    def get_updated_at(self, record_id: int) -> datetime | None:
+        # Version probe for conditional GETs: one narrow row, no images.
+        return self._session.scalar(
+            select(RecordModel.updated_at).where(
+                RecordModel.id == record_id, RecordModel.deleted_at.is_(None)
+            )
+        )
 
-    def list(self, limit: int = 20, offset: int = 0) -> tuple[list[Record], int]:
+    def get_many(self, record_ids: list[int]) -> list[Record]:
+        if not record_ids:
+            return []
+        # Two statements regardless of len(record_ids): the records and one IN (...) for images.
         stmt = (
             select(RecordModel)
             .options(selectinload(RecordModel.images))
-            .order_by(RecordModel.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .where(RecordModel.id.in_(record_ids), RecordModel.deleted_at.is_(None))
         )
+        return [self._to_domain(record_model) for record_model in self._session.scalars(stmt)]
+
+    def delete(self, record_id: int) -> bool:
+        # Soft delete: one indexed row update hides the record at once. Its images, reviews,
+        # comments and saved entries are removed later in small batches by the purge job,
+        # instead of cascading through all of them while this transaction holds the locks.
+        stmt = (
+            update(RecordModel)
+            .where(RecordModel.id == record_id, RecordModel.deleted_at.is_(None))
+            .values(deleted_at=func.now())
+            .returning(RecordModel.country, RecordModel.city, RecordModel.housing_type)
+        )
+        try:
+            deleted = self._session.execute(stmt).one_or_none()
+            if deleted is not None:
+                country, city, housing_type = deleted
+                self._adjust_facets(Counter({(country, city, housing_type): -1}))
+            self._session.commit()
+        except SQLAlchemyError as exc:
+            self._session.rollback()
+            raise exceptions.RecordPersistenceError(
+                f"Database rejected the deletion of record {record_id}"
+            ) from exc
+        return deleted is not None
+
+    def list(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        filters: RecordFilters | None = None,
+        *,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        count_mode: CountMode = CountMode.EXACT,
+        sort: RecordSort | None = None,
+    ) -> tuple[list[Record], int | None]:
+        covers_only = include_images and image_mode is RecordImageMode.COVER
+        load_images = include_images and not covers_only
+        stmt = select(RecordModel).options(self._images_loader(load_images))
+        if sort is None and filters is not None and filters.search is not None:
+            rank = func.ts_rank_cd(RecordModel.search_vector, self._search_query(filters.search))
+            stmt = stmt.order_by(rank.desc(), RecordModel.id.desc())
+        else:
+            stmt = stmt.order_by(*self._sort_order(sort or RecordSort.NEWEST))
+        stmt = self._apply_filters(stmt.limit(limit).offset(offset), filters)
         records = self._session.scalars(stmt).all()
-        stats = self._load_review_stats([record.id for record in records])
+        items = (
+            self._with_covers(records)
+            if covers_only
+            else [
+                self._to_domain(record_model, images=None if load_images else ())
+                for record_model in records
+            ]
+        )
 
-        total_stmt = select(func.count()).select_from(RecordModel)
+        if count_mode is CountMode.NONE:
+            return items, None
+        if count_mode is CountMode.ESTIMATED:
+            return items, estimate_rows(
+                self._session, self._apply_filters(select(RecordModel.id), filters)
+            )
+        total_stmt = self._apply_filters(select(func.count()).select_from(RecordModel), filters)
         total = self._session.scalar(total_stmt) or 0
+        return items, int(total)
 
-        return [self._to_domain(record_model, stats) for record_model in records], int(total)
+    def list_after(
+        self,
+        *,
+        limit: int,
+        after: RecordCursor | None = None,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+        image_mode: RecordImageMode = RecordImageMode.ALL,
+        sort: RecordSort = RecordSort.NEWEST,
+    ) -> builtins.list[Record]:
+        covers_only = include_images and image_mode is RecordImageMode.COVER
+        load_images = include_images and not covers_only
+        stmt = (
+            select(RecordModel)
+            .options(self._images_loader(load_images))
+            .order_by(*self._sort_order(sort))
+            .limit(limit)
+        )
+        stmt = self._apply_filters(stmt, filters)
+        if after is not None:
+            stmt = stmt.where(self._after(sort, after))
+        records = self._session.scalars(stmt).all()
+        if covers_only:
+            return self._with_covers(records)
+        images = None if load_images else ()
+        return [self._to_domain(record_model, images=images) for record_model in records]
 
-    def update(self, record: Record, *, replace_images: bool) -> Record:
-        record_model = self._session.get(RecordModel, record.id)
-        if record_model is None:
-            raise exceptions.RecordNotFoundError(f"Record {record.id} does not exist")
+    def list_in_bounds(
+        self,
+        bounds: GeoBounds,
+        *,
+        limit: int,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> builtins.list[Record]:
+        # No ORDER BY: the scan can stop at ``limit`` instead of sorting every match in the box.
+        stmt = (
+            select(RecordModel)
+            .options(self._images_loader(include_images))
+            .where(self._within_bounds(bounds))
+            .limit(limit)
+        )
+        stmt = self._apply_filters(stmt, filters)
+        records = self._session.scalars(stmt).all()
+        images = None if include_images else ()
+        return [self._to_domain(record_model, images=images) for record_model in records]
 
-        record_model.address = record.address
-        record_model.country = record.country
-        record_model.city = record.city
-        record_model.housing_type = record.housing_type.value
-        record_model.monthly_rent = record.monthly_rent
+    def list_nearest(
+        self,
+        *,
+        latitude: float,
+        longitude: float,
+        limit: int,
+        filters: RecordFilters | None = None,
+        include_images: bool = True,
+    ) -> builtins.list[Record]:
+        # ``<->`` in ORDER BY is answered by a GiST k-NN index scan on idx_records_location.
+        distance = RecordModel.location.op("<->")(func.point(longitude, latitude))
+        stmt = (
+            select(RecordModel)
+            .options(self._images_loader(include_images))
+            .where(RecordModel.location.is_not(None))
+            .order_by(distance, RecordModel.id)
+            .limit(limit)
+        )
+        stmt = self._apply_filters(stmt, filters)
+        records = self._session.scalars(stmt).all()
+        images = None if include_images else ()
+        return [self._to_domain(record_model, images=images) for record_model in records]
 
-        if replace_images:
-            record_model.images.clear()
-            for image in record.images:
-                record_model.images.append(RecordImageModel(image_url=image.image_url))
+    def iter_all(self, *, filters: RecordFilters | None = None) -> Iterator[Record]:
+        # yield_per streams through a server-side cursor; images are selectin-loaded per batch.
+        stmt = (
+            select(RecordModel)
+            .options(selectinload(RecordModel.images))
+            .order_by(RecordModel.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        stmt = self._apply_filters(stmt, filters)
+        for record_model in self._session.scalars(stmt):
+            yield self._to_domain(record_model)
 
-        self._session.commit()
-        self._session.refresh(record_model)
-        stats = self._load_review_stats([record_model.id])
-        return self._to_domain(record_model, stats)
+    def update(self, record_id: int, changes: RecordChanges) -> Record | None:
+        # UPDATE ... RETURNING replaces the get/flush/refresh round trips: one statement for
+        # the row and one for its images (read, or replaced when ``image_urls`` is given). Only a
+        # move to another country/city/housing type adds a third, the facet count upsert.
+        values: dict[str, Any] = {
+            column: value
+            for column, value in (
+                ("address", changes.address),
+                ("country", changes.country),
+                ("city", changes.city),
+                ("monthly_rent", changes.monthly_rent),
+                ("latitude", changes.latitude),
+                ("longitude", changes.longitude),
+            )
+            if value is not None
+        }
+        if changes.housing_type is not None:
+            values["housing_type"] = changes.housing_type.value
+        values["updated_at"] = func.now()
 
-    def _load_review_stats(self, record_ids: list[int]) -> dict[int, tuple[int, float | None]]:
-        if not record_ids:
-            return {}
+        stmt = (
+            update(RecordModel)
+            .where(RecordModel.id == record_id, RecordModel.deleted_at.is_(None))
+            .values(**values)
+            .execution_options(populate_existing=True)
+        )
+        touches_segment = bool(values.keys() & {"country", "city", "housing_type"})
+        if touches_segment:
+            # The old segment is locked and read by the UPDATE itself, so its facet count can
+            # move with the record without a separate SELECT ... FOR UPDATE.
+            previous = (
+                select(
+                    RecordModel.id,
+                    RecordModel.country.label("previous_country"),
+                    RecordModel.city.label("previous_city"),
+                    RecordModel.housing_type.label("previous_housing_type"),
+                )
+                .where(RecordModel.id == record_id, RecordModel.deleted_at.is_(None))
+                .with_for_update()
+                .cte("previous")
+            )
+            stmt = stmt.where(RecordModel.id == previous.c.id).returning(
+                RecordModel,
+                previous.c.previous_country,
+                previous.c.previous_city,
+                previous.c.previous_housing_type,
+            )
+        else:
+            stmt = stmt.returning(RecordModel)
+        try:
+            row = self._session.execute(stmt).one_or_none()
+            if row is None:
+                self._session.rollback()
+                return None
+            record_model: RecordModel = row[0]
+            if touches_segment:
+                # Sent-but-unchanged segment fields cancel out to a zero delta, which is skipped.
+                deltas: Counter[tuple[str, str, str]] = Counter()
+                deltas[(row[1], row[2], row[3])] -= 1
+                deltas[self._segment(record_model)] += 1
+                self._adjust_facets(deltas)
+
+            if changes.image_urls is None:
+                images = self._session.scalars(
+                    select(RecordImageModel)
+                    .where(RecordImageModel.record_id == record_id)
+                    .order_by(RecordImageModel.id)
+                ).all()
+            else:
+                images = replace_images(
+                    self._session, RecordImageModel, "record_id", record_id, changes.image_urls
+                )
+            record = self._to_domain(record_model, images=images)
+            self._session.commit()
+        except SQLAlchemyError as exc:
+            self._session.rollback()
+            raise exceptions.RecordPersistenceError(
+                f"Database rejected the update of record {record_id}"
+            ) from exc
+        return record
+
+    def facet_counts(self, filters: RentStatsFilters) -> RecordFacets:
+        # One round trip over the small record_facet_counts table: a GROUP BY per facet, each
+        # filtered by the other facets' active values, glued with UNION ALL.
+        model = RecordFacetCountModel
+        columns = {"country": model.country, "city": model.city, "housing_type": model.housing_type}
+        active = {
+            "country": filters.country,
+            "city": filters.city,
+            "housing_type": filters.housing_type.value if filters.housing_type else None,
+        }
+        queries = []
+        for facet, column in columns.items():
+            stmt = select(
+                literal(facet).label("facet"),
+                column.label("value"),
+                # Not "count": that name would resolve to Row.count(), the tuple method.
+                func.sum(model.records_count).label("records_count"),
+            ).where(model.records_count > 0)
+            for other, value in active.items():
+                if other != facet and value is not None:
+                    stmt = stmt.where(columns[other] == value)
+            queries.append(stmt.group_by(column))
 
+        counts: dict[str, list[FacetCount]] = {facet: [] for facet in columns}
+        for row in self._session.execute(union_all(*queries)):
+            counts[row.facet].append(FacetCount(value=row.value, count=int(row.records_count)))
+        for facet_counts in counts.values():
+            facet_counts.sort(key=lambda item: (-item.count, item.value))
+        return RecordFacets(**counts)
+
+    def rent_stats(self, filters: RentStatsFilters) -> builtins.list[RentStats]:
+        stmt = self._apply_rent_filters(
+            select(RentStatsBySegmentModel), RentStatsBySegmentModel, filters
+        ).order_by(
+            RentStatsBySegmentModel.country,
+            RentStatsBySegmentModel.city,
+            RentStatsBySegmentModel.housing_type,
+        )
+        return [
+            RentStats(
+                country=row.country,
+                city=row.city,
+                housing_type=HousingType(row.housing_type),
+                records_count=row.records_count,
+                median_rent=row.median_rent,
+                p90_rent=row.p90_rent,
+                refreshed_at=row.refreshed_at,
+            )
+            for row in self._session.scalars(stmt)
+        ]
+
+    def monthly_rent_stats(
+        self, filters: RentStatsFilters, *, since: date
+    ) -> builtins.list[MonthlyRentStats]:
         stmt = (
-            select(
-                ReviewModel.record_id,
-                func.count(ReviewModel.id).label("reviews_count"),
-                func.avg(ReviewModel.rating).label("average_rating"),
+            self._apply_rent_filters(select(RentStatsMonthlyModel), RentStatsMonthlyModel, filters)
+            .where(RentStatsMonthlyModel.month >= since)
+            .order_by(
+                RentStatsMonthlyModel.country,
+                RentStatsMonthlyModel.city,
+                RentStatsMonthlyModel.housing_type,
+                RentStatsMonthlyModel.month,
+            )
+        )
+        return [
+            MonthlyRentStats(
+                country=row.country,
+                city=row.city,
+                housing_type=HousingType(row.housing_type),
+                records_count=row.records_count,
+                median_rent=row.median_rent,
+                p90_rent=row.p90_rent,
+                refreshed_at=row.refreshed_at,
+                month=row.month,
             )
-            .where(ReviewModel.record_id.in_(record_ids))
-            .group_by(ReviewModel.record_id)
+            for row in self._session.scalars(stmt)
+        ]
+
+    def _adjust_facets(self, deltas: Counter[tuple[str, str, str]]) -> None:
+        """Apply per-segment count deltas with one upsert, inside the caller's transaction."""
+        # Sorted keys make concurrent imports lock counter rows in the same order.
+        rows = [
+            {"country": country, "city": city, "housing_type": housing_type, "records_count": delta}
+            for (country, city, housing_type), delta in sorted(deltas.items())
+            if delta
+        ]
+        if not rows:
+            return
+        stmt = pg_insert(RecordFacetCountModel).values(rows)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                RecordFacetCountModel.country,
+                RecordFacetCountModel.city,
+                RecordFacetCountModel.housing_type,
+            ],
+            set_={
+                "records_count": RecordFacetCountModel.records_count + stmt.excluded.records_count
+            },
         )
-        results = self._session.execute(stmt).all()
-        stats: dict[int, tuple[int, float | None]] = {}
-        for row in results:
-            stats[int(row.record_id)] = (
-                int(row.reviews_count),
-                float(row.average_rating) if row.average_rating is not None else None,
+        self._session.execute(stmt)
+
+    @staticmethod
+    def _segment(record_model: RecordModel) -> tuple[str, str, str]:
+        return record_model.country, record_model.city, record_model.housing_type
+
+    def _with_covers(self, record_models: Sequence[RecordModel]) -> builtins.list[Record]:
+        """Attach each record's first image and its image count with one extra query.
+
+        ``DISTINCT ON`` keeps one row per record off idx_record_images_record (record_id, id);
+        the window count is evaluated before it, so the gallery itself is never transferred.
+        """
+        covers: dict[int, tuple[RecordImageModel, int]] = {}
+        if record_models:
+            images_count = func.count().over(partition_by=RecordImageModel.record_id)
+            stmt = (
+                select(RecordImageModel, images_count)
+                .where(RecordImageModel.record_id.in_([model.id for model in record_models]))
+                .distinct(RecordImageModel.record_id)
+                .order_by(RecordImageModel.record_id, RecordImageModel.id)
             )
-        return stats
+            covers = {
+                image.record_id: (image, count) for image, count in self._session.execute(stmt)
+            }
+
+        records = []
+        for record_model in record_models:
+            cover, count = covers.get(record_model.id, (None, 0))
+            record = self._to_domain(record_model, images=[cover] if cover is not None else [])
+            record.images_count = count
+            records.append(record)
+        return records
+
+    @staticmethod
+    def _sort_order(sort: RecordSort) -> tuple[Any, Any]:
+        column, descending = _SORT_KEYS[sort]
+        if descending:
+            return column.desc(), RecordModel.id.desc()
+        return column.asc(), RecordModel.id.asc()
+
+    @staticmethod
+    def _after(sort: RecordSort, cursor: RecordCursor) -> ColumnElement[bool]:
+        # Row-value comparison lets Postgres seek on the sort's (key, id) index.
+        column, descending = _SORT_KEYS[sort]
+        key = tuple_(column, RecordModel.id)
+        position = (cursor.value, cursor.id)
+        return key < position if descending else key > position
+
+    @staticmethod
+    def _images_loader(include_images: bool) -> _AbstractLoad:
+        # Without images the relationship is never loaded: callers map with ``images=()``, and
+        # raiseload turns any stray access into an error instead of a query per record.
+        return selectinload(RecordModel.images) if include_images else raiseload(RecordModel.images)
+
+    @staticmethod
+    def _within_bounds(bounds: GeoBounds) -> ColumnElement[bool]:
+        def box(min_longitude: float, max_longitude: float) -> ColumnElement[bool]:
+            return RecordModel.location.bool_op("<@")(
+                func.box(
+                    func.point(min_longitude, bounds.min_latitude),
+                    func.point(max_longitude, bounds.max_latitude),
+                )
+            )
+
+        if bounds.crosses_antimeridian:
+            return or_(box(bounds.min_longitude, 180.0), box(-180.0, bounds.max_longitude))
+        return box(bounds.min_longitude, bounds.max_longitude)
+
+    @staticmethod
+    def _apply_filters(stmt: Select[Any], filters: RecordFilters | None) -> Select[Any]:
+        # Plain equality predicates so idx_records_country_city / idx_records_housing_type apply.
+        # Soft-deleted records stay hidden from every listing until the purge job removes them.
+        stmt = stmt.where(RecordModel.deleted_at.is_(None))
+        if filters is None:
+            return stmt
+        if filters.country is not None:
+            stmt = stmt.where(RecordModel.country == filters.country)
+        if filters.city is not None:
+            stmt = stmt.where(RecordModel.city == filters.city)
+        if filters.housing_type is not None:
+            stmt = stmt.where(RecordModel.housing_type == HousingType(filters.housing_type).value)
+        if filters.min_rent is not None:
+            stmt = stmt.where(RecordModel.monthly_rent >= filters.min_rent)
+        if filters.max_rent is not None:
+            stmt = stmt.where(RecordModel.monthly_rent <= filters.max_rent)
+        if filters.search is not None:
+            stmt = stmt.where(
+                RecordModel.search_vector.bool_op("@@")(
+                    SQLAlchemyRecordRepository._search_query(filters.search)
+                )
+            )
+        return stmt
+
+    @staticmethod
+    def _apply_rent_filters(
+        stmt: Select[Any],
+        model: type[RentStatsBySegmentModel] | type[RentStatsMonthlyModel],
+        filters: RentStatsFilters,
+    ) -> Select[Any]:
+        # Rollups hold one row per segment (and month), so these scans never touch records.
+        if filters.country is not None:
+            stmt = stmt.where(model.country == filters.country)
+        if filters.city is not None:
+            stmt = stmt.where(model.city == filters.city)
+        if filters.housing_type is not None:
+            stmt = stmt.where(model.housing_type == filters.housing_type.value)
+        return stmt
+
+    @staticmethod
+    def _search_query(search: str) -> ColumnElement[Any]:
+        # websearch_to_tsquery never raises on user input (quotes, "or", "-term" are supported).
+        return func.websearch_to_tsquery(cast(SEARCH_CONFIG, REGCONFIG), search)
 
     def _to_domain(
-        self, record_model: RecordModel, stats: dict[int, tuple[int, float | None]] | None = None
+        self,
+        record_model: RecordModel,
+        images: Sequence[RecordImageModel] | None = None,
     ) -> Record:
-        images = [
+        if images is None:
+            images = record_model.images or []
+        domain_images = [
             RecordImage(
                 id=image.id,
                 image_url=image.image_url,
                 created_at=image.created_at,
             )
-            for image in record_model.images or []
+            for image in images
         ]
 
-        reviews_count = 0
-        average_rating: float | None = None
-        if stats and record_model.id is not None:
-            record_stats = stats.get(record_model.id)
-            if record_stats is not None:
-                reviews_count, average_rating = record_stats
+        reviews_count = record_model.reviews_count or 0
+        average_rating = record_model.rating_sum / reviews_count if reviews_count > 0 else None
 
         return Record(
             id=record_model.id,
@@ -141,7 +633,9 @@ class SQLAlchemyRecordRepository(RecordRepository):
             monthly_rent=record_model.monthly_rent,
             reviews_count=reviews_count,
             average_rating=average_rating,
-            images=images,
+            latitude=record_model.latitude,
+            longitude=record_model.longitude,
+            images=domain_images,
             created_at=record_model.created_at,
             updated_at=record_model.updated_at,
         )
@@ -0,0 +1,21 @@
+from functools import lru_cache
+
+from app.features.records.application.services import record_cache_key
+from app.features.records.domain.models import Record
+from app.shared.domain.cache import CacheBackend
+from app.shared.infrastructure.cache import InMemoryLRUCache
+from app.shared.infrastructure.settings import settings
+
+
+@lru_cache
+def get_record_cache() -> CacheBackend[Record]:
+    """Process-wide cache shared by every ``RecordService`` built for a request."""
+    return InMemoryLRUCache[Record](
+        max_entries=settings.cache.record_max_entries,
+        ttl_seconds=settings.cache.record_ttl_seconds,
+    )
+
+
+def invalidate_cached_record(record_id: int) -> None:
+    """Drop a record from the cache after a write elsewhere changed it (e.g. review stats)."""
+    get_record_cache().delete(record_cache_key(record_id))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from decimal import Decimal
+
+import pytest
+
+from app.features.records.domain.models import HousingType
+from app.features.records.infrastructure.fastapi.bulk_import import (
+    CsvRowParser,
+    ImportFormatError,
+    NdjsonRowParser,
+    RowParseError,
+    decode_line,
+    iter_lines,
+)
+
+
+async def _chunks(*parts: bytes) -> AsyncIterator[bytes]:
+    for part in parts:
+        yield part
+
+
+async def _collect(*parts: bytes) -> list[tuple[int, bytes]]:
+    return [line async for line in iter_lines(_chunks(*parts))]
+
+
+def test_iter_lines_joins_lines_split_across_chunks() -> None:
+    lines = asyncio.run(_collect(b"first\nsec", b"ond\r\n", b"third"))
+
+    assert lines == [(1, b"first"), (2, b"second\r"), (3, b"third")]
+    assert decode_line(2, b"second\r") == "second"
+
+
+def test_ndjson_parser_builds_command() -> None:
+    command = NdjsonRowParser().parse(
+        '{"address": "Calle 1", "country": "CO", "city": "Cali", '
+        '"housing_type": "casa", "monthly_rent": 1500.5, "images": ["a.jpg"]}'
+    )
+
+    assert command is not None
+    assert command.monthly_rent == Decimal("1500.5")
+    assert command.image_urls == ["a.jpg"]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        "{not json",
+        "[1, 2]",
+        '{"address": "A", "country": "B", "city": "C", "housing_type": "casa"}',
+        '{"address": "A", "country": "B", "city": "C", "housing_type": "casa", '
+        '"monthly_rent": "1.234"}',
+        '{"address": "A", "country": "B", "city": "C", "housing_type": "castillo", '
+        '"monthly_rent": 900}',
+    ],
+)
+def test_ndjson_parser_rejects_bad_rows(line: str) -> None:
+    with pytest.raises(RowParseError):
+        NdjsonRowParser().parse(line)
+
+
+def test_csv_parser_reads_header_then_rows() -> None:
+    parser = CsvRowParser()
+
+    assert parser.parse("address,country,city,housing_type,monthly_rent,images") is None
+    command = parser.parse('"Cra 1, Apt 2",CO,Bogota,apartamento,900,a.jpg|b.png')
+
+    assert command is not None
+    assert command.address == "Cra 1, Apt 2"
+    assert command.housing_type is HousingType.APARTAMENTO
+    assert command.image_urls == ["a.jpg", "b.png"]
+    with pytest.raises(RowParseError):
+        parser.parse("only,three,columns")
+
+
+def test_csv_parser_reads_optional_coordinates() -> None:
+    parser = CsvRowParser()
+    parser.parse("address,country,city,housing_type,monthly_rent,latitude,longitude")
+
+    located = parser.parse("Calle 1,CO,Bogota,casa,900,4.65,-74.05")
+    unlocated = parser.parse("Calle 2,CO,Bogota,casa,900,,")
+
+    assert located is not None and (located.latitude, located.longitude) == (4.65, -74.05)
+    assert unlocated is not None and unlocated.latitude is None
+    with pytest.raises(RowParseError):
+        parser.parse("Calle 3,CO,Bogota,casa,900,north,-74")
+
+
+def test_csv_parser_rejects_header_without_required_columns() -> None:
+    with pytest.raises(ImportFormatError):
+        CsvRowParser().parse("address,country")
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from fastapi import Request
+
+from app.features.records.application.services import RecordService, record_cache_key
+from app.features.records.domain.models import HousingType, Record
+from app.shared.infrastructure.cache import InMemoryLRUCache
+from app.shared.infrastructure.conditional import (
+    is_not_modified,
+    item_validators,
+    page_validators,
+)
+
+UPDATED_AT = datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=UTC)
+
+
+def _request(**headers: str) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "headers": raw})
+
+
+def test_item_validators_change_with_updated_at() -> None:
+    first = item_validators("record", 1, UPDATED_AT)
+    second = item_validators("record", 1, UPDATED_AT.replace(second=16))
+
+    assert first is not None and second is not None
+    assert first.etag.startswith('W/"')
+    assert first.etag != second.etag
+    assert first.headers["Last-Modified"] == "Wed, 01 May 2024 12:30:15 GMT"
+    assert item_validators("record", 1, None) is None
+
+
+def test_if_none_match_matches_weak_and_strong_forms() -> None:
+    validators = item_validators("record", 1, UPDATED_AT)
+    assert validators is not None
+    strong = validators.etag.removeprefix("W/")
+
+    assert is_not_modified(_request(if_none_match=validators.etag), validators)
+    assert is_not_modified(_request(if_none_match=f'"other", {strong}'), validators)
+    assert is_not_modified(_request(if_none_match="*"), validators)
+    assert not is_not_modified(_request(if_none_match='"other"'), validators)
+
+
+def test_if_none_match_takes_precedence_over_if_modified_since() -> None:
+    validators = item_validators("record", 1, UPDATED_AT)
+    assert validators is not None
+
+    request = _request(if_none_match='"other"', if_modified_since="Wed, 01 May 2024 12:30:15 GMT")
+
+    assert not is_not_modified(request, validators)
+
+
+def test_if_modified_since_compares_at_second_precision() -> None:
+    validators = item_validators("record", 1, UPDATED_AT)
+    assert validators is not None
+
+    assert is_not_modified(_request(if_modified_since="Wed, 01 May 2024 12:30:15 GMT"), validators)
+    assert not is_not_modified(
+        _request(if_modified_since="Wed, 01 May 2024 12:30:14 GMT"), validators
+    )
+    assert not is_not_modified(_request(if_modified_since="yesterday"), validators)
+
+
+def test_page_validators_depend_on_rows_and_meta() -> None:
+    rows = [(1, UPDATED_AT), (2, UPDATED_AT.replace(hour=13))]
+
+    page = page_validators("records", rows, {"total": 2})
+
+    assert page.last_modified == UPDATED_AT.replace(hour=13)
+    assert page == page_validators("records", rows, {"total": 2})
+    assert page.etag != page_validators("records", rows, {"total": 3}).etag
+    assert page.etag != page_validators("records", rows[:1], {"total": 2}).etag
+    assert page_validators("records", [], {"total": 0}).last_modified is None
+
+
+def test_get_record_version_prefers_cached_record() -> None:
+    repository = MagicMock()
+    cache = InMemoryLRUCache[Record](max_entries=8, ttl_seconds=60)
+    cache.set(
+        record_cache_key(1),
+        Record(
+            id=1,
+            address="Calle 1",
+            country="CO",
+            city="Bogota",
+            housing_type=HousingType.CASA,
+            monthly_rent=Decimal("1000"),
+            updated_at=UPDATED_AT,
+        ),
+    )
+    service = RecordService(repository, cache=cache)
+
+    assert service.get_record_version(1) == UPDATED_AT
+    repository.get_updated_at.assert_not_called()
+
+
+def test_get_record_version_falls_back_to_repository() -> None:
+    repository = MagicMock()
+    repository.get_updated_at.return_value = None
+    service = RecordService(repository)
+
+    assert service.get_record_version(7) is None
+    repository.get_updated_at.assert_called_once_with(7)
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.features.records.application.commands import UpdateRecordCommand
+from app.features.records.application.services import RecordService, record_cache_key
+from app.features.records.domain import exceptions
+from app.features.records.domain.models import HousingType, Record
+from app.shared.infrastructure.cache import InMemoryLRUCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _record(record_id: int = 1) -> Record:
+    return Record(
+        id=record_id,
+        address="Calle 1",
+        country="CO",
+        city="Bogota",
+        housing_type=HousingType.CASA,
+        monthly_rent=Decimal("1000"),
+    )
+
+
+def test_lru_cache_evicts_least_recently_used_entry() -> None:
+    cache = InMemoryLRUCache[int](max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (3, 1, 1, 2)
+
+
+def test_lru_cache_expires_entries_after_ttl() -> None:
+    clock = FakeClock()
+    cache = InMemoryLRUCache[int](max_entries=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    clock.now = 4.9
+    assert cache.get("a") == 1
+    clock.now = 5.0
+    assert cache.get("a") is None
+    assert cache.stats().expirations == 1
+    assert cache.stats().size == 0
+
+
+def test_lru_cache_with_zero_size_stores_nothing() -> None:
+    cache = InMemoryLRUCache[int](max_entries=0, ttl_seconds=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_get_record_reads_through_the_cache() -> None:
+    repository = MagicMock()
+    repository.get.return_value = _record()
+    service = RecordService(repository, cache=InMemoryLRUCache(max_entries=10, ttl_seconds=60))
+
+    first = service.get_record(1)
+    second = service.get_record(1, include_images=False)
+
+    assert first is second
+    repository.get.assert_called_once_with(1, include_images=True)
+
+
+def test_get_record_without_images_is_not_cached() -> None:
+    repository = MagicMock()
+    repository.get.return_value = _record()
+    cache = InMemoryLRUCache[Record](max_entries=10, ttl_seconds=60)
+    service = RecordService(repository, cache=cache)
+
+    service.get_record(1, include_images=False)
+
+    assert cache.stats().size == 0
+
+
+def test_update_and_delete_invalidate_cached_record() -> None:
+    repository = MagicMock()
+    repository.get.return_value = _record()
+    repository.update.return_value = _record()
+    cache = InMemoryLRUCache[Record](max_entries=10, ttl_seconds=60)
+    service = RecordService(repository, cache=cache)
+
+    service.get_record(1)
+    service.update_record(1, UpdateRecordCommand(city="Cali"))
+    assert cache.get(record_cache_key(1)) is None
+
+    service.get_record(1)
+    service.delete_record(1)
+    assert cache.get(record_cache_key(1)) is None
+
+
+def test_missing_record_is_not_cached() -> None:
+    repository = MagicMock()
+    repository.get.return_value = None
+    cache = InMemoryLRUCache[Record](max_entries=10, ttl_seconds=60)
+    service = RecordService(repository, cache=cache)
+
+    with pytest.raises(exceptions.RecordNotFoundError):
+        service.get_record(1)
+
+    assert cache.stats().size == 0
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from app.features.records.domain.models import (
+    FacetCount,
+    HousingType,
+    RecordChanges,
+    RecordCursor,
+    RecordImageMode,
+    RecordSort,
+    RentStatsFilters,
+)
+from app.features.records.infrastructure.jobs.purge_deleted_records import purge_deleted_records
+from app.features.records.infrastructure.jobs.reconcile_review_stats import reconcile_review_stats
+from app.features.records.infrastructure.persistence.models import RecordImageModel, RecordModel
+from app.features.records.infrastructure.persistence.repository import SQLAlchemyRecordRepository
+from app.shared.domain.pagination import CountMode
+from app.shared.infrastructure.images import replace_images
+
+PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _record_model(*, reviews_count: int, rating_sum: int) -> RecordModel:
+    return RecordModel(
+        id=1,
+        address="Calle 1",
+        country="CO",
+        city="Bogota",
+        housing_type="casa",
+        monthly_rent=Decimal("1000"),
+        reviews_count=reviews_count,
+        rating_sum=rating_sum,
+        images=[],
+    )
+
+
+def test_to_domain_derives_average_from_denormalized_stats() -> None:
+    session = MagicMock()
+    repository = SQLAlchemyRecordRepository(session)
+
+    record = repository._to_domain(_record_model(reviews_count=4, rating_sum=14))
+
+    assert record.housing_type is HousingType.CASA
+    assert record.reviews_count == 4
+    assert record.average_rating == 3.5
+    session.execute.assert_not_called()
+
+
+def test_to_domain_without_reviews_has_no_average() -> None:
+    repository = SQLAlchemyRecordRepository(MagicMock())
+
+    record = repository._to_domain(_record_model(reviews_count=0, rating_sum=0))
+
+    assert record.reviews_count == 0
+    assert record.average_rating is None
+
+
+def test_get_without_images_raiseloads_the_relationship_and_maps_none() -> None:
+    session = MagicMock()
+    record_model = _record_model(reviews_count=0, rating_sum=0)
+    record_model.images = [RecordImageModel(id=3, record_id=1, image_url="a.jpg")]
+    session.scalar.return_value = record_model
+
+    record = SQLAlchemyRecordRepository(session).get(1, include_images=False)
+
+    assert record is not None and record.images == []
+    (loader,) = session.scalar.call_args.args[0]._with_options
+    assert loader.context[0].strategy == (("lazy", "raise"),)
+
+
+def test_replace_images_diffs_stored_and_requested_urls_in_one_statement() -> None:
+    session = MagicMock()
+
+    replace_images(session, RecordImageModel, "record_id", 7, ["a.jpg", "a.jpg", "b.jpg"])
+
+    session.scalars.assert_called_once()
+    session.execute.assert_not_called()
+    compiled = session.scalars.call_args.args[0].compile(dialect=PG_DIALECT)
+    sql = " ".join(str(compiled).split())
+    assert "WITH ORDINALITY" in sql
+    assert "row_number() OVER (PARTITION BY record_images.image_url" in sql
+    assert "stale AS (DELETE FROM record_images" in sql
+    assert "inserted AS (INSERT INTO record_images (record_id, image_url)" in sql
+    assert "ORDER BY wanted.position" in sql
+    assert compiled.params == {"owner_id": 7, "image_urls": ["a.jpg", "a.jpg", "b.jpg"]}
+
+
+def test_delete_soft_deletes_and_decrements_its_facet() -> None:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = ("CO", "Bogota", "casa")
+    repository = SQLAlchemyRecordRepository(session)
+
+    assert repository.delete(1) is True
+
+    soft_delete, facets = (
+        str(call.args[0].compile(dialect=PG_DIALECT)) for call in session.execute.call_args_list
+    )
+    assert soft_delete.startswith("UPDATE records SET ")
+    assert "deleted_at=now()" in soft_delete
+    assert "records.deleted_at IS NULL" in soft_delete
+    assert "RETURNING records.country, records.city, records.housing_type" in soft_delete
+    assert facets.startswith("INSERT INTO record_facet_counts")
+    assert "ON CONFLICT (country, city, housing_type) DO UPDATE" in facets
+    assert session.execute.call_args_list[1].args[0].compile().params["records_count_m0"] == -1
+    session.delete.assert_not_called()
+    session.commit.assert_called_once()
+
+
+def test_delete_reports_missing_or_already_deleted_record() -> None:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = None
+
+    assert SQLAlchemyRecordRepository(session).delete(1) is False
+    session.execute.assert_called_once()
+
+
+def test_listings_hide_soft_deleted_records() -> None:
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.list_after(limit=10)
+
+    sql = str(session.scalars.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "records.deleted_at IS NULL" in sql
+
+
+def test_purge_deletes_children_first_in_batches() -> None:
+    session = MagicMock()
+    # First table needs a second, partial batch; every other table is already empty.
+    session.execute.side_effect = [MagicMock(rowcount=rowcount) for rowcount in (2, 1)] + [
+        MagicMock(rowcount=0) for _ in range(5)
+    ]
+
+    purged = purge_deleted_records(session, batch_size=2)
+
+    assert purged == {
+        "comments": 3,
+        "review_images": 0,
+        "reviews": 0,
+        "saved_records": 0,
+        "record_images": 0,
+        "records": 0,
+    }
+    statements = [str(call.args[0]) for call in session.execute.call_args_list]
+    assert [statement.split()[2] for statement in statements] == [
+        "comments",
+        "comments",
+        "review_images",
+        "reviews",
+        "saved_records",
+        "record_images",
+        "records",
+    ]
+    assert all("LIMIT :batch_size" in statement for statement in statements)
+    assert session.commit.call_count == len(statements)
+
+
+def test_reconcile_locks_each_batch_before_aggregating_it() -> None:
+    session = MagicMock()
+    session.execute.return_value.scalar.return_value = 3
+    session.execute.return_value.all.return_value = [(2,)]
+
+    fixed = reconcile_review_stats(session, batch_size=2)
+
+    assert fixed == 2
+    statements = [" ".join(str(call.args[0]).split()) for call in session.execute.call_args_list]
+    assert statements[0].startswith("SELECT COALESCE(MAX(id), 0)")
+    for lock, reconcile in (statements[1:3], statements[3:5]):
+        assert lock.endswith("FOR NO KEY UPDATE")
+        assert reconcile.startswith("UPDATE records AS r")
+    assert session.commit.call_count == 2
+
+
+def test_cover_listing_loads_one_image_per_record_with_its_count() -> None:
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = [
+        _record_model(reviews_count=0, rating_sum=0),
+        RecordModel(
+            id=2,
+            address="Calle 2",
+            country="CO",
+            city="Cali",
+            housing_type="casa",
+            monthly_rent=Decimal("900"),
+            reviews_count=0,
+            rating_sum=0,
+        ),
+    ]
+    session.execute.return_value = [(RecordImageModel(id=7, record_id=1, image_url="a.jpg"), 40)]
+    repository = SQLAlchemyRecordRepository(session)
+
+    records = repository.list_after(limit=10, image_mode=RecordImageMode.COVER)
+
+    assert [image.image_url for image in records[0].images] == ["a.jpg"]
+    assert records[0].images_count == 40
+    assert records[1].images == []
+    assert records[1].images_count == 0
+    sql = str(session.execute.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "DISTINCT ON (record_images.record_id)" in sql
+    assert "count(*) OVER (PARTITION BY record_images.record_id)" in sql
+    listing_sql = str(session.scalars.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "record_images" not in listing_sql
+
+
+def test_sorted_keyset_page_seeks_on_the_sort_key_and_id() -> None:
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.list_after(
+        limit=10,
+        after=RecordCursor(value=Decimal("900"), id=4, sort=RecordSort.RENT_ASC),
+        sort=RecordSort.RENT_ASC,
+    )
+
+    sql = str(session.scalars.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "(records.monthly_rent, records.id) > (" in sql
+    assert "ORDER BY records.monthly_rent ASC, records.id ASC" in sql
+
+
+def test_rating_sort_orders_by_the_generated_score() -> None:
+    session = MagicMock()
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.list(limit=10, sort=RecordSort.RATING, count_mode=CountMode.NONE)
+
+    sql = str(session.scalars.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "ORDER BY records.rating_score DESC, records.id DESC" in sql
+
+
+def test_facet_counts_apply_the_other_active_filters() -> None:
+    session = MagicMock()
+    session.execute.return_value = [
+        SimpleNamespace(facet="city", value="Cali", records_count=2),
+        SimpleNamespace(facet="city", value="Bogota", records_count=5),
+        SimpleNamespace(facet="country", value="CO", records_count=7),
+        SimpleNamespace(facet="housing_type", value="casa", records_count=5),
+    ]
+    repository = SQLAlchemyRecordRepository(session)
+
+    facets = repository.facet_counts(RentStatsFilters(country="CO", city="Bogota"))
+
+    assert [(item.value, item.count) for item in facets.city] == [("Bogota", 5), ("Cali", 2)]
+    assert facets.country == [FacetCount(value="CO", count=7)]
+    session.execute.assert_called_once()
+    country_facet, city_facet, housing_facet = (
+        str(query.compile(dialect=PG_DIALECT))
+        for query in session.execute.call_args.args[0].selects
+    )
+    assert "record_facet_counts.city =" in country_facet
+    assert "record_facet_counts.country =" not in country_facet
+    assert "record_facet_counts.country =" in city_facet
+    assert "record_facet_counts.city =" not in city_facet
+    assert "record_facet_counts.country =" in housing_facet
+    assert "record_facet_counts.city =" in housing_facet
+
+
+def test_update_moves_the_facet_count_when_the_segment_changes() -> None:
+    session = MagicMock()
+    moved = _record_model(reviews_count=0, rating_sum=0)
+    moved.city = "Cali"
+    session.execute.return_value.one_or_none.return_value = (moved, "CO", "Bogota", "casa")
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.update(1, RecordChanges(city="Cali"))
+
+    update_stmt, facets = (call.args[0] for call in session.execute.call_args_list)
+    update_sql = str(update_stmt.compile(dialect=PG_DIALECT))
+    assert update_sql.startswith("WITH previous AS")
+    assert "FOR UPDATE" in update_sql
+    assert "RETURNING records.id" in update_sql
+    params = facets.compile(dialect=PG_DIALECT).params
+    assert {params["city_m0"]: params["records_count_m0"]} | {
+        params["city_m1"]: params["records_count_m1"]
+    } == {"Bogota": -1, "Cali": 1}
+
+
+def test_update_keeps_the_facet_count_when_segment_fields_are_resent_unchanged() -> None:
+    session = MagicMock()
+    unchanged = _record_model(reviews_count=0, rating_sum=0)
+    session.execute.return_value.one_or_none.return_value = (unchanged, "CO", "Bogota", "casa")
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.update(1, RecordChanges(country="CO", city="Bogota", housing_type=HousingType.CASA))
+
+    session.execute.assert_called_once()
+    session.commit.assert_called_once()
+
+
+def test_update_with_images_takes_two_statements() -> None:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = (
+        _record_model(reviews_count=0, rating_sum=0),
+    )
+    session.scalars.return_value.all.return_value = []
+    repository = SQLAlchemyRecordRepository(session)
+
+    repository.update(1, RecordChanges(monthly_rent=Decimal("950"), image_urls=("a.jpg",)))
+
+    update_sql = str(session.execute.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert update_sql.startswith("UPDATE records SET")
+    assert "FOR UPDATE" not in update_sql
+    session.execute.assert_called_once()
+    session.scalars.assert_called_once()
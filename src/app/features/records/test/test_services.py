@@ -1,15 +1,33 @@
 from __future__ import annotations
 
 from dataclasses import replace
+from datetime import UTC, date, datetime
 from decimal import Decimal
 from unittest.mock import MagicMock
 
 import pytest
 
 from app.features.records.application.commands import CreateRecordCommand, UpdateRecordCommand
+from app.features.records.application.record_detail import (
+    DETAIL_REVIEWS_LIMIT,
+    RecordDetailService,
+)
 from app.features.records.application.services import RecordService
 from app.features.records.domain import exceptions
-from app.features.records.domain.models import HousingType, Record, RecordImage
+from app.features.records.domain.models import (
+    GeoBounds,
+    HousingType,
+    Record,
+    RecordChanges,
+    RecordCursor,
+    RecordFilters,
+    RecordImage,
+    RecordImageMode,
+    RecordInclude,
+    RecordSort,
+    RentStatsFilters,
+)
+from app.shared.domain.pagination import CountMode, PaginatedResult, encode_cursor
 
 
 def _sample_record() -> Record:
@@ -110,7 +128,7 @@ def test_get_record_returns_when_found() -> None:
 
     result = service.get_record(7)
 
-    repository.get.assert_called_once_with(7)
+    repository.get.assert_called_once_with(7, include_images=True)
     assert result is existing
 
 
@@ -123,26 +141,29 @@ def test_get_record_raises_when_missing() -> None:
         service.get_record(99)
 
 
-def test_delete_record_checks_existence() -> None:
+def test_delete_record_is_a_single_repository_call() -> None:
     repository = MagicMock()
-    repository.get.return_value = _sample_record()
+    repository.delete.return_value = True
     service = RecordService(repository)
 
     service.delete_record(5)
 
     repository.delete.assert_called_once_with(5)
+    repository.get.assert_not_called()
+
+
+def test_delete_record_not_found() -> None:
+    repository = MagicMock()
+    repository.delete.return_value = False
+    service = RecordService(repository)
 
-    repository.get.return_value = None
     with pytest.raises(exceptions.RecordNotFoundError):
         service.delete_record(5)
-    repository.delete.assert_called_once_with(5)
 
 
-def test_update_record_replaces_fields_and_images() -> None:
+def test_update_record_sends_normalized_changes_in_one_call() -> None:
     repository = MagicMock()
-    existing = _sample_record()
-    repository.get.return_value = existing
-    repository.update.side_effect = lambda record, replace_images: Record(**record.__dict__)
+    repository.update.return_value = _sample_record()
     service = RecordService(repository)
     command = UpdateRecordCommand(
         address=" New Address ",
@@ -155,45 +176,33 @@ def test_update_record_replaces_fields_and_images() -> None:
 
     updated = service.update_record(1, command)
 
-    repository.update.assert_called_once()
-    persisted = repository.update.call_args[0][0]
-    assert persisted.id == existing.id
-    assert persisted.address == "New Address"
-    assert persisted.country == "Peru"
-    assert persisted.city == "Lima"
-    assert persisted.housing_type is HousingType.COMERCIAL
-    assert persisted.monthly_rent == Decimal("1500")
-    assert [image.image_url for image in persisted.images] == [
-        "new.jpg",
-        "two.png#hash",
-    ]
-    assert repository.update.call_args.kwargs["replace_images"] is True
-    assert updated.housing_type is HousingType.COMERCIAL
+    repository.get.assert_not_called()
+    repository.update.assert_called_once_with(
+        1,
+        RecordChanges(
+            address="New Address",
+            country="Peru",
+            city="Lima",
+            housing_type=HousingType.COMERCIAL,
+            monthly_rent=Decimal("1500"),
+            image_urls=("new.jpg", "two.png#hash"),
+        ),
+    )
+    assert updated is repository.update.return_value
 
 
-def test_update_record_keeps_existing_fields_when_missing_in_command() -> None:
+def test_update_record_leaves_missing_fields_untouched() -> None:
     repository = MagicMock()
-    existing = _sample_record()
-    repository.get.return_value = existing
-    repository.update.side_effect = lambda record, replace_images: record
     service = RecordService(repository)
     command = UpdateRecordCommand(address=None, country=None, city=None, image_urls=None)
 
-    updated = service.update_record(existing.id, command)
+    service.update_record(1, command)
 
-    assert repository.update.call_args.kwargs["replace_images"] is False
-    persisted = repository.update.call_args[0][0]
-    assert persisted.address == existing.address
-    assert persisted.country == existing.country
-    assert persisted.city == existing.city
-    assert persisted.housing_type is existing.housing_type
-    assert persisted.images is existing.images
-    assert updated is persisted
+    repository.update.assert_called_once_with(1, RecordChanges())
 
 
 def test_update_record_validations_and_not_found() -> None:
     repository = MagicMock()
-    repository.get.return_value = _sample_record()
     service = RecordService(repository)
 
     with pytest.raises(exceptions.InvalidMonthlyRentError):
@@ -211,7 +220,11 @@ def test_update_record_validations_and_not_found() -> None:
             ),
         )
 
-    repository.get.return_value = None
+    with pytest.raises(exceptions.InvalidCoordinatesError):
+        service.update_record(1, UpdateRecordCommand(latitude=4.6))
+    repository.update.assert_not_called()
+
+    repository.update.return_value = None
     with pytest.raises(exceptions.RecordNotFoundError):
         service.update_record(99, UpdateRecordCommand(housing_type="casa"))
 
@@ -223,7 +236,7 @@ def test_list_records_validates_pagination() -> None:
 
     records = service.list_records(limit=10, offset=5)
 
-    repository.list.assert_called_once_with(limit=10, offset=5)
+    repository.list.assert_called_once_with(limit=10, offset=5, filters=None)
     assert records == repository.list.return_value
 
     with pytest.raises(exceptions.MissingRequiredFieldError):
@@ -231,3 +244,440 @@ def test_list_records_validates_pagination() -> None:
 
     with pytest.raises(exceptions.MissingRequiredFieldError):
         service.list_records(limit=5, offset=-1)
+
+
+def _dated_record(record_id: int) -> Record:
+    return replace(
+        _sample_record(),
+        id=record_id,
+        created_at=datetime(2024, 1, record_id, tzinfo=UTC),
+    )
+
+
+def test_list_records_by_cursor_returns_next_cursor_when_more_rows() -> None:
+    repository = MagicMock()
+    repository.list_after.return_value = [_dated_record(idx) for idx in (3, 2, 1)]
+    service = RecordService(repository)
+
+    first_page = service.list_records_by_cursor(page_size=2)
+
+    repository.list_after.assert_called_once_with(
+        limit=3,
+        after=None,
+        filters=None,
+        include_images=True,
+        image_mode=RecordImageMode.ALL,
+        sort=RecordSort.NEWEST,
+    )
+    assert [record.id for record in first_page.items] == [3, 2]
+    assert first_page.has_more is True
+
+    repository.list_after.reset_mock()
+    repository.list_after.return_value = [_dated_record(1)]
+    second_page = service.list_records_by_cursor(cursor=first_page.next_cursor, page_size=2)
+
+    repository.list_after.assert_called_once_with(
+        limit=3,
+        after=RecordCursor(value=datetime(2024, 1, 2, tzinfo=UTC), id=2),
+        filters=None,
+        include_images=True,
+        image_mode=RecordImageMode.ALL,
+        sort=RecordSort.NEWEST,
+    )
+    assert [record.id for record in second_page.items] == [1]
+    assert second_page.next_cursor is None
+    assert second_page.has_more is False
+
+
+def test_cursor_keeps_the_sort_it_was_issued_for() -> None:
+    repository = MagicMock()
+    cheap, cheaper = (
+        replace(_sample_record(), id=record_id, monthly_rent=Decimal(rent))
+        for record_id, rent in ((7, "900.50"), (3, "1000"))
+    )
+    repository.list.return_value = ([cheap, cheaper], 5)
+    service = RecordService(repository)
+
+    result = service.list_records(page=1, page_size=2, sort=RecordSort.RENT_ASC)
+    assert isinstance(result, PaginatedResult)
+    assert repository.list.call_args.kwargs["sort"] is RecordSort.RENT_ASC
+
+    service.list_records_by_cursor(cursor=result.next_cursor, page_size=2)
+
+    kwargs = repository.list_after.call_args.kwargs
+    assert kwargs["sort"] is RecordSort.RENT_ASC
+    assert kwargs["after"] == RecordCursor(value=Decimal("1000"), id=3, sort=RecordSort.RENT_ASC)
+
+
+def test_rating_cursor_uses_zero_for_records_without_reviews() -> None:
+    repository = MagicMock()
+    repository.list_after.return_value = [
+        replace(_sample_record(), id=2, reviews_count=3, average_rating=11 / 3),
+        replace(_sample_record(), id=1),
+        replace(_sample_record(), id=0),
+    ]
+    service = RecordService(repository)
+
+    page = service.list_records_by_cursor(page_size=1, sort=RecordSort.RATING)
+    service.list_records_by_cursor(cursor=page.next_cursor, page_size=1)
+    assert repository.list_after.call_args.kwargs["after"].value == 11 / 3
+
+    repository.list_after.return_value = repository.list_after.return_value[1:]
+    page = service.list_records_by_cursor(page_size=1, sort=RecordSort.RATING)
+    service.list_records_by_cursor(cursor=page.next_cursor, page_size=1)
+    assert repository.list_after.call_args.kwargs["after"].value == 0.0
+
+
+def test_cursor_rejects_a_different_sort() -> None:
+    repository = MagicMock()
+    repository.list_after.return_value = [_dated_record(3), _dated_record(2)]
+    service = RecordService(repository)
+    page = service.list_records_by_cursor(page_size=1)
+    repository.list_after.reset_mock()
+
+    with pytest.raises(exceptions.InvalidCursorError):
+        service.list_records_by_cursor(
+            cursor=page.next_cursor, page_size=1, sort=RecordSort.REVIEWS
+        )
+
+    repository.list_after.assert_not_called()
+
+
+def test_cursor_issued_before_sort_options_still_decodes() -> None:
+    repository = MagicMock()
+    repository.list_after.return_value = []
+    service = RecordService(repository)
+    legacy = encode_cursor({"created_at": "2024-01-02T00:00:00+00:00", "id": 2})
+
+    service.list_records_by_cursor(cursor=legacy, page_size=2)
+
+    kwargs = repository.list_after.call_args.kwargs
+    assert kwargs["sort"] is RecordSort.NEWEST
+    assert kwargs["after"] == RecordCursor(value=datetime(2024, 1, 2, tzinfo=UTC), id=2)
+
+
+def test_list_records_by_cursor_rejects_malformed_cursor() -> None:
+    repository = MagicMock()
+    service = RecordService(repository)
+
+    with pytest.raises(exceptions.InvalidCursorError):
+        service.list_records_by_cursor(cursor="not-a-cursor", page_size=10)
+
+    repository.list_after.assert_not_called()
+
+
+def test_list_records_page_mode_exposes_cursor_for_following_page() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_dated_record(5), _dated_record(4)], 5)
+    service = RecordService(repository)
+
+    result = service.list_records(page=1, page_size=2)
+
+    assert isinstance(result, PaginatedResult)
+    assert result.next_cursor is not None
+    service.list_records_by_cursor(cursor=result.next_cursor, page_size=2)
+    assert repository.list_after.call_args.kwargs["after"].id == 4
+
+
+def test_list_records_omits_next_cursor_for_ranked_search() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_dated_record(5), _dated_record(4)], 5)
+    service = RecordService(repository)
+
+    result = service.list_records(page=1, page_size=2, filters=RecordFilters(search="bogota"))
+
+    assert isinstance(result, PaginatedResult)
+    assert result.next_cursor is None
+
+
+def test_list_records_sorted_search_keeps_next_cursor() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_dated_record(5), _dated_record(4)], 5)
+    service = RecordService(repository)
+
+    result = service.list_records(
+        page=1, page_size=2, filters=RecordFilters(search="bogota"), sort=RecordSort.NEWEST
+    )
+
+    assert isinstance(result, PaginatedResult)
+    assert result.next_cursor is not None
+
+
+def test_list_records_without_count_uses_probe_row_for_next_cursor() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_dated_record(5), _dated_record(4), _dated_record(3)], None)
+    service = RecordService(repository)
+
+    result = service.list_records(page=1, page_size=2, count_mode=CountMode.NONE)
+
+    assert isinstance(result, PaginatedResult)
+    assert repository.list.call_args.kwargs["limit"] == 3
+    assert [record.id for record in result.items] == [5, 4]
+    assert result.total is None
+    assert result.has_more is True
+    assert result.next_cursor is not None
+
+
+def test_list_records_can_skip_image_loading() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_sample_record()], 1)
+    service = RecordService(repository)
+
+    service.list_records(page=1, page_size=10, include_images=False)
+
+    assert repository.list.call_args.kwargs["include_images"] is False
+
+
+def test_list_records_normalizes_and_forwards_filters() -> None:
+    repository = MagicMock()
+    repository.list.return_value = ([_sample_record()], 1)
+    service = RecordService(repository)
+
+    service.list_records(
+        page=1,
+        page_size=10,
+        filters=RecordFilters(
+            country=" CO ",
+            city="  ",
+            housing_type="Apartamento",
+            min_rent=Decimal("500"),
+            max_rent=Decimal("1000"),
+            search="  medellín centro ",
+        ),
+    )
+
+    assert repository.list.call_args.kwargs["filters"] == RecordFilters(
+        country="CO",
+        city=None,
+        housing_type=HousingType.APARTAMENTO,
+        min_rent=Decimal("500"),
+        max_rent=Decimal("1000"),
+        search="medellín centro",
+    )
+
+
+def test_list_records_rejects_inverted_rent_range() -> None:
+    repository = MagicMock()
+    service = RecordService(repository)
+
+    with pytest.raises(exceptions.InvalidRecordFilterError):
+        service.list_records(
+            filters=RecordFilters(min_rent=Decimal("2000"), max_rent=Decimal("1000"))
+        )
+
+    repository.list.assert_not_called()
+
+
+def _import_command(**overrides: object) -> CreateRecordCommand:
+    base: dict[str, object] = {
+        "address": "Calle 1",
+        "country": "CO",
+        "city": "Bogota",
+        "housing_type": "casa",
+        "monthly_rent": Decimal("1000"),
+    }
+    base.update(overrides)
+    return CreateRecordCommand(**base)  # type: ignore[arg-type]
+
+
+def test_import_records_persists_valid_rows_in_chunks_and_reports_invalid() -> None:
+    repository = MagicMock()
+    repository.create_many.side_effect = lambda records: list(range(len(records)))
+    service = RecordService(repository)
+    rows = [
+        (1, _import_command()),
+        (2, _import_command(monthly_rent=Decimal("0"))),
+        (3, _import_command(image_urls=["photo.gif"])),
+        (4, _import_command(city=" Lima ")),
+        (5, _import_command()),
+    ]
+
+    result = service.import_records(rows, chunk_size=2)
+
+    assert result.imported == 3
+    assert [failure.line for failure in result.failures] == [2, 3]
+    chunks = [call.args[0] for call in repository.create_many.call_args_list]
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0][1].city == "Lima"
+
+
+def test_import_records_reports_every_row_of_a_rejected_chunk() -> None:
+    repository = MagicMock()
+    repository.create_many.side_effect = [
+        exceptions.RecordPersistenceError("Database rejected the record batch"),
+        [3],
+    ]
+    service = RecordService(repository)
+
+    result = service.import_records(
+        [(1, _import_command()), (2, _import_command()), (3, _import_command())],
+        chunk_size=2,
+    )
+
+    assert result.imported == 1
+    assert [failure.line for failure in result.failures] == [1, 2]
+
+
+def test_get_records_returns_request_order_and_missing_ids() -> None:
+    repository = MagicMock()
+    repository.get_many.return_value = [replace(_sample_record(), id=3), _sample_record()]
+    service = RecordService(repository)
+
+    batch = service.get_records([1, 2, 3, 1])
+
+    repository.get_many.assert_called_once_with([1, 2, 3])
+    assert [record.id for record in batch.items] == [1, 3]
+    assert batch.missing_ids == [2]
+
+
+def test_get_records_validates_id_list() -> None:
+    service = RecordService(MagicMock())
+
+    with pytest.raises(exceptions.MissingRequiredFieldError):
+        service.get_records([])
+
+    with pytest.raises(exceptions.MissingRequiredFieldError):
+        service.get_records(list(range(1, 102)))
+
+
+def test_export_records_validates_filters_before_streaming() -> None:
+    repository = MagicMock()
+    repository.iter_all.return_value = iter([_sample_record()])
+    service = RecordService(repository)
+
+    with pytest.raises(exceptions.InvalidRecordFilterError):
+        service.export_records(RecordFilters(min_rent=Decimal("-1")))
+    repository.iter_all.assert_not_called()
+
+    exported = list(service.export_records(RecordFilters(city=" Lima ")))
+
+    repository.iter_all.assert_called_once_with(filters=RecordFilters(city="Lima"))
+    assert [record.id for record in exported] == [1]
+
+
+def test_create_record_requires_both_coordinates() -> None:
+    service = RecordService(MagicMock())
+    command = CreateRecordCommand(
+        address="Calle 1",
+        country="CO",
+        city="Bogota",
+        housing_type=HousingType.CASA,
+        monthly_rent=Decimal("900"),
+        latitude=4.65,
+    )
+
+    with pytest.raises(exceptions.InvalidCoordinatesError):
+        service.create_record(command)
+
+
+def test_list_records_in_bounds_reports_truncation() -> None:
+    repository = MagicMock()
+    repository.list_in_bounds.return_value = [_dated_record(idx) for idx in (1, 2, 3)]
+    service = RecordService(repository)
+    bounds = GeoBounds(min_latitude=4, min_longitude=-75, max_latitude=5, max_longitude=-74)
+
+    result = service.list_records_in_bounds(bounds, limit=2)
+
+    assert repository.list_in_bounds.call_args.kwargs["limit"] == 3
+    assert [record.id for record in result.items] == [1, 2]
+    assert result.truncated is True
+
+    with pytest.raises(exceptions.InvalidCoordinatesError):
+        service.list_records_in_bounds(
+            GeoBounds(min_latitude=6, min_longitude=-75, max_latitude=5, max_longitude=-74)
+        )
+
+
+def test_list_nearest_records_reranks_candidates_by_great_circle_distance() -> None:
+    repository = MagicMock()
+    far = replace(_sample_record(), id=1, latitude=4.70, longitude=-74.00)
+    near = replace(_sample_record(), id=2, latitude=4.61, longitude=-74.08)
+    unlocated = replace(_sample_record(), id=3)
+    repository.list_nearest.return_value = [far, unlocated, near]
+    service = RecordService(repository)
+
+    nearby = service.list_nearest_records(latitude=4.60, longitude=-74.08, limit=1)
+
+    assert repository.list_nearest.call_args.kwargs["limit"] == 4
+    assert [item.record.id for item in nearby] == [2]
+    assert nearby[0].distance_km == pytest.approx(1.11, abs=0.01)
+
+
+def _detail_service(
+    repository: MagicMock,
+) -> tuple[RecordDetailService, MagicMock, MagicMock, MagicMock]:
+    reviews, comments, saved_records = MagicMock(), MagicMock(), MagicMock()
+    service = RecordDetailService(
+        RecordService(repository),
+        reviews=reviews,
+        comments=comments,
+        saved_records=saved_records,
+    )
+    return service, reviews, comments, saved_records
+
+
+def test_get_record_detail_batches_related_data() -> None:
+    repository = MagicMock()
+    repository.get.return_value = _sample_record()
+    service, reviews, comments, saved_records = _detail_service(repository)
+    first, second = MagicMock(id=5), MagicMock(id=6)
+    reviews.list_by_record.return_value = ([first, second], None)
+    comments.count_by_review_ids.return_value = {5: 2}
+    saved_records.saved_record_ids.return_value = {1}
+
+    detail = service.get_record_detail(
+        1, {RecordInclude.REVIEWS, RecordInclude.COMMENTS_COUNT, RecordInclude.SAVED}
+    )
+
+    assert detail.reviews == [first, second]
+    assert detail.comments_count == {5: 2, 6: 0}
+    assert detail.saved is True
+    reviews.list_by_record.assert_called_once_with(
+        record_id=1, limit=DETAIL_REVIEWS_LIMIT, offset=0, count_mode=CountMode.NONE
+    )
+    comments.count_by_review_ids.assert_called_once_with([5, 6])
+    saved_records.saved_record_ids.assert_called_once_with([1])
+
+
+def test_get_record_detail_only_queries_requested_includes() -> None:
+    repository = MagicMock()
+    repository.get.return_value = _sample_record()
+    service, reviews, comments, saved_records = _detail_service(repository)
+    saved_records.saved_record_ids.return_value = set()
+
+    detail = service.get_record_detail(1, {RecordInclude.SAVED})
+
+    assert detail.reviews is None
+    assert detail.saved is False
+    reviews.list_by_record.assert_not_called()
+    comments.count_by_review_ids.assert_not_called()
+
+
+def test_get_record_detail_missing_record_raises_not_found() -> None:
+    repository = MagicMock()
+    repository.get.return_value = None
+    service, reviews, _, _ = _detail_service(repository)
+
+    with pytest.raises(exceptions.RecordNotFoundError):
+        service.get_record_detail(99, {RecordInclude.REVIEWS})
+
+    reviews.list_by_record.assert_not_called()
+
+
+def test_get_rent_trend_starts_at_first_day_of_window() -> None:
+    repository = MagicMock()
+    repository.monthly_rent_stats.return_value = []
+    service = RecordService(repository)
+
+    service.get_rent_trend(RentStatsFilters(city=" Bogota "), months=3, today=date(2026, 2, 14))
+
+    repository.monthly_rent_stats.assert_called_once_with(
+        RentStatsFilters(city="Bogota"), since=date(2025, 12, 1)
+    )
+
+
+def test_get_rent_trend_rejects_out_of_range_months() -> None:
+    service = RecordService(MagicMock())
+
+    with pytest.raises(exceptions.InvalidRecordFilterError):
+        service.get_rent_trend(months=0)
@@ -1,6 +1,8 @@
 from dataclasses import dataclass, field
 from datetime import datetime
 
+from app.shared.domain.pagination import CountMode
+
 
 @dataclass(slots=True)
 class CreateReviewDTO:
@@ -10,6 +12,8 @@ class CreateReviewDTO:
     body: str
     rating: int
     images: list[str] = field(default_factory=list)
+    # Preferred language of the confirmation email (e.g. from Accept-Language).
+    locale: str | None = None
 
 
 @dataclass(slots=True)
@@ -27,12 +31,22 @@ class ListReviewsQuery:
     record_id: int
     page: int
     page_size: int
+    include_images: bool = True
+    count_mode: CountMode = CountMode.EXACT
 
     @property
     def offset(self) -> int:
         return (self.page - 1) * self.page_size
 
 
+@dataclass(slots=True)
+class ListReviewsByCursorQuery:
+    record_id: int
+    page_size: int
+    cursor: str | None = None
+    include_images: bool = True
+
+
 @dataclass(slots=True)
 class ReviewDTO:
     id: int
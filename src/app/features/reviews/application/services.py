@@ -1,7 +1,14 @@
 import logging
 import re
+from collections.abc import Callable, Iterator
+from datetime import datetime
 
-from app.features.reviews.application.dtos import CreateReviewDTO, ListReviewsQuery, UpdateReviewDTO
+from app.features.reviews.application.dtos import (
+    CreateReviewDTO,
+    ListReviewsByCursorQuery,
+    ListReviewsQuery,
+    UpdateReviewDTO,
+)
 from app.features.reviews.application.mappers import to_review_entity
 from app.features.reviews.domain.exceptions import (
     EmptyReviewUpdateError,
@@ -10,15 +17,27 @@ from app.features.reviews.domain.exceptions import (
     InvalidReviewEmailError,
     InvalidReviewImageError,
     InvalidReviewRatingError,
-    RecordNotFoundError,
     ReviewNotFoundError,
     ReviewPersistenceError,
 )
 from app.features.reviews.domain.repository import ReviewRepository
-from app.features.reviews.domain.review import Review, ReviewImage
-from app.shared.application.email import EmailDeliveryError, EmailMessage, EmailSender
-from app.shared.domain.pagination import PageOutOfRangeError, PaginatedResult
-
+from app.features.reviews.domain.review import Review, ReviewChanges, ReviewCursor, ReviewImage
+from app.shared.application.email import (
+    EmailOutbox,
+    EmailOutboxError,
+    EmailTemplates,
+    get_email_templates,
+)
+from app.shared.domain.pagination import (
+    CountMode,
+    CursorPaginatedResult,
+    InvalidCursorError,
+    PageOutOfRangeError,
+    PaginatedResult,
+    decode_cursor,
+    encode_cursor,
+    window_size,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,10 +48,19 @@ class ReviewService:
     ALLOWED_IMAGE_EXTENSIONS = (".jpg", ".png")
 
     def __init__(
-        self, repository: ReviewRepository, email_sender: EmailSender | None = None
+        self,
+        repository: ReviewRepository,
+        email_outbox: EmailOutbox | None = None,
+        on_record_stats_changed: Callable[[int], None] | None = None,
+        email_templates: EmailTemplates | None = None,
     ) -> None:
         self.repository = repository
-        self.email_sender = email_sender
+        # Shares the repository's session: queued emails commit or roll back with the review.
+        self.email_outbox = email_outbox
+        self.email_templates = email_templates or get_email_templates()
+        # Called with a record id after a write changed its reviews_count/average_rating,
+        # e.g. to invalidate a cached record detail.
+        self.on_record_stats_changed = on_record_stats_changed
 
     def create_review(self, dto: CreateReviewDTO) -> Review:
         self._validate_email(dto.email)
@@ -40,49 +68,85 @@ class ReviewService:
         self._validate_rating(dto.rating)
         self._validate_images(dto.images)
 
-        if not self.repository.record_exists(dto.record_id):
-            raise RecordNotFoundError(f"Record {dto.record_id} does not exist")
-
         review = to_review_entity(dto)
+        self._enqueue_review_created(review, locale=dto.locale)
         created_review = self.repository.create(review)
-        self._notify_review_created(created_review)
+        self._record_stats_changed(created_review.record_id)
         return created_review
 
     def list_reviews(self, query: ListReviewsQuery) -> PaginatedResult[Review]:
-        if not self.repository.record_exists(query.record_id):
-            raise RecordNotFoundError(f"Record {query.record_id} does not exist")
-
         if query.page < 1:
             raise InvalidPaginationError("page must be at least 1")
         if query.page_size <= 0 or query.page_size > 100:
             raise InvalidPaginationError("page_size must be between 1 and 100")
 
-        reviews, total = self.repository.list_by_record(
+        window, total = self.repository.list_by_record(
             record_id=query.record_id,
-            limit=query.page_size,
+            limit=window_size(query.page_size, query.count_mode),
             offset=query.offset,
+            include_images=query.include_images,
+            count_mode=query.count_mode,
         )
-        total_pages = (total + query.page_size - 1) // query.page_size if total > 0 else 0
-        if total == 0 and query.page > 1:
-            raise PageOutOfRangeError("No hay reseñas disponibles para la página solicitada")
-        if total_pages > 0 and query.page > total_pages:
-            raise PageOutOfRangeError(
-                f"La página solicitada {query.page} excede el total de páginas {total_pages}"
-            )
-
-        return PaginatedResult(
-            items=list(reviews),
+        result = PaginatedResult.from_window(
+            window,
             total=total,
             page=query.page,
             page_size=query.page_size,
+            count_mode=query.count_mode,
+        )
+
+        if query.count_mode is CountMode.EXACT:
+            total_pages = result.total_pages or 0
+            if result.total == 0 and query.page > 1:
+                raise PageOutOfRangeError("No hay reseñas disponibles para la página solicitada")
+            if total_pages > 0 and query.page > total_pages:
+                raise PageOutOfRangeError(
+                    f"La página solicitada {query.page} excede el total de páginas {total_pages}"
+                )
+        elif not result.items and query.page > 1:
+            raise PageOutOfRangeError("No hay reseñas disponibles para la página solicitada")
+
+        if result.items and result.has_more:
+            result.next_cursor = self._encode_cursor(result.items[-1])
+        return result
+
+    def list_reviews_by_cursor(
+        self, query: ListReviewsByCursorQuery
+    ) -> CursorPaginatedResult[Review]:
+        if query.page_size <= 0 or query.page_size > 100:
+            raise InvalidPaginationError("page_size must be between 1 and 100")
+
+        after = self._decode_cursor(query.cursor) if query.cursor else None
+        # One extra row tells us whether another page exists without a COUNT(*).
+        items = list(
+            self.repository.list_by_record_after(
+                record_id=query.record_id,
+                limit=query.page_size + 1,
+                after=after,
+                include_images=query.include_images,
+            )
+        )
+        next_cursor = None
+        if len(items) > query.page_size:
+            items = items[: query.page_size]
+            next_cursor = self._encode_cursor(items[-1])
+        return CursorPaginatedResult(
+            items=items, page_size=query.page_size, next_cursor=next_cursor
         )
 
-    def get_review(self, review_id: int) -> Review:
-        review = self.repository.get(review_id)
+    def export_reviews(self, record_id: int | None = None) -> Iterator[Review]:
+        return self.repository.iter_all(record_id=record_id)
+
+    def get_review(self, review_id: int, *, include_images: bool = True) -> Review:
+        review = self.repository.get(review_id, include_images=include_images)
         if review is None:
             raise ReviewNotFoundError(f"Review {review_id} was not found")
         return review
 
+    def get_review_version(self, review_id: int) -> datetime | None:
+        """``updated_at`` of the review, or ``None`` if it does not exist."""
+        return self.repository.get_updated_at(review_id)
+
     def update_review(self, dto: UpdateReviewDTO) -> Review:
         if (
             dto.title is None
@@ -102,31 +166,30 @@ class ReviewService:
         if dto.images is not None:
             self._validate_images(dto.images)
 
-        review = self.repository.get(dto.review_id)
+        changes = ReviewChanges(
+            title=dto.title.strip() if dto.title is not None else None,
+            email=dto.email.strip() if dto.email is not None else None,
+            body=dto.body.strip() if dto.body is not None else None,
+            rating=dto.rating,
+            image_urls=(
+                tuple(image.strip() for image in dto.images) if dto.images is not None else None
+            ),
+        )
+        review = self.repository.update(dto.review_id, changes)
         if review is None:
             raise ReviewNotFoundError(f"Review {dto.review_id} was not found")
-
-        if dto.title is not None:
-            review.title = dto.title.strip() if dto.title is not None else None
-        if dto.email is not None:
-            review.email = dto.email.strip()
-        if dto.body is not None:
-            review.body = dto.body.strip()
         if dto.rating is not None:
-            review.rating = dto.rating
-        replace_images = dto.images is not None
-        if replace_images:
-            review.images = [ReviewImage(image_url=image.strip()) for image in dto.images or []]
-
-        return self.repository.save(review, replace_images=replace_images)
+            self._record_stats_changed(review.record_id)
+        return review
 
     def delete_review(self, review_id: int) -> None:
         try:
-            self.repository.delete(review_id)
+            record_id = self.repository.delete(review_id)
         except ReviewNotFoundError:
             raise
         except ReviewPersistenceError:
             raise
+        self._record_stats_changed(record_id)
 
     def add_review_image(self, review_id: int, image_url: str) -> ReviewImage:
         self._validate_images([image_url])
@@ -135,66 +198,45 @@ class ReviewService:
     def delete_review_image(self, review_id: int, image_id: int) -> None:
         self.repository.delete_image(review_id, image_id)
 
-    def _notify_review_created(self, review: Review) -> None:
-        if self.email_sender is None:
+    def _record_stats_changed(self, record_id: int) -> None:
+        if self.on_record_stats_changed is not None:
+            self.on_record_stats_changed(record_id)
+
+    def _enqueue_review_created(self, review: Review, *, locale: str | None = None) -> None:
+        if self.email_outbox is None:
             logger.warning(
-                "Email sender no configurado; omitiendo envio de correo de reseña. review_id=%s",
-                review.id,
+                "Email outbox no configurado; omitiendo correo de reseña. record_id=%s",
+                review.record_id,
             )
             return
 
-        title_line = review.title if review.title else "Sin título"
-        subject = "¡Gracias por tu reseña en Rentview!"
-        plain_body = (
-            "Hola,\n\n"
-            "Hemos recibido tu reseña y la estamos revisando.\n\n"
-            "Resumen:\n"
-            f"- Título: {title_line}\n"
-            f"- Calificación: {review.rating}/5\n"
-            f"- Comentario: {review.body.strip()}\n\n"
-            "Gracias por compartir tu experiencia y ayudar a la comunidad.\n"
-        )
-
-        html_body = f"""
-        <html>
-          <body style="background:#f6f7fb;padding:24px;font-family:Helvetica,Arial,sans-serif;color:#1f2d3d;">
-            <table role="presentation" width="100%%" cellspacing="0" cellpadding="0" style="max-width:640px;margin:0 auto;background:white;border-radius:12px;box-shadow:0 8px 24px rgba(31,45,61,0.08);">
-              <tr>
-                <td style="padding:24px 28px;">
-                  <h1 style="margin:0 0 12px;font-size:22px;color:#111827;">¡Gracias por tu reseña!</h1>
-                  <p style="margin:0 0 16px;font-size:15px;line-height:1.6;color:#4b5563;">
-                    Hemos recibido tu reseña y la estamos revisando. Apreciamos que compartas tu experiencia.
-                  </p>
-                  <div style="border:1px solid #e5e7eb;border-radius:10px;padding:16px 18px;background:#f9fafb;margin-bottom:16px;">
-                    <p style="margin:0 0 8px;font-weight:600;color:#111827;">Resumen</p>
-                    <p style="margin:4px 0;font-size:14px;color:#374151;"><strong>Título:</strong> {title_line}</p>
-                    <p style="margin:4px 0;font-size:14px;color:#374151;"><strong>Calificación:</strong> {review.rating}/5</p>
-                    <p style="margin:8px 0 0;font-size:14px;color:#374151;line-height:1.5;"><strong>Comentario:</strong> {review.body.strip()}</p>
-                  </div>
-                  <p style="margin:0;font-size:14px;line-height:1.6;color:#4b5563;">Atentamente, el equipo de RentView</p>
-                </td>
-              </tr>
-            </table>
-          </body>
-        </html>
-        """
-        message = EmailMessage(
+        message = self.email_templates.render(
+            "review_created",
+            {"title": review.title, "rating": review.rating, "body": review.body},
             to=review.email,
-            subject=subject,
-            body=plain_body,
-            html_body=html_body,
+            locale=locale,
         )
+        try:
+            self.email_outbox.enqueue(message)
+        except EmailOutboxError as exc:
+            raise ReviewPersistenceError("Error al crear la reseña") from exc
+
+    @staticmethod
+    def _encode_cursor(review: Review) -> str | None:
+        if review.id is None or review.created_at is None:
+            return None
+        return encode_cursor({"created_at": review.created_at.isoformat(), "id": review.id})
 
+    @staticmethod
+    def _decode_cursor(cursor: str) -> ReviewCursor:
         try:
-            self.email_sender.send(message)
-            logger.info(
-                "Correo de confirmacion de reseña enviado. review_id=%s to=%s subject=%s",
-                review.id,
-                review.email,
-                subject,
+            payload = decode_cursor(cursor)
+            return ReviewCursor(
+                created_at=datetime.fromisoformat(str(payload["created_at"])),
+                id=int(payload["id"]),
             )
-        except EmailDeliveryError:
-            logger.exception("Fallo el envío del correo de confirmación de reseña")
+        except (InvalidCursorError, KeyError, TypeError, ValueError) as exc:
+            raise InvalidPaginationError("El cursor de paginación no es válido") from exc
 
     @staticmethod
     def _validate_body(body: str) -> None:
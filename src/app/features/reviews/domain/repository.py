@@ -1,25 +1,52 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from datetime import datetime
 from typing import Protocol
 
-from app.features.reviews.domain.review import Review, ReviewImage
+from app.features.reviews.domain.review import Review, ReviewChanges, ReviewCursor, ReviewImage
+from app.shared.domain.pagination import CountMode
 
 
 class ReviewRepository(Protocol):
     """Contract for persisting and retrieving reviews."""
 
-    def record_exists(self, record_id: int) -> bool: ...
-
-    def create(self, review: Review) -> Review: ...
+    def create(self, review: Review) -> Review:
+        """Persist the review; raises ``RecordNotFoundError`` if the record is not live."""
+        ...
 
     def list_by_record(
-        self, *, record_id: int, limit: int, offset: int
-    ) -> tuple[Sequence[Review], int]: ...
-
-    def get(self, review_id: int) -> Review | None: ...
-
-    def save(self, review: Review, *, replace_images: bool = False) -> Review: ...
-
-    def delete(self, review_id: int) -> None: ...
+        self,
+        *,
+        record_id: int,
+        limit: int,
+        offset: int,
+        include_images: bool = True,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[Review], int | None]:
+        """One page and its total; raises ``RecordNotFoundError`` if the record is not live."""
+        ...
+
+    def list_by_record_after(
+        self,
+        *,
+        record_id: int,
+        limit: int,
+        after: ReviewCursor | None = None,
+        include_images: bool = True,
+    ) -> Sequence[Review]:
+        """Reviews older than ``after``; raises ``RecordNotFoundError`` if the record is not live."""
+        ...
+
+    def get(self, review_id: int, *, include_images: bool = True) -> Review | None: ...
+
+    def get_updated_at(self, review_id: int) -> datetime | None: ...
+
+    def iter_all(self, *, record_id: int | None = None) -> Iterator[Review]: ...
+
+    def update(self, review_id: int, changes: ReviewChanges) -> Review | None: ...
+
+    def delete(self, review_id: int) -> int:
+        """Delete the review and return the id of the record it belonged to."""
+        ...
 
     def add_image(self, review_id: int, image_url: str) -> ReviewImage: ...
 
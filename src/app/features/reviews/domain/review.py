@@ -25,3 +25,22 @@ class Review:
     title: str | None = None
     created_at: datetime | None = None
     updated_at: datetime | None = None
+
+
+@dataclass(slots=True)
+class ReviewChanges:
+    """Partial update: ``None`` leaves a column as is; ``image_urls`` replaces the set."""
+
+    title: str | None = None
+    email: str | None = None
+    body: str | None = None
+    rating: int | None = None
+    image_urls: tuple[str, ...] | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class ReviewCursor:
+    """Keyset position in a record's ``(created_at DESC, id DESC)`` review order."""
+
+    created_at: datetime
+    id: int
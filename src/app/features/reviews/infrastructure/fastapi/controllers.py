@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, Query, status
+from fastapi import Depends, Header, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator, model_validator
 from sqlalchemy.orm import Session
 
-from app.features.reviews.application.dtos import CreateReviewDTO, ListReviewsQuery, UpdateReviewDTO
+from app.features.records.infrastructure.record_cache import invalidate_cached_record
+from app.features.reviews.application.dtos import (
+    CreateReviewDTO,
+    ListReviewsByCursorQuery,
+    ListReviewsQuery,
+    UpdateReviewDTO,
+)
 from app.features.reviews.application.mappers import to_review_dto
 from app.features.reviews.application.services import ReviewService
 from app.features.reviews.domain.exceptions import (
@@ -22,17 +29,47 @@ from app.features.reviews.domain.exceptions import (
     ReviewNotFoundError,
     ReviewPersistenceError,
 )
+from app.features.reviews.domain.review import Review
 from app.features.reviews.infrastructure.repository import SqlAlchemyReviewRepository
-from app.shared.domain.pagination import PageOutOfRangeError
+from app.shared.domain.pagination import CountMode, PageOutOfRangeError
+from app.shared.infrastructure.conditional import (
+    has_conditional_headers,
+    is_not_modified,
+    item_validators,
+    not_modified_response,
+    page_validators,
+    with_validators,
+)
 from app.shared.infrastructure.database import get_db
-from app.shared.infrastructure.email.factory import get_email_sender
-from app.shared.infrastructure.pagination import PaginationMeta
+from app.shared.infrastructure.email.factory import get_email_outbox
+from app.shared.infrastructure.export import CSV_LIST_SEPARATOR, ExportFormat, streaming_export
+from app.shared.infrastructure.fields import (
+    parse_fields,
+    sparse_item_response,
+    sparse_page_response,
+)
+from app.shared.infrastructure.pagination import CursorPaginationMeta, PaginationMeta
+
+REVIEW_EXPORT_COLUMNS = (
+    "id",
+    "record_id",
+    "title",
+    "email",
+    "body",
+    "rating",
+    "images",
+    "created_at",
+    "updated_at",
+)
 
 
 def get_review_service(db: Session = Depends(get_db)) -> ReviewService:
     repository = SqlAlchemyReviewRepository(db)
-    email_sender = get_email_sender()
-    return ReviewService(repository, email_sender=email_sender)
+    return ReviewService(
+        repository,
+        email_outbox=get_email_outbox(db),
+        on_record_stats_changed=invalidate_cached_record,
+    )
 
 
 class ReviewImageResponse(BaseModel):
@@ -74,6 +111,22 @@ class PaginatedReviewsResponse(BaseModel):
     model_config = ConfigDict(populate_by_name=True)
 
 
+class CursorPaginatedReviewsResponse(BaseModel):
+    items: list[ReviewResponse]
+    meta: CursorPaginationMeta
+
+    model_config = ConfigDict(populate_by_name=True)
+
+
+def review_fields(
+    fields: Annotated[
+        str | None,
+        Query(description="Campos a devolver separados por coma (`fields=id,rating,body`)"),
+    ] = None,
+) -> frozenset[str] | None:
+    return parse_fields(fields, ReviewResponse.model_fields)
+
+
 class ReviewCreateRequest(BaseModel):
     record_id: int = Field(gt=0)
     title: str | None = Field(default=None, max_length=120)
@@ -163,8 +216,18 @@ class ReviewUpdateRequest(BaseModel):
         return [image.strip() for image in value]
 
 
+def _preferred_locale(accept_language: str | None) -> str | None:
+    """First language tag of ``Accept-Language`` (``"en-US,en;q=0.9"`` -> ``"en-US"``)."""
+    if not accept_language:
+        return None
+    tag = accept_language.split(",")[0].split(";")[0].strip()
+    return tag if tag and tag != "*" else None
+
+
 def create_review(
-    payload: ReviewCreateRequest, service: ReviewService = Depends(get_review_service)
+    payload: ReviewCreateRequest,
+    service: ReviewService = Depends(get_review_service),
+    accept_language: Annotated[str | None, Header()] = None,
 ) -> ReviewResponse:
     try:
         dto = CreateReviewDTO(
@@ -174,6 +237,7 @@ def create_review(
             body=payload.body,
             rating=payload.rating,
             images=payload.images,
+            locale=_preferred_locale(accept_language),
         )
         review = service.create_review(dto)
     except RecordNotFoundError:
@@ -201,13 +265,54 @@ def create_review(
 
 def list_reviews_for_record(
     record_id: int,
+    request: Request,
     page: Annotated[int, Query(ge=1)] = 1,
     page_size: Annotated[int, Query(ge=1, le=100)] = 20,
+    cursor: Annotated[
+        str | None,
+        Query(description="Cursor opaco (`meta.nextCursor`); si se envía, se ignora `page`"),
+    ] = None,
+    count: Annotated[
+        CountMode,
+        Query(description="Cálculo de `total`: exacto, estimado por el planificador o ninguno"),
+    ] = CountMode.EXACT,
+    fields: frozenset[str] | None = Depends(review_fields),
     service: ReviewService = Depends(get_review_service),
-) -> PaginatedReviewsResponse:
+) -> Response:
+    include_images = fields is None or "images" in fields
+    response: PaginatedReviewsResponse | CursorPaginatedReviewsResponse
     try:
-        query = ListReviewsQuery(record_id=record_id, page=page, page_size=page_size)
-        result = service.list_reviews(query)
+        if cursor is not None:
+            cursor_result = service.list_reviews_by_cursor(
+                ListReviewsByCursorQuery(
+                    record_id=record_id,
+                    page_size=page_size,
+                    cursor=cursor,
+                    include_images=include_images,
+                )
+            )
+            response = CursorPaginatedReviewsResponse(
+                items=[_review_response(review) for review in cursor_result.items],
+                meta=CursorPaginationMeta(
+                    page_size=cursor_result.page_size,
+                    next_cursor=cursor_result.next_cursor,
+                    has_more=cursor_result.has_more,
+                ),
+            )
+        else:
+            result = service.list_reviews(
+                ListReviewsQuery(
+                    record_id=record_id,
+                    page=page,
+                    page_size=page_size,
+                    include_images=include_images,
+                    count_mode=count,
+                )
+            )
+            response = PaginatedReviewsResponse(
+                items=[_review_response(review) for review in result.items],
+                meta=PaginationMeta.from_result(result),
+            )
     except RecordNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -224,22 +329,58 @@ def list_reviews_for_record(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="No se pudieron listar las reseñas",
         ) from exc
-    return PaginatedReviewsResponse(
-        items=[ReviewResponse.model_validate(to_review_dto(review)) for review in result.items],
-        meta=PaginationMeta(
-            page=result.page,
-            page_size=result.page_size,
-            total=result.total,
-            total_pages=result.total_pages,
-        ),
+    validators = page_validators(
+        "reviews",
+        [(item.id, item.updated_at) for item in response.items],
+        response.meta.model_dump(),
     )
+    if is_not_modified(request, validators):
+        return not_modified_response(validators)
+    payload = sparse_page_response(response, fields) if fields is not None else response
+    return with_validators(payload, validators)
+
+
+def _review_response(review: Review) -> ReviewResponse:
+    return ReviewResponse.model_validate(to_review_dto(review))
+
+
+def export_reviews(
+    record_id: Annotated[int | None, Query(gt=0)] = None,
+    export_format: Annotated[ExportFormat, Query(alias="format")] = ExportFormat.NDJSON,
+    service: ReviewService = Depends(get_review_service),
+) -> StreamingResponse:
+    reviews = service.export_reviews(record_id=record_id)
+    to_row = _review_csv_row if export_format is ExportFormat.CSV else _review_json_row
+    return streaming_export(
+        (to_row(review) for review in reviews),
+        export_format=export_format,
+        csv_columns=REVIEW_EXPORT_COLUMNS,
+        filename="reviews",
+    )
+
+
+def _review_json_row(review: Review) -> dict[str, Any]:
+    return ReviewResponse.model_validate(to_review_dto(review)).model_dump(mode="json")
+
+
+def _review_csv_row(review: Review) -> dict[str, Any]:
+    row = _review_json_row(review)
+    row["images"] = CSV_LIST_SEPARATOR.join(image["image_url"] for image in row["images"])
+    return row
 
 
 def get_review(
-    review_id: int, service: ReviewService = Depends(get_review_service)
-) -> ReviewResponse:
+    review_id: int,
+    request: Request,
+    fields: frozenset[str] | None = Depends(review_fields),
+    service: ReviewService = Depends(get_review_service),
+) -> Response:
+    if has_conditional_headers(request):
+        validators = item_validators("review", review_id, service.get_review_version(review_id))
+        if validators is not None and is_not_modified(request, validators):
+            return not_modified_response(validators)
     try:
-        review = service.get_review(review_id)
+        review = service.get_review(review_id, include_images=fields is None or "images" in fields)
     except ReviewNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -250,7 +391,9 @@ def get_review(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="No se pudo obtener la reseña",
         ) from exc
-    return ReviewResponse.model_validate(to_review_dto(review))
+    response = ReviewResponse.model_validate(to_review_dto(review))
+    payload = sparse_item_response(response, fields) if fields is not None else response
+    return with_validators(payload, item_validators("review", review_id, review.updated_at))
 
 
 def update_review(
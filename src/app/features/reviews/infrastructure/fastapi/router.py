@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import StreamingResponse
 
 from app.features.reviews.infrastructure.fastapi import controllers
 
@@ -12,11 +13,19 @@ reviews_router.add_api_route(
     status_code=201,
     summary="Crear una nueva reseña",
 )
+reviews_router.add_api_route(
+    ":export",
+    controllers.export_reviews,
+    methods=["GET"],
+    response_class=StreamingResponse,
+    summary="Exportar reseñas en streaming (NDJSON o CSV)",
+)
 reviews_router.add_api_route(
     "/records/{record_id}",
     controllers.list_reviews_for_record,
     methods=["GET"],
-    response_model=controllers.PaginatedReviewsResponse,
+    response_model=controllers.PaginatedReviewsResponse
+    | controllers.CursorPaginatedReviewsResponse,
     summary="Listar reseñas de una vivienda",
 )
 reviews_router.add_api_route(
@@ -1,9 +1,18 @@
+from collections.abc import Sequence
+
 from app.features.reviews.domain.review import Review, ReviewImage
 from app.features.reviews.infrastructure.models import ReviewImageModel, ReviewModel
 
 
-def review_model_to_domain(model: ReviewModel) -> Review:
-    """Map a persistence ReviewModel to the domain Review entity."""
+def review_model_to_domain(
+    model: ReviewModel, images: Sequence[ReviewImageModel] | None = None
+) -> Review:
+    """Map a persistence ReviewModel to the domain Review entity.
+
+    ``images`` replaces ``model.images``, e.g. ``()`` when the relationship was not loaded.
+    """
+    if images is None:
+        images = model.images or []
     return Review(
         id=model.id,
         record_id=model.record_id,
@@ -11,15 +20,7 @@ def review_model_to_domain(model: ReviewModel) -> Review:
         email=model.email,
         body=model.body,
         rating=model.rating,
-        images=[
-            ReviewImage(
-                id=image.id,
-                review_id=image.review_id,
-                image_url=image.image_url,
-                created_at=image.created_at,
-            )
-            for image in model.images or []
-        ],
+        images=[review_image_model_to_domain(image) for image in images],
         created_at=model.created_at,
         updated_at=model.updated_at,
     )
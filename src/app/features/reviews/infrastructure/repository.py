@@ -1,10 +1,14 @@
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+from typing import Any
 
 from psycopg.errors import ForeignKeyViolation
-from sqlalchemy import func, select, text
+from sqlalchemy import Select, func, null, select, text, true, tuple_, update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm import Session, aliased, raiseload, selectinload
+from sqlalchemy.orm.strategy_options import _AbstractLoad
 
+from app.features.records.infrastructure.persistence.models import RecordModel
 from app.features.reviews.domain.exceptions import (
     RecordNotFoundError,
     ReviewDeletionError,
@@ -13,12 +17,65 @@ from app.features.reviews.domain.exceptions import (
     ReviewPersistenceError,
 )
 from app.features.reviews.domain.repository import ReviewRepository
-from app.features.reviews.domain.review import Review, ReviewImage
+from app.features.reviews.domain.review import Review, ReviewChanges, ReviewCursor, ReviewImage
 from app.features.reviews.infrastructure.mappers import (
     review_image_model_to_domain,
     review_model_to_domain,
 )
 from app.features.reviews.infrastructure.models import ReviewImageModel, ReviewModel
+from app.shared.domain.pagination import CountMode
+from app.shared.infrastructure.counting import estimate_rows
+from app.shared.infrastructure.images import replace_images
+
+EXPORT_YIELD_PER = 1_000
+
+
+def _images_loader(include_images: bool, entity: type[ReviewModel] = ReviewModel) -> _AbstractLoad:
+    # Without images the relationship is never loaded: callers map with ``images=()``, and
+    # raiseload turns any stray access into an error instead of a query per review.
+    return selectinload(entity.images) if include_images else raiseload(entity.images)
+
+
+def _of_live_record[T: tuple[Any, ...]](stmt: Select[T]) -> Select[T]:
+    # Reviews of a soft-deleted record stay in place until the purge job removes them.
+    return stmt.join(RecordModel, RecordModel.id == ReviewModel.record_id).where(
+        RecordModel.deleted_at.is_(None)
+    )
+
+
+# One round trip per review: the stats UPDATE doubles as the liveness check (no row back means
+# the record is missing or soft-deleted, and nothing was written), then the review and all its
+# images are inserted from it. The FK still guards against a concurrent hard delete.
+_CREATE_REVIEW = text(
+    """
+    WITH live_record AS (
+        UPDATE records
+        SET reviews_count = reviews_count + 1,
+            rating_sum = rating_sum + :rating,
+            updated_at = now()
+        WHERE id = :record_id AND deleted_at IS NULL
+        RETURNING id
+    ), new_review AS (
+        INSERT INTO reviews (record_id, title, email, body, rating)
+        SELECT id, :title, :email, :body, :rating
+        FROM live_record
+        RETURNING id, record_id, title, email, body, rating, created_at, updated_at
+    ), new_images AS (
+        INSERT INTO review_images (review_id, image_url)
+        SELECT new_review.id, image.url
+        FROM new_review
+        CROSS JOIN unnest(CAST(:image_urls AS TEXT[])) WITH ORDINALITY AS image(url, position)
+        ORDER BY image.position
+        RETURNING id, image_url, created_at
+    )
+    SELECT
+        new_review.*,
+        ARRAY(SELECT id FROM new_images ORDER BY id) AS image_ids,
+        ARRAY(SELECT image_url FROM new_images ORDER BY id) AS image_urls,
+        ARRAY(SELECT created_at FROM new_images ORDER BY id) AS image_created_at
+    FROM new_review
+    """
+)
 
 
 class SqlAlchemyReviewRepository(ReviewRepository):
@@ -27,32 +84,21 @@ class SqlAlchemyReviewRepository(ReviewRepository):
     def __init__(self, session: Session) -> None:
         self.session = session
 
-    def record_exists(self, record_id: int) -> bool:
-        stmt = text("SELECT 1 FROM records WHERE id = :record_id LIMIT 1")
-        try:
-            result = self.session.execute(stmt, {"record_id": record_id})
-            return result.scalar_one_or_none() is not None
-        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
-            self.session.rollback()
-            raise ReviewPersistenceError("Error verificando la existencia del record") from exc
-
     def create(self, review: Review) -> Review:
-        model = ReviewModel(
-            record_id=review.record_id,
-            title=review.title,
-            email=review.email,
-            body=review.body,
-            rating=review.rating,
-        )
-        if review.images:
-            model.images = [
-                ReviewImageModel(image_url=image.image_url.strip()) for image in review.images
-            ]
-        self.session.add(model)
+        params = {
+            "record_id": review.record_id,
+            "title": review.title,
+            "email": review.email,
+            "body": review.body,
+            "rating": review.rating,
+            "image_urls": [image.image_url.strip() for image in review.images],
+        }
         try:
+            row = self.session.execute(_CREATE_REVIEW, params).one_or_none()
+            if row is None:
+                self.session.rollback()
+                raise RecordNotFoundError(f"Record {review.record_id} does not exist")
             self.session.commit()
-            self.session.refresh(model)
-            return review_model_to_domain(model)
         except IntegrityError as exc:
             self.session.rollback()
             self._handle_integrity_error(exc, record_id=review.record_id)
@@ -60,72 +106,192 @@ class SqlAlchemyReviewRepository(ReviewRepository):
         except SQLAlchemyError as exc:  # pragma: no cover - DB failure
             self.session.rollback()
             raise ReviewPersistenceError("Error al crear la reseña") from exc
+        return Review(
+            id=row.id,
+            record_id=row.record_id,
+            title=row.title,
+            email=row.email,
+            body=row.body,
+            rating=row.rating,
+            images=[
+                ReviewImage(id=image_id, review_id=row.id, image_url=url, created_at=created_at)
+                for image_id, url, created_at in zip(
+                    row.image_ids, row.image_urls, row.image_created_at, strict=True
+                )
+            ],
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+        )
 
     def list_by_record(
-        self, *, record_id: int, limit: int, offset: int
-    ) -> tuple[Sequence[Review], int]:
+        self,
+        *,
+        record_id: int,
+        limit: int,
+        offset: int,
+        include_images: bool = True,
+        count_mode: CountMode = CountMode.EXACT,
+    ) -> tuple[Sequence[Review], int | None]:
         stmt = (
             select(ReviewModel)
-            .options(selectinload(ReviewModel.images))
             .where(ReviewModel.record_id == record_id)
-            .order_by(ReviewModel.created_at.desc())
+            .order_by(ReviewModel.created_at.desc(), ReviewModel.id.desc())
             .offset(offset)
             .limit(limit)
         )
+        total_stmt = None
+        if count_mode is CountMode.EXACT:
+            total_stmt = select(func.count()).where(ReviewModel.record_id == record_id)
         try:
-            models = self.session.scalars(stmt).all()
-
-            total_stmt = select(func.count()).select_from(
-                select(ReviewModel.id).where(ReviewModel.record_id == record_id).subquery()
+            reviews, total = self._page_of_live_record(
+                record_id, stmt, include_images=include_images, total_stmt=total_stmt
             )
-            total = self.session.scalar(total_stmt) or 0
+            if count_mode is CountMode.ESTIMATED:
+                rows_stmt = select(ReviewModel.id).where(ReviewModel.record_id == record_id)
+                total = estimate_rows(self.session, rows_stmt)
+            return reviews, total
+        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
+            self.session.rollback()
+            raise ReviewPersistenceError("Error al listar reseñas") from exc
 
-            return [review_model_to_domain(model) for model in models], int(total)
+    def list_by_record_after(
+        self,
+        *,
+        record_id: int,
+        limit: int,
+        after: ReviewCursor | None = None,
+        include_images: bool = True,
+    ) -> Sequence[Review]:
+        stmt = (
+            select(ReviewModel)
+            .where(ReviewModel.record_id == record_id)
+            .order_by(ReviewModel.created_at.desc(), ReviewModel.id.desc())
+            .limit(limit)
+        )
+        if after is not None:
+            # Row-value comparison seeks on idx_reviews_record_created, so every page costs the
+            # same however deep it is.
+            stmt = stmt.where(
+                tuple_(ReviewModel.created_at, ReviewModel.id) < (after.created_at, after.id)
+            )
+        try:
+            reviews, _ = self._page_of_live_record(record_id, stmt, include_images=include_images)
+            return reviews
         except SQLAlchemyError as exc:  # pragma: no cover - DB failure
             self.session.rollback()
             raise ReviewPersistenceError("Error al listar reseñas") from exc
 
-    def get(self, review_id: int) -> Review | None:
+    def get(self, review_id: int, *, include_images: bool = True) -> Review | None:
         try:
-            model = self.session.get(
-                ReviewModel,
-                review_id,
-                options=(selectinload(ReviewModel.images),),
-            )
-            return review_model_to_domain(model) if model else None
+            model = self.session.scalars(
+                _of_live_record(select(ReviewModel))
+                .where(ReviewModel.id == review_id)
+                .options(_images_loader(include_images))
+            ).one_or_none()
+            if model is None:
+                return None
+            return review_model_to_domain(model, images=None if include_images else ())
         except SQLAlchemyError as exc:  # pragma: no cover - DB failure
             self.session.rollback()
             raise ReviewPersistenceError("Error al obtener la reseña") from exc
 
-    def save(self, review: Review, *, replace_images: bool = False) -> Review:
-        model = self.session.get(ReviewModel, review.id)
-        if model is None:
-            raise ReviewNotFoundError(f"Review {review.id} was not found")
+    def get_updated_at(self, review_id: int) -> datetime | None:
+        # Version probe for conditional GETs: one narrow row, no images.
+        return self.session.scalar(
+            _of_live_record(select(ReviewModel.updated_at)).where(ReviewModel.id == review_id)
+        )
+
+    def iter_all(self, *, record_id: int | None = None) -> Iterator[Review]:
+        # yield_per streams through a server-side cursor; images are selectin-loaded per batch.
+        stmt = (
+            _of_live_record(select(ReviewModel))
+            .options(selectinload(ReviewModel.images))
+            .order_by(ReviewModel.id)
+            .execution_options(yield_per=EXPORT_YIELD_PER)
+        )
+        if record_id is not None:
+            stmt = stmt.where(ReviewModel.record_id == record_id)
+        try:
+            for model in self.session.scalars(stmt):
+                yield review_model_to_domain(model)
+        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
+            self.session.rollback()
+            raise ReviewPersistenceError("Error al exportar reseñas") from exc
 
-        model.title = review.title
-        model.email = review.email
-        model.body = review.body
-        model.rating = review.rating
-        if replace_images:
-            model.images.clear()
-            for image in review.images:
-                model.images.append(ReviewImageModel(image_url=image.image_url.strip()))
+    def update(self, review_id: int, changes: ReviewChanges) -> Review | None:
+        values: dict[str, Any] = {
+            column: value
+            for column, value in (
+                ("title", changes.title),
+                ("email", changes.email),
+                ("body", changes.body),
+                ("rating", changes.rating),
+            )
+            if value is not None
+        }
+        values["updated_at"] = func.now()
 
+        # One statement updates the review, returns it, and shifts the record's rating_sum by
+        # the rating delta; data-modifying CTEs all run even though only ``updated`` is read.
+        # A review of a soft-deleted record matches nothing, so neither row is written.
+        previous = (
+            _of_live_record(select(ReviewModel.id, ReviewModel.rating.label("previous_rating")))
+            .where(ReviewModel.id == review_id)
+            .with_for_update(of=ReviewModel)
+            .cte("previous")
+        )
+        updated = (
+            update(ReviewModel)
+            .where(ReviewModel.id == previous.c.id)
+            .values(**values)
+            .returning(
+                *ReviewModel.__table__.c,
+                (ReviewModel.rating - previous.c.previous_rating).label("rating_delta"),
+            )
+            .cte("updated")
+        )
+        adjust_stats = (
+            update(RecordModel)
+            .where(RecordModel.id == updated.c.record_id, updated.c.rating_delta != 0)
+            .values(rating_sum=RecordModel.rating_sum + updated.c.rating_delta)
+            .cte("adjust_stats")
+        )
+        stmt = select(*(column for column in updated.c if column.name != "rating_delta"))
         try:
+            row = self.session.execute(stmt.add_cte(adjust_stats)).mappings().one_or_none()
+            if row is None:
+                self.session.rollback()
+                return None
+
+            if changes.image_urls is None:
+                images = self.session.scalars(
+                    select(ReviewImageModel)
+                    .where(ReviewImageModel.review_id == review_id)
+                    .order_by(ReviewImageModel.id)
+                ).all()
+            else:
+                images = replace_images(
+                    self.session, ReviewImageModel, "review_id", review_id, changes.image_urls
+                )
+            review = Review(
+                **row,
+                images=[review_image_model_to_domain(image) for image in images],
+            )
             self.session.commit()
-            self.session.refresh(model)
-            return review_model_to_domain(model)
+            return review
         except SQLAlchemyError as exc:  # pragma: no cover - DB failure
             self.session.rollback()
             raise ReviewPersistenceError("Error al actualizar la reseña") from exc
 
-    def delete(self, review_id: int) -> None:
+    def delete(self, review_id: int) -> int:
         try:
             model = self.session.get(ReviewModel, review_id)
             if model is None:
                 raise ReviewNotFoundError(f"Review {review_id} was not found")
+            self._adjust_record_stats(model.record_id, count_delta=-1, rating_delta=-model.rating)
             self.session.delete(model)
             self.session.commit()
+            return model.record_id
         except ReviewNotFoundError:
             raise
         except SQLAlchemyError as exc:  # pragma: no cover - DB failure
@@ -140,6 +306,7 @@ class SqlAlchemyReviewRepository(ReviewRepository):
         image_model = ReviewImageModel(review_id=review_id, image_url=image_url)
         self.session.add(image_model)
         try:
+            self._touch(review_id)
             self.session.commit()
             self.session.refresh(image_model)
             return review_image_model_to_domain(image_model)
@@ -158,6 +325,7 @@ class SqlAlchemyReviewRepository(ReviewRepository):
                     f"Image {image_id} for review {review_id} was not found"
                 )
             self.session.delete(image)
+            self._touch(review_id)
             self.session.commit()
         except ReviewImageNotFoundError:
             raise
@@ -165,6 +333,63 @@ class SqlAlchemyReviewRepository(ReviewRepository):
             self.session.rollback()
             raise ReviewDeletionError("Error al eliminar la imagen de la reseña") from exc
 
+    def _touch(self, review_id: int) -> None:
+        # Images are part of the review's representation, so they move its ETag/Last-Modified.
+        self.session.execute(
+            update(ReviewModel).where(ReviewModel.id == review_id).values(updated_at=func.now())
+        )
+
+    def _page_of_live_record(
+        self,
+        record_id: int,
+        page_stmt: Select[tuple[ReviewModel]],
+        *,
+        include_images: bool,
+        total_stmt: Select[tuple[int]] | None = None,
+    ) -> tuple[list[Review], int | None]:
+        """Run a page of the record's reviews, and optionally its COUNT, in the same query that
+        checks the record is live: ``records LEFT JOIN page`` yields one all-NULL row for a
+        record without reviews and none at all for a missing or soft-deleted one.
+        """
+        page = page_stmt.subquery("review_page")
+        review = aliased(ReviewModel, page)
+        # A NULL stands in for the count when none was asked for, so every row has one shape.
+        total_column = total_stmt.scalar_subquery() if total_stmt is not None else null()
+        stmt = (
+            select(RecordModel.id, review, total_column)
+            .select_from(RecordModel)
+            .outerjoin(page, true())
+            .where(RecordModel.id == record_id, RecordModel.deleted_at.is_(None))
+            .order_by(review.created_at.desc(), review.id.desc())
+            .options(_images_loader(include_images, review))
+        )
+        rows = self.session.execute(stmt).all()
+        if not rows:
+            raise RecordNotFoundError(f"Record {record_id} does not exist")
+        images = None if include_images else ()
+        reviews = [
+            review_model_to_domain(row[1], images=images) for row in rows if row[1] is not None
+        ]
+        total = rows[0][2]
+        return reviews, int(total) if total is not None else None
+
+    def _adjust_record_stats(self, record_id: int, *, count_delta: int, rating_delta: int) -> None:
+        """Apply an in-place delta to the denormalized review stats on ``records``.
+
+        Runs inside the caller's transaction so the counters commit or roll back with the
+        review write itself.
+        """
+        stmt = (
+            update(RecordModel)
+            .where(RecordModel.id == record_id)
+            .values(
+                reviews_count=RecordModel.reviews_count + count_delta,
+                rating_sum=RecordModel.rating_sum + rating_delta,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        self.session.execute(stmt)
+
     @staticmethod
     def _handle_integrity_error(exc: IntegrityError, *, record_id: int) -> None:
         if (
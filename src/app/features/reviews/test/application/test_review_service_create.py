@@ -1,19 +1,25 @@
+from collections.abc import Callable
 from unittest.mock import Mock
 
 import pytest
 
 from app.features.reviews.application.dtos import CreateReviewDTO
 from app.features.reviews.application.services import ReviewService
-from app.features.reviews.domain.exceptions import InvalidReviewImageError, RecordNotFoundError
+from app.features.reviews.domain.exceptions import (
+    InvalidReviewImageError,
+    RecordNotFoundError,
+    ReviewPersistenceError,
+)
+from app.features.reviews.domain.review import Review
+from app.shared.application.email import EmailOutboxError
 
 
 def test_create_review_persists_and_notifies(make_review) -> None:
     repository = Mock()
-    repository.record_exists.return_value = True
     created_review = make_review(id=42)
     repository.create.return_value = created_review
-    email_sender = Mock()
-    service = ReviewService(repository, email_sender=email_sender)
+    email_outbox = Mock()
+    service = ReviewService(repository, email_outbox=email_outbox)
 
     dto = CreateReviewDTO(
         record_id=1,
@@ -27,19 +33,19 @@ def test_create_review_persists_and_notifies(make_review) -> None:
     result = service.create_review(dto)
 
     assert result is created_review
-    repository.record_exists.assert_called_once_with(1)
     repository.create.assert_called_once()
     saved_review = repository.create.call_args.args[0]
     assert saved_review.title == "Excelente estadía"
     assert saved_review.email == "user@example.com"
     assert saved_review.body == "Muy cómodo"
     assert saved_review.images[0].image_url == "https://cdn.example.com/photo.jpg"
-    email_sender.send.assert_called_once()
+    email_outbox.enqueue.assert_called_once()
+    assert email_outbox.enqueue.call_args.args[0].to == "user@example.com"
 
 
-def test_create_review_fails_when_record_missing() -> None:
+def test_create_review_propagates_missing_record_from_repository() -> None:
     repository = Mock()
-    repository.record_exists.return_value = False
+    repository.create.side_effect = RecordNotFoundError("Record 99 does not exist")
     service = ReviewService(repository)
 
     dto = CreateReviewDTO(
@@ -53,12 +59,44 @@ def test_create_review_fails_when_record_missing() -> None:
     with pytest.raises(RecordNotFoundError):
         service.create_review(dto)
 
+    repository.record_exists.assert_not_called()
+
+
+def test_create_review_enqueues_email_before_committing_review(
+    make_review: Callable[..., Review],
+) -> None:
+    calls = Mock()
+    calls.create.return_value = make_review(id=7)
+    service = ReviewService(calls, email_outbox=calls)
+
+    service.create_review(
+        CreateReviewDTO(
+            record_id=1, title=None, email="user@example.com", body="Comentario", rating=4
+        )
+    )
+
+    # The outbox row must be staged before create() commits the session.
+    assert [name for name, *_ in calls.mock_calls] == ["enqueue", "create"]
+
+
+def test_create_review_fails_when_email_cannot_be_queued() -> None:
+    repository = Mock()
+    email_outbox = Mock()
+    email_outbox.enqueue.side_effect = EmailOutboxError("db down")
+    service = ReviewService(repository, email_outbox=email_outbox)
+
+    dto = CreateReviewDTO(
+        record_id=1, title=None, email="user@example.com", body="Comentario", rating=4
+    )
+
+    with pytest.raises(ReviewPersistenceError):
+        service.create_review(dto)
+
     repository.create.assert_not_called()
 
 
 def test_create_review_rejects_invalid_image_extension() -> None:
     repository = Mock()
-    repository.record_exists.return_value = True
     service = ReviewService(repository)
 
     dto = CreateReviewDTO(
@@ -13,3 +13,13 @@ def test_get_review_not_found() -> None:
 
     with pytest.raises(ReviewNotFoundError):
         service.get_review(123)
+
+
+def test_get_review_version_reads_updated_at_from_repository() -> None:
+    repository = Mock()
+    repository.get_updated_at.return_value = None
+    service = ReviewService(repository)
+
+    assert service.get_review_version(123) is None
+    repository.get_updated_at.assert_called_once_with(123)
+    repository.get.assert_not_called()
@@ -1,16 +1,18 @@
+from collections.abc import Callable
+from datetime import UTC, datetime
 from unittest.mock import Mock
 
 import pytest
 
-from app.features.reviews.application.dtos import ListReviewsQuery
+from app.features.reviews.application.dtos import ListReviewsByCursorQuery, ListReviewsQuery
 from app.features.reviews.application.services import ReviewService
 from app.features.reviews.domain.exceptions import InvalidPaginationError
-from app.shared.domain.pagination import PageOutOfRangeError
+from app.features.reviews.domain.review import Review, ReviewCursor
+from app.shared.domain.pagination import CountMode, PageOutOfRangeError
 
 
 def test_list_reviews_returns_paginated_result(make_review) -> None:
     repository = Mock()
-    repository.record_exists.return_value = True
     paged_review = make_review(id=2)
     repository.list_by_record.return_value = ([paged_review], 3)
     service = ReviewService(repository)
@@ -18,7 +20,9 @@ def test_list_reviews_returns_paginated_result(make_review) -> None:
     query = ListReviewsQuery(record_id=7, page=2, page_size=2)
     result = service.list_reviews(query)
 
-    repository.list_by_record.assert_called_once_with(record_id=7, limit=2, offset=2)
+    repository.list_by_record.assert_called_once_with(
+        record_id=7, limit=2, offset=2, include_images=True, count_mode=CountMode.EXACT
+    )
     assert result.items == [paged_review]
     assert result.total == 3
     assert result.total_pages == 2
@@ -26,7 +30,6 @@ def test_list_reviews_returns_paginated_result(make_review) -> None:
 
 def test_list_reviews_rejects_invalid_pagination() -> None:
     repository = Mock()
-    repository.record_exists.return_value = True
     service = ReviewService(repository)
 
     with pytest.raises(InvalidPaginationError):
@@ -37,9 +40,96 @@ def test_list_reviews_rejects_invalid_pagination() -> None:
 
 def test_list_reviews_raises_when_page_out_of_range() -> None:
     repository = Mock()
-    repository.record_exists.return_value = True
     repository.list_by_record.return_value = ([], 0)
     service = ReviewService(repository)
 
     with pytest.raises(PageOutOfRangeError):
         service.list_reviews(ListReviewsQuery(record_id=1, page=2, page_size=5))
+
+
+def test_list_reviews_without_count_probes_one_extra_row(
+    make_review: Callable[..., Review],
+) -> None:
+    repository = Mock()
+    repository.list_by_record.return_value = ([make_review(id=3), make_review(id=2)], None)
+    service = ReviewService(repository)
+
+    query = ListReviewsQuery(record_id=7, page=1, page_size=1, count_mode=CountMode.NONE)
+    result = service.list_reviews(query)
+
+    assert repository.list_by_record.call_args.kwargs["limit"] == 2
+    assert [review.id for review in result.items] == [3]
+    assert result.has_more is True
+    assert result.total is None
+    assert result.total_pages is None
+
+
+def test_list_reviews_without_count_rejects_empty_later_page() -> None:
+    repository = Mock()
+    repository.list_by_record.return_value = ([], None)
+    service = ReviewService(repository)
+
+    with pytest.raises(PageOutOfRangeError):
+        service.list_reviews(
+            ListReviewsQuery(record_id=1, page=4, page_size=5, count_mode=CountMode.NONE)
+        )
+
+
+def test_list_reviews_by_cursor_continues_after_last_review(
+    make_review: Callable[..., Review],
+) -> None:
+    repository = Mock()
+    created_at = datetime(2024, 3, 1, tzinfo=UTC)
+    repository.list_by_record_after.return_value = [
+        make_review(id=9, created_at=created_at),
+        make_review(id=8, created_at=created_at),
+        make_review(id=7, created_at=created_at),
+    ]
+    service = ReviewService(repository)
+
+    first = service.list_reviews_by_cursor(ListReviewsByCursorQuery(record_id=7, page_size=2))
+
+    repository.list_by_record_after.assert_called_once_with(
+        record_id=7, limit=3, after=None, include_images=True
+    )
+    assert [review.id for review in first.items] == [9, 8]
+    assert first.has_more is True
+
+    repository.list_by_record_after.return_value = [make_review(id=7, created_at=created_at)]
+    second = service.list_reviews_by_cursor(
+        ListReviewsByCursorQuery(record_id=7, page_size=2, cursor=first.next_cursor)
+    )
+
+    assert repository.list_by_record_after.call_args.kwargs["after"] == ReviewCursor(
+        created_at=created_at, id=8
+    )
+    assert second.next_cursor is None
+
+
+def test_list_reviews_by_cursor_rejects_malformed_cursor() -> None:
+    repository = Mock()
+    service = ReviewService(repository)
+
+    with pytest.raises(InvalidPaginationError):
+        service.list_reviews_by_cursor(
+            ListReviewsByCursorQuery(record_id=1, page_size=10, cursor="no-es-un-cursor")
+        )
+
+    repository.list_by_record_after.assert_not_called()
+
+
+def test_list_reviews_page_mode_exposes_cursor_for_following_page(
+    make_review: Callable[..., Review],
+) -> None:
+    repository = Mock()
+    repository.list_by_record.return_value = ([make_review(id=5), make_review(id=4)], 5)
+    service = ReviewService(repository)
+
+    result = service.list_reviews(ListReviewsQuery(record_id=1, page=1, page_size=2))
+
+    assert result.next_cursor is not None
+    repository.list_by_record_after.return_value = []
+    service.list_reviews_by_cursor(
+        ListReviewsByCursorQuery(record_id=1, page_size=2, cursor=result.next_cursor)
+    )
+    assert repository.list_by_record_after.call_args.kwargs["after"].id == 4
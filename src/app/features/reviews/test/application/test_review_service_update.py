@@ -1,22 +1,19 @@
+from collections.abc import Callable
 from unittest.mock import Mock
 
 import pytest
 
 from app.features.reviews.application.dtos import UpdateReviewDTO
 from app.features.reviews.application.services import ReviewService
-from app.features.reviews.domain.exceptions import EmptyReviewUpdateError
+from app.features.reviews.domain.exceptions import (
+    EmptyReviewUpdateError,
+    ReviewNotFoundError,
+)
+from app.features.reviews.domain.review import Review, ReviewChanges
 
 
-def test_update_review_applies_changes_and_saves(make_review) -> None:
+def test_update_review_sends_changes_in_one_call(make_review: Callable[..., Review]) -> None:
     repository = Mock()
-    existing = make_review(
-        id=10,
-        title="Viejo",
-        email="old@example.com",
-        body="Texto viejo",
-        rating=2,
-    )
-    repository.get.return_value = existing
     updated = make_review(
         id=10,
         title="Nuevo",
@@ -24,7 +21,7 @@ def test_update_review_applies_changes_and_saves(make_review) -> None:
         body="Texto nuevo",
         rating=5,
     )
-    repository.save.return_value = updated
+    repository.update.return_value = updated
     service = ReviewService(repository)
 
     dto = UpdateReviewDTO(
@@ -38,13 +35,20 @@ def test_update_review_applies_changes_and_saves(make_review) -> None:
     result = service.update_review(dto)
 
     assert result is updated
-    repository.get.assert_called_once_with(10)
-    repository.save.assert_called_once()
-    saved_review = repository.save.call_args.args[0]
-    assert saved_review.title == "Nuevo"
-    assert saved_review.email == "nuevo@example.com"
-    assert saved_review.body == "Texto nuevo"
-    assert saved_review.rating == 5
+    repository.get.assert_not_called()
+    repository.update.assert_called_once_with(
+        10,
+        ReviewChanges(title="Nuevo", email="nuevo@example.com", body="Texto nuevo", rating=5),
+    )
+
+
+def test_update_review_missing_review_raises_not_found() -> None:
+    repository = Mock()
+    repository.update.return_value = None
+    service = ReviewService(repository)
+
+    with pytest.raises(ReviewNotFoundError):
+        service.update_review(UpdateReviewDTO(review_id=99, rating=4))
 
 
 def test_update_review_requires_at_least_one_field() -> None:
@@ -54,4 +58,29 @@ def test_update_review_requires_at_least_one_field() -> None:
     with pytest.raises(EmptyReviewUpdateError):
         service.update_review(UpdateReviewDTO(review_id=1))
 
-    repository.get.assert_not_called()
+    repository.update.assert_not_called()
+
+
+def test_update_review_rating_reports_record_stats_change(
+    make_review: Callable[..., Review],
+) -> None:
+    repository = Mock()
+    repository.update.return_value = make_review(id=10, record_id=3, rating=4)
+    changed: list[int] = []
+    service = ReviewService(repository, on_record_stats_changed=changed.append)
+
+    service.update_review(UpdateReviewDTO(review_id=10, rating=4))
+    service.update_review(UpdateReviewDTO(review_id=10, body="Solo texto"))
+
+    assert changed == [3]
+
+
+def test_delete_review_reports_record_stats_change() -> None:
+    repository = Mock()
+    repository.delete.return_value = 3
+    changed: list[int] = []
+    service = ReviewService(repository, on_record_stats_changed=changed.append)
+
+    service.delete_review(10)
+
+    assert changed == [3]
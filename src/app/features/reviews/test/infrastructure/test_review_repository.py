@@ -0,0 +1,117 @@
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.features.reviews.domain.exceptions import RecordNotFoundError
+from app.features.reviews.domain.review import Review, ReviewChanges, ReviewImage
+from app.features.reviews.infrastructure.repository import SqlAlchemyReviewRepository
+from app.shared.domain.pagination import CountMode
+
+NOW = datetime(2024, 5, 1, 12, 0, tzinfo=UTC)
+PG_DIALECT = postgresql.dialect()  # type: ignore[no-untyped-call]
+
+
+def _review(**overrides: object) -> Review:
+    base: dict[str, object] = {
+        "record_id": 1,
+        "email": "user@example.com",
+        "body": "Buen lugar",
+        "rating": 4,
+        "images": [ReviewImage(image_url="https://cdn.example.com/a.jpg")],
+    }
+    base.update(overrides)
+    return Review(**base)  # type: ignore[arg-type]
+
+
+def test_create_writes_review_images_and_stats_in_one_statement() -> None:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = SimpleNamespace(
+        id=9,
+        record_id=1,
+        title=None,
+        email="user@example.com",
+        body="Buen lugar",
+        rating=4,
+        created_at=NOW,
+        updated_at=NOW,
+        image_ids=[30],
+        image_urls=["https://cdn.example.com/a.jpg"],
+        image_created_at=[NOW],
+    )
+
+    review = SqlAlchemyReviewRepository(session).create(_review())
+
+    session.execute.assert_called_once()
+    params = session.execute.call_args.args[1]
+    assert params["image_urls"] == ["https://cdn.example.com/a.jpg"]
+    session.commit.assert_called_once()
+    assert review.id == 9
+    assert review.images == [
+        ReviewImage(id=30, review_id=9, image_url="https://cdn.example.com/a.jpg", created_at=NOW)
+    ]
+
+
+def test_create_raises_when_record_is_missing_or_deleted() -> None:
+    session = MagicMock()
+    session.execute.return_value.one_or_none.return_value = None
+
+    with pytest.raises(RecordNotFoundError):
+        SqlAlchemyReviewRepository(session).create(_review())
+
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
+
+
+def test_list_checks_record_page_and_count_in_one_query() -> None:
+    session = MagicMock()
+    session.execute.return_value.all.return_value = [(7, None, 0)]
+
+    reviews, total = SqlAlchemyReviewRepository(session).list_by_record(
+        record_id=7, limit=20, offset=0, include_images=False, count_mode=CountMode.EXACT
+    )
+
+    assert (reviews, total) == ([], 0)
+    session.execute.assert_called_once()
+    sql = str(session.execute.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "FROM records LEFT OUTER JOIN" in sql
+    assert "records.deleted_at IS NULL" in sql
+    assert "count(*)" in sql
+
+
+def test_list_raises_when_record_is_missing_or_deleted() -> None:
+    session = MagicMock()
+    session.execute.return_value.all.return_value = []
+    repository = SqlAlchemyReviewRepository(session)
+
+    with pytest.raises(RecordNotFoundError):
+        repository.list_by_record(record_id=7, limit=20, offset=0)
+    with pytest.raises(RecordNotFoundError):
+        repository.list_by_record_after(record_id=7, limit=21)
+
+
+def test_get_hides_reviews_of_deleted_records() -> None:
+    session = MagicMock()
+    session.scalars.return_value.one_or_none.return_value = None
+
+    assert SqlAlchemyReviewRepository(session).get(3) is None
+
+    sql = str(session.scalars.call_args.args[0].compile(dialect=PG_DIALECT))
+    assert "JOIN records ON records.id = reviews.record_id" in sql
+    assert "records.deleted_at IS NULL" in sql
+
+
+def test_update_leaves_reviews_of_deleted_records_untouched() -> None:
+    session = MagicMock()
+    session.execute.return_value.mappings.return_value.one_or_none.return_value = None
+
+    assert SqlAlchemyReviewRepository(session).update(3, ReviewChanges(rating=2)) is None
+
+    sql = str(session.execute.call_args.args[0].compile(dialect=PG_DIALECT))
+    previous = sql.split("updated AS")[0]
+    assert "records.deleted_at IS NULL" in previous
+    assert "FOR UPDATE OF reviews" in previous
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
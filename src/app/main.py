@@ -8,6 +8,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.features.records.infrastructure.fastapi.router import records_router
 from app.features.reviews.infrastructure.fastapi.router import reviews_router
 from app.features.comments.infrastructure.fastapi.router import comments_router
+from app.shared.application.email import get_email_templates
 from app.shared.infrastructure.database import (
     close_connection_pool,
     open_connection_pool,
@@ -18,6 +19,8 @@ from app.shared.infrastructure.settings import settings
 @asynccontextmanager
 async def lifespan(_: FastAPI):  # noqa: ANN201
     open_connection_pool()
+    # Parse and compile the email templates now rather than on the first review.
+    get_email_templates()
     try:
         yield
     finally:
@@ -0,0 +1,27 @@
+from app.shared.application.email.messages import (
+    EmailDeliveryError,
+    EmailMessage,
+    EmailOutbox,
+    EmailOutboxError,
+    EmailSender,
+    EmailSenderStats,
+)
+from app.shared.application.email.templates import (
+    EmailTemplates,
+    TemplateNotFoundError,
+    TemplateSyntaxError,
+    get_email_templates,
+)
+
+__all__ = [
+    "EmailDeliveryError",
+    "EmailMessage",
+    "EmailOutbox",
+    "EmailOutboxError",
+    "EmailSender",
+    "EmailSenderStats",
+    "EmailTemplates",
+    "TemplateNotFoundError",
+    "TemplateSyntaxError",
+    "get_email_templates",
+]
@@ -0,0 +1,57 @@
+"""Rendering throughput of the bundled email templates::
+
+    python -m app.shared.application.email.benchmark [iterations]
+
+Compares rendering the precompiled templates with parsing them again on every render.
+"""
+
+import sys
+import time
+from collections.abc import Callable
+
+from app.shared.application.email.templates import (
+    TEMPLATES_DIR,
+    EmailTemplates,
+    compile_template,
+)
+
+DEFAULT_ITERATIONS = 20_000
+
+_CONTEXT = {
+    "title": "Apartamento luminoso",
+    "rating": 5,
+    "body": "Muy cómodo, bien ubicado y con <buena> iluminación & ventilación.",
+}
+
+
+def _rate(iterations: int, render: Callable[[], object]) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ITERATIONS
+    templates = EmailTemplates.from_directory()
+    html_source = (TEMPLATES_DIR / "review_created" / "es" / "body.html").read_text("utf-8")
+
+    html = templates.get("review_created").html
+    if html is None:
+        raise SystemExit("review_created has no HTML variant")
+    rates = {
+        "html body, precompiled": _rate(iterations, lambda: html.render(_CONTEXT)),
+        "html body, parsed on every render": _rate(
+            iterations, lambda: compile_template(html_source, escape=True).render(_CONTEXT)
+        ),
+        "full message (subject + text + html)": _rate(
+            iterations,
+            lambda: templates.render("review_created", _CONTEXT, to="user@example.com"),
+        ),
+    }
+    for label, rate in rates.items():
+        print(f"review_created {label:<38} {rate:>12,.0f} renders/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(slots=True)
+class EmailMessage:
+    """Small value object representing an outbound email."""
+
+    to: Sequence[str] | str
+    subject: str
+    body: str
+    html_body: str | None = None
+    reply_to: str | None = None
+    from_email: str | None = None
+
+
+@dataclass(frozen=True)
+class EmailSenderStats:
+    """Cumulative delivery counters; ``send_seconds_*`` time each message on the wire."""
+
+    sent: int
+    failed: int
+    connections_opened: int
+    connections_reused: int
+    reconnects: int
+    send_seconds_total: float
+    send_seconds_max: float
+
+    @property
+    def send_seconds_avg(self) -> float:
+        attempts = self.sent + self.failed
+        return self.send_seconds_total / attempts if attempts else 0.0
+
+
+class EmailDeliveryError(Exception):
+    """Raised when an email cannot be delivered."""
+
+
+class EmailSender(Protocol):
+    """Abstraction to deliver emails without tying features to a provider."""
+
+    def send(self, message: EmailMessage) -> None: ...
+
+    def send_many(self, messages: Sequence[EmailMessage]) -> list[EmailDeliveryError | None]:
+        """Deliver a batch, ideally over one session; one outcome (``None`` = sent) per message."""
+        ...
+
+    def stats(self) -> EmailSenderStats: ...
+
+
+class EmailOutbox(Protocol):
+    """Queue of emails persisted alongside the write that triggers them.
+
+    ``enqueue`` only stages the email in the caller's unit of work; it is committed (or rolled
+    back) together with that write and delivered later by the outbox dispatcher.
+    """
+
+    def enqueue(self, message: EmailMessage) -> None: ...
+
+
+class EmailOutboxError(Exception):
+    """Raised when an email cannot be written to or read from the outbox."""
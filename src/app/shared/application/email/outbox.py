@@ -0,0 +1,90 @@
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from app.shared.application.email.messages import EmailMessage, EmailSender
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PendingEmail:
+    """An outbox row claimed for delivery; ``attempts`` counts the previous failed sends."""
+
+    id: int
+    message: EmailMessage
+    attempts: int = 0
+
+
+class EmailOutboxStore(Protocol):
+    """Dispatcher side of the outbox: claim due emails and record each delivery outcome."""
+
+    def claim(self, *, batch_size: int, lease_seconds: float) -> Sequence[PendingEmail]: ...
+
+    def mark_sent(self, email_id: int) -> None: ...
+
+    def mark_failed(self, email_id: int, *, error: str, retry_in: float | None) -> None: ...
+
+
+@dataclass
+class DispatchResult:
+    sent: int = 0
+    retried: int = 0
+    dead: int = 0
+
+    @property
+    def processed(self) -> int:
+        return self.sent + self.retried + self.dead
+
+
+def retry_delay(attempts: int, *, base_seconds: float, max_seconds: float) -> float:
+    """Exponential backoff after the ``attempts``-th failed send: base, 2*base, 4*base, ..."""
+    return min(base_seconds * 2.0 ** max(attempts - 1, 0), max_seconds)
+
+
+def dispatch_pending_emails(
+    store: EmailOutboxStore,
+    sender: EmailSender,
+    *,
+    batch_size: int,
+    max_attempts: int,
+    lease_seconds: float,
+    retry_base_seconds: float,
+    retry_max_seconds: float,
+) -> DispatchResult:
+    """Send one batch of due emails; failures are retried with backoff, then dead-lettered."""
+    result = DispatchResult()
+    claimed = list(store.claim(batch_size=batch_size, lease_seconds=lease_seconds))
+    if not claimed:
+        return result
+    # One SMTP session for the whole batch instead of a handshake per email.
+    errors = sender.send_many([pending.message for pending in claimed])
+    for pending, error in zip(claimed, errors, strict=True):
+        if error is None:
+            store.mark_sent(pending.id)
+            result.sent += 1
+            continue
+        attempts = pending.attempts + 1
+        if attempts >= max_attempts:
+            logger.error(
+                "Correo movido a dead-letter tras %s intentos. outbox_id=%s error=%s",
+                attempts,
+                pending.id,
+                error,
+            )
+            store.mark_failed(pending.id, error=str(error), retry_in=None)
+            result.dead += 1
+            continue
+        delay = retry_delay(
+            attempts, base_seconds=retry_base_seconds, max_seconds=retry_max_seconds
+        )
+        logger.warning(
+            "Fallo el envío del correo; se reintentará en %ss. outbox_id=%s intento=%s",
+            delay,
+            pending.id,
+            attempts,
+        )
+        store.mark_failed(pending.id, error=str(error), retry_in=delay)
+        result.retried += 1
+    return result
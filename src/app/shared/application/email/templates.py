@@ -0,0 +1,216 @@
+"""Email templates parsed and compiled once, rendered with HTML auto-escaping.
+
+The syntax is a small Mustache subset:
+
+- ``{{ name }}`` / ``{{ review.title }}``: a value (mapping key or attribute). ``None`` and
+  missing values render empty; in ``.html`` templates the value is HTML-escaped.
+- ``{{# items }}...{{/ items }}``: rendered once per element of a list, with the element
+  searched first (``{{ . }}`` is the element itself), or once if the value is truthy.
+- ``{{^ name }}...{{/ name }}``: rendered when the value is missing, false or empty.
+
+Each template lives in ``templates/<name>/<locale>/`` as ``subject.txt``, ``body.txt`` and an
+optional ``body.html``. A locale such as ``en-US`` falls back to ``en`` and then to the
+default locale.
+"""
+
+import html
+import re
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from numbers import Number
+from pathlib import Path
+from typing import cast
+
+from app.shared.application.email.messages import EmailMessage
+
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+DEFAULT_LOCALE = "es"
+
+_TAG = re.compile(r"\{\{\s*([#^/]?)\s*(\.|[A-Za-z_][\w.]*)\s*\}\}")
+_MISSING = object()
+
+# Lookup frames, innermost first: a section element shadows the outer context.
+_Scope = tuple[object, ...]
+_Part = Callable[[_Scope], str]
+
+
+class TemplateSyntaxError(ValueError):
+    """Raised when a template cannot be parsed."""
+
+
+class TemplateNotFoundError(LookupError):
+    """Raised when no locale variant of a template exists."""
+
+
+def _lookup(scope: _Scope, path: tuple[str, ...]) -> object:
+    if path == (".",):
+        return scope[0]
+    value: object = _MISSING
+    for frame in scope:
+        value = _get(frame, path[0])
+        if value is not _MISSING:
+            break
+    for key in path[1:]:
+        if value is _MISSING:
+            break
+        value = _get(value, key)
+    return None if value is _MISSING else value
+
+
+def _get(obj: object, key: str) -> object:
+    if isinstance(obj, Mapping):
+        return obj.get(key, _MISSING)
+    if obj is None or isinstance(obj, str | bytes | Number):
+        return _MISSING
+    return getattr(obj, key, _MISSING)
+
+
+def _is_list(value: object) -> bool:
+    return isinstance(value, Sequence) and not isinstance(value, str | bytes)
+
+
+def _literal(text: str) -> _Part:
+    return lambda _scope: text
+
+
+def _variable(path: tuple[str, ...], escape: bool) -> _Part:
+    def render(scope: _Scope) -> str:
+        value = _lookup(scope, path)
+        if value is None:
+            return ""
+        return html.escape(str(value)) if escape else str(value)
+
+    return render
+
+
+def _section(path: tuple[str, ...], body: _Part, inverted: bool) -> _Part:
+    def render(scope: _Scope) -> str:
+        value = _lookup(scope, path)
+        if inverted:
+            return "" if value else body(scope)
+        if _is_list(value):
+            return "".join([body((item, *scope)) for item in cast(Sequence[object], value)])
+        return body(scope) if value else ""
+
+    return render
+
+
+def _join(parts: list[_Part]) -> _Part:
+    if len(parts) == 1:
+        return parts[0]
+    return lambda scope: "".join([part(scope) for part in parts])
+
+
+def compile_template(source: str, *, escape: bool, name: str = "<template>") -> "Template":
+    """Parse ``source`` into a tree of render closures; rendering does no parsing."""
+    # Each open section keeps (tag, inverted, parts collected so far).
+    stack: list[tuple[tuple[str, ...], bool, list[_Part]]] = [((), False, [])]
+    position = 0
+    for match in _TAG.finditer(source):
+        if match.start() > position:
+            stack[-1][2].append(_literal(source[position : match.start()]))
+        position = match.end()
+        kind, raw_path = match.groups()
+        path = tuple(raw_path.split(".")) if raw_path != "." else (".",)
+        if kind in ("#", "^"):
+            stack.append((path, kind == "^", []))
+        elif kind == "/":
+            if len(stack) == 1 or stack[-1][0] != path:
+                raise TemplateSyntaxError(f"{name}: unexpected {{{{/ {raw_path} }}}}")
+            open_path, inverted, parts = stack.pop()
+            stack[-1][2].append(_section(open_path, _join(parts), inverted))
+        else:
+            stack[-1][2].append(_variable(path, escape))
+    if len(stack) > 1:
+        raise TemplateSyntaxError(f"{name}: unclosed section {'.'.join(stack[-1][0])}")
+    if position < len(source):
+        stack[0][2].append(_literal(source[position:]))
+    return Template(name=name, _render=_join(stack[0][2]) if stack[0][2] else _literal(""))
+
+
+@dataclass(frozen=True)
+class Template:
+    name: str
+    _render: _Part
+
+    def render(self, context: Mapping[str, object]) -> str:
+        return self._render((context,))
+
+
+@dataclass(frozen=True)
+class EmailTemplate:
+    subject: Template
+    text: Template
+    html: Template | None = None
+
+    def render(self, context: Mapping[str, object], *, to: Sequence[str] | str) -> EmailMessage:
+        return EmailMessage(
+            to=to,
+            subject=self.subject.render(context).strip(),
+            body=self.text.render(context),
+            html_body=self.html.render(context) if self.html is not None else None,
+        )
+
+
+class EmailTemplates:
+    """Catalog of compiled templates keyed by ``(name, locale)``."""
+
+    def __init__(
+        self,
+        templates: Mapping[tuple[str, str], EmailTemplate],
+        *,
+        default_locale: str = DEFAULT_LOCALE,
+    ) -> None:
+        self._templates = dict(templates)
+        self._default_locale = default_locale
+
+    @classmethod
+    def from_directory(
+        cls, root: Path = TEMPLATES_DIR, *, default_locale: str = DEFAULT_LOCALE
+    ) -> "EmailTemplates":
+        templates: dict[tuple[str, str], EmailTemplate] = {}
+        for locale_dir in sorted(root.glob("*/*/")):
+            name, locale = locale_dir.parent.name, locale_dir.name.lower()
+            html_path = locale_dir / "body.html"
+            templates[(name, locale)] = EmailTemplate(
+                subject=cls._load(locale_dir / "subject.txt", escape=False),
+                text=cls._load(locale_dir / "body.txt", escape=False),
+                html=cls._load(html_path, escape=True) if html_path.exists() else None,
+            )
+        return cls(templates, default_locale=default_locale)
+
+    def get(self, name: str, locale: str | None = None) -> EmailTemplate:
+        for candidate in self._locale_candidates(locale):
+            template = self._templates.get((name, candidate))
+            if template is not None:
+                return template
+        raise TemplateNotFoundError(f"No existe la plantilla de correo {name!r}")
+
+    def render(
+        self,
+        name: str,
+        context: Mapping[str, object],
+        *,
+        to: Sequence[str] | str,
+        locale: str | None = None,
+    ) -> EmailMessage:
+        return self.get(name, locale).render(context, to=to)
+
+    def _locale_candidates(self, locale: str | None) -> list[str]:
+        candidates = []
+        if locale:
+            normalized = locale.strip().lower().replace("_", "-")
+            candidates += [normalized, normalized.split("-")[0]]
+        candidates.append(self._default_locale)
+        return candidates
+
+    @staticmethod
+    def _load(path: Path, *, escape: bool) -> Template:
+        return compile_template(path.read_text(encoding="utf-8"), escape=escape, name=str(path))
+
+
+@lru_cache(maxsize=1)
+def get_email_templates() -> EmailTemplates:
+    """The bundled templates, read and compiled on first use (the API warms it at startup)."""
+    return EmailTemplates.from_directory()
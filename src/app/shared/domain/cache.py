@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Protocol
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_entries: int
+
+
+class CacheBackend[V](Protocol):
+    """Key/value store behind read-through caches; ``get`` returns ``None`` on a miss."""
+
+    def get(self, key: str) -> V | None: ...
+
+    def set(self, key: str, value: V) -> None: ...
+
+    def delete(self, key: str) -> None: ...
+
+    def clear(self) -> None: ...
+
+    def stats(self) -> CacheStats: ...
@@ -1,4 +1,8 @@
+import base64
+import json
+from collections.abc import Sequence
 from dataclasses import dataclass
+from enum import Enum
 from typing import Generic, TypeVar
 
 
@@ -6,18 +10,108 @@ class PageOutOfRangeError(Exception):
     """Raised when the requested page is beyond available results."""
 
 
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+class CountMode(str, Enum):
+    """How list endpoints compute ``total``.
+
+    ``exact`` runs ``COUNT(*)``, ``estimated`` reads the planner's row estimate and ``none``
+    skips counting; the last two detect a next page by fetching one extra row.
+    """
+
+    EXACT = "exact"
+    ESTIMATED = "estimated"
+    NONE = "none"
+
+
 T = TypeVar("T")
 
 
 @dataclass
 class PaginatedResult(Generic[T]):
     items: list[T]
-    total: int
+    total: int | None
     page: int
     page_size: int
+    next_cursor: str | None = None
+    has_more: bool | None = None
+    count_mode: CountMode = CountMode.EXACT
+
+    def __post_init__(self) -> None:
+        if self.has_more is None:
+            total_pages = self.total_pages
+            self.has_more = total_pages is not None and self.page < total_pages
 
     @property
-    def total_pages(self) -> int:
+    def total_pages(self) -> int | None:
+        if self.total is None:
+            return None
         if self.page_size <= 0:
             return 0
         return (self.total + self.page_size - 1) // self.page_size
+
+    @classmethod
+    def from_window(
+        cls,
+        window: Sequence[T],
+        *,
+        total: int | None,
+        page: int,
+        page_size: int,
+        count_mode: CountMode,
+    ) -> "PaginatedResult[T]":
+        """Build a page from rows fetched with ``window_size(page_size, count_mode)``."""
+        if count_mode is CountMode.EXACT:
+            return cls(items=list(window), total=total or 0, page=page, page_size=page_size)
+
+        has_more = len(window) > page_size
+        items = list(window[:page_size])
+        if total is not None:
+            # The estimate may be stale; never report fewer rows than the window proves exist,
+            # and on the last page the exact total is known.
+            seen = (page - 1) * page_size + len(items)
+            total = max(total, seen + 1) if has_more else seen
+        return cls(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            has_more=has_more,
+            count_mode=count_mode,
+        )
+
+
+def window_size(page_size: int, count_mode: CountMode) -> int:
+    """Rows to request from a repository: one extra probes for a next page without a count."""
+    return page_size if count_mode is CountMode.EXACT else page_size + 1
+
+
+@dataclass
+class CursorPaginatedResult(Generic[T]):
+    items: list[T]
+    page_size: int
+    next_cursor: str | None = None
+
+    @property
+    def has_more(self) -> bool:
+        return self.next_cursor is not None
+
+
+def encode_cursor(payload: dict[str, str | int]) -> str:
+    """Serialize a keyset position into an opaque, URL-safe token."""
+    raw = json.dumps(payload, separators=(",", ":"), sort_keys=True).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict[str, str | int]:
+    """Inverse of ``encode_cursor``; raises ``InvalidCursorError`` on malformed input."""
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError as exc:
+        raise InvalidCursorError("Invalid pagination cursor") from exc
+    if not isinstance(payload, dict):
+        raise InvalidCursorError("Invalid pagination cursor")
+    return payload
@@ -0,0 +1,77 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from app.shared.domain.cache import CacheStats
+
+
+class InMemoryLRUCache[V]:
+    """Thread-safe, per-process LRU cache whose entries also expire after ``ttl_seconds``.
+
+    ``evictions`` counts entries pushed out by the size bound; entries found past their TTL are
+    counted as ``expirations`` (and as a miss). Invalidation only reaches this process, so with
+    several workers the TTL bounds how stale another worker can be.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> V | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: V) -> None:
+        if self._max_entries <= 0 or self._ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+                size=len(self._entries),
+                max_entries=self._max_entries,
+            )
@@ -0,0 +1,91 @@
+import hashlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# Let clients store the body but revalidate it on every use; the 304 keeps that cheap.
+CACHE_CONTROL = "no-cache"
+
+
+@dataclass(frozen=True)
+class Validators:
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                self.last_modified.replace(microsecond=0), usegmt=True
+            )
+        return headers
+
+
+def _etag(*parts: object) -> str:
+    # Weak: equal versions are semantically equivalent, not byte-identical (e.g. ``fields=``).
+    return f'W/"{hashlib.blake2b(repr(parts).encode(), digest_size=12).hexdigest()}"'
+
+
+def item_validators(kind: str, item_id: int, updated_at: datetime | None) -> Validators | None:
+    if updated_at is None:
+        return None
+    return Validators(etag=_etag(kind, item_id, updated_at.isoformat()), last_modified=updated_at)
+
+
+def page_validators(
+    kind: str, items: Iterable[tuple[int | None, datetime | None]], *extra: object
+) -> Validators:
+    """Version of one page: the ids and ``updated_at`` of its rows plus e.g. total/cursor."""
+    rows = list(items)
+    stamps = [updated_at for _, updated_at in rows if updated_at is not None]
+    parts = [
+        (item_id, updated_at.isoformat() if updated_at else None) for item_id, updated_at in rows
+    ]
+    return Validators(etag=_etag(kind, parts, *extra), last_modified=max(stamps, default=None))
+
+
+def has_conditional_headers(request: Request) -> bool:
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """RFC 9110 evaluation: ``If-None-Match`` (weak comparison) wins over ``If-Modified-Since``."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return validators.etag.removeprefix("W/") in candidates
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return validators.last_modified.replace(microsecond=0) <= since
+
+
+def not_modified_response(validators: Validators) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers)
+
+
+def with_validators(payload: BaseModel | Response, validators: Validators | None) -> Response:
+    """Render ``payload`` like FastAPI's ``response_model`` would and attach the validators."""
+    response = (
+        payload
+        if isinstance(payload, Response)
+        else JSONResponse(payload.model_dump(mode="json", by_alias=True))
+    )
+    if validators is not None:
+        response.headers.update(validators.headers)
+    return response
@@ -0,0 +1,33 @@
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import ClauseElement, Executable
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import SQLCompiler
+
+
+class _Explain(Executable, ClauseElement):
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement) -> None:
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler: SQLCompiler, **kw: object) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def estimate_rows(
+    session: Session, statement: ClauseElement, params: Mapping[str, Any] | None = None
+) -> int:
+    """Rows the planner expects ``statement`` to return, read from ``EXPLAIN``.
+
+    Costs a planning pass instead of a scan; accuracy follows the table statistics kept by
+    autovacuum/``ANALYZE``. Pass the row query, not a ``COUNT(*)`` (its estimate is 1).
+    """
+    plan = session.execute(_Explain(statement), dict(params or {})).scalar()
+    if not plan:
+        return 0
+    return max(int(plan[0]["Plan"]["Plan Rows"]), 0)
@@ -0,0 +1,78 @@
+"""Deliver the emails queued in ``email_outbox``.
+
+Requests only insert outbox rows in their own transaction; this worker sends them. Failed sends
+are retried with exponential backoff and, after ``EMAIL_OUTBOX_MAX_ATTEMPTS``, left in status
+``dead`` with their last error. Run it next to the API (any number of copies)::
+
+    python -m app.shared.infrastructure.email.dispatch_outbox
+"""
+
+import time
+
+from sqlalchemy.orm import Session
+
+from app.shared.application.email import EmailOutboxError, EmailSender
+from app.shared.application.email.outbox import DispatchResult, dispatch_pending_emails
+from app.shared.infrastructure.database import get_session_factory
+from app.shared.infrastructure.email.email_settings import EmailSettings
+from app.shared.infrastructure.email.factory import get_email_sender
+from app.shared.infrastructure.email.outbox import SqlAlchemyEmailOutbox
+from app.shared.infrastructure.logger import logger
+from app.shared.infrastructure.settings import settings
+
+
+def dispatch_outbox(
+    session: Session, sender: EmailSender, email_settings: EmailSettings
+) -> DispatchResult:
+    """Send one batch of due outbox emails."""
+    return dispatch_pending_emails(
+        SqlAlchemyEmailOutbox(session),
+        sender,
+        batch_size=email_settings.outbox_batch_size,
+        max_attempts=email_settings.outbox_max_attempts,
+        lease_seconds=email_settings.outbox_lease_seconds,
+        retry_base_seconds=email_settings.outbox_retry_base_seconds,
+        retry_max_seconds=email_settings.outbox_retry_max_seconds,
+    )
+
+
+def main() -> None:
+    sender = get_email_sender()
+    if sender is None:
+        logger.info("Email disabled; outbox dispatcher not started.")
+        return
+
+    email_settings = settings.email
+    session = get_session_factory()()
+    logger.info("Email outbox dispatcher started.")
+    try:
+        while True:
+            try:
+                result = dispatch_outbox(session, sender, email_settings)
+            except EmailOutboxError:
+                logger.exception("Email outbox dispatch failed; retrying after the poll interval")
+                result = DispatchResult()
+            if result.processed:
+                stats = sender.stats()
+                logger.info(
+                    "Email outbox batch finished. sent=%s retried=%s dead=%s "
+                    "smtp_avg_ms=%.1f smtp_max_ms=%.1f connections_opened=%s reused=%s",
+                    result.sent,
+                    result.retried,
+                    result.dead,
+                    stats.send_seconds_avg * 1000,
+                    stats.send_seconds_max * 1000,
+                    stats.connections_opened,
+                    stats.connections_reused,
+                )
+            # A full batch means more may be due right now; otherwise wait for new rows.
+            if result.processed < email_settings.outbox_batch_size:
+                time.sleep(email_settings.outbox_poll_interval_seconds)
+    except KeyboardInterrupt:
+        logger.info("Email outbox dispatcher stopped.")
+    finally:
+        session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -75,3 +75,56 @@ class EmailSettings(BaseSettings):
             "SMTP_TIMEOUT", "EMAIL_SMTP_TIMEOUT", "SMTP__TIMEOUT"
         ),
     )
+
+    # Idle authenticated sessions kept per sender; 0 closes the session after every batch.
+    smtp_pool_size: int = Field(
+        default=2,
+        ge=0,
+        validation_alias=AliasChoices("SMTP_POOL_SIZE", "EMAIL_SMTP_POOL_SIZE", "SMTP__POOL_SIZE"),
+    )
+    # Servers drop idle sessions (often after ~60-300s); older ones are replaced, not reused.
+    smtp_pool_idle_seconds: float = Field(
+        default=60.0,
+        ge=0,
+        validation_alias=AliasChoices(
+            "SMTP_POOL_IDLE_SECONDS", "EMAIL_SMTP_POOL_IDLE_SECONDS", "SMTP__POOL_IDLE_SECONDS"
+        ),
+    )
+
+    # Outbox dispatcher (see app.shared.infrastructure.email.dispatch_outbox).
+    outbox_batch_size: int = Field(
+        default=50,
+        ge=1,
+        validation_alias=AliasChoices("EMAIL_OUTBOX_BATCH_SIZE", "EMAIL__OUTBOX_BATCH_SIZE"),
+    )
+    outbox_max_attempts: int = Field(
+        default=6,
+        ge=1,
+        validation_alias=AliasChoices("EMAIL_OUTBOX_MAX_ATTEMPTS", "EMAIL__OUTBOX_MAX_ATTEMPTS"),
+    )
+    outbox_retry_base_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "EMAIL_OUTBOX_RETRY_BASE_SECONDS", "EMAIL__OUTBOX_RETRY_BASE_SECONDS"
+        ),
+    )
+    outbox_retry_max_seconds: float = Field(
+        default=3600.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "EMAIL_OUTBOX_RETRY_MAX_SECONDS", "EMAIL__OUTBOX_RETRY_MAX_SECONDS"
+        ),
+    )
+    outbox_lease_seconds: float = Field(
+        default=300.0,
+        gt=0,
+        validation_alias=AliasChoices("EMAIL_OUTBOX_LEASE_SECONDS", "EMAIL__OUTBOX_LEASE_SECONDS"),
+    )
+    outbox_poll_interval_seconds: float = Field(
+        default=5.0,
+        gt=0,
+        validation_alias=AliasChoices(
+            "EMAIL_OUTBOX_POLL_INTERVAL_SECONDS", "EMAIL__OUTBOX_POLL_INTERVAL_SECONDS"
+        ),
+    )
@@ -1,6 +1,9 @@
 from functools import lru_cache
 
-from app.shared.application.email import EmailSender
+from sqlalchemy.orm import Session
+
+from app.shared.application.email import EmailOutbox, EmailSender
+from app.shared.infrastructure.email.outbox import SqlAlchemyEmailOutbox
 from app.shared.infrastructure.email.smtp import SmtpEmailSender
 from app.shared.infrastructure.logger import logger
 from app.shared.infrastructure.settings import settings
@@ -25,3 +28,10 @@ def get_email_sender() -> EmailSender | None:
     raise UnsupportedEmailProviderError(
         f"Proveedor de email no soportado: {email_settings.provider}"
     )
+
+
+def get_email_outbox(session: Session) -> EmailOutbox | None:
+    """Outbox bound to ``session``, so queued emails commit with the request's own writes."""
+    if not settings.email.enabled:
+        return None
+    return SqlAlchemyEmailOutbox(session)
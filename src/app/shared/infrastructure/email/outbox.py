@@ -0,0 +1,134 @@
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import TextClause, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.shared.application.email import EmailMessage, EmailOutbox, EmailOutboxError
+from app.shared.application.email.outbox import EmailOutboxStore, PendingEmail
+
+_ENQUEUE = text(
+    """
+    INSERT INTO email_outbox (recipients, subject, body, html_body, reply_to, from_email)
+    VALUES (:recipients, :subject, :body, :html_body, :reply_to, :from_email)
+    """
+)
+
+# Claiming pushes next_attempt_at forward by a lease instead of holding row locks while SMTP
+# runs: concurrent workers skip the claimed rows, and a worker that dies mid-batch leaves them
+# to be picked up again once the lease expires.
+_CLAIM = text(
+    """
+    UPDATE email_outbox
+    SET next_attempt_at = now() + make_interval(secs => :lease_seconds)
+    WHERE id IN (
+        SELECT id
+        FROM email_outbox
+        WHERE status = 'pending' AND next_attempt_at <= now()
+        ORDER BY next_attempt_at, id
+        LIMIT :batch_size
+        FOR UPDATE SKIP LOCKED
+    )
+    RETURNING id, recipients, subject, body, html_body, reply_to, from_email, attempts
+    """
+)
+
+_MARK_SENT = text(
+    """
+    UPDATE email_outbox
+    SET status = 'sent', attempts = attempts + 1, sent_at = now(), last_error = NULL
+    WHERE id = :id
+    """
+)
+
+_MARK_RETRY = text(
+    """
+    UPDATE email_outbox
+    SET attempts = attempts + 1,
+        last_error = :error,
+        next_attempt_at = now() + make_interval(secs => :retry_in)
+    WHERE id = :id
+    """
+)
+
+_MARK_DEAD = text(
+    """
+    UPDATE email_outbox
+    SET status = 'dead', attempts = attempts + 1, last_error = :error
+    WHERE id = :id
+    """
+)
+
+
+class SqlAlchemyEmailOutbox(EmailOutbox, EmailOutboxStore):
+    """``email_outbox`` table shared by the request path (enqueue) and the dispatcher."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def enqueue(self, message: EmailMessage) -> None:
+        # No commit: the row belongs to the caller's transaction (e.g. the review insert).
+        params = {
+            "recipients": self._normalize_recipients(message.to),
+            "subject": message.subject,
+            "body": message.body,
+            "html_body": message.html_body,
+            "reply_to": message.reply_to,
+            "from_email": message.from_email,
+        }
+        try:
+            self.session.execute(_ENQUEUE, params)
+        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
+            self.session.rollback()
+            raise EmailOutboxError("No se pudo encolar el correo") from exc
+
+    def claim(self, *, batch_size: int, lease_seconds: float) -> Sequence[PendingEmail]:
+        try:
+            rows = self.session.execute(
+                _CLAIM, {"batch_size": batch_size, "lease_seconds": lease_seconds}
+            ).all()
+            self.session.commit()
+        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
+            self.session.rollback()
+            raise EmailOutboxError("No se pudieron reclamar correos pendientes") from exc
+        return [
+            PendingEmail(
+                id=row.id,
+                message=EmailMessage(
+                    to=list(row.recipients),
+                    subject=row.subject,
+                    body=row.body,
+                    html_body=row.html_body,
+                    reply_to=row.reply_to,
+                    from_email=row.from_email,
+                ),
+                attempts=row.attempts,
+            )
+            for row in rows
+        ]
+
+    def mark_sent(self, email_id: int) -> None:
+        self._record_outcome(_MARK_SENT, {"id": email_id})
+
+    def mark_failed(self, email_id: int, *, error: str, retry_in: float | None) -> None:
+        if retry_in is None:
+            self._record_outcome(_MARK_DEAD, {"id": email_id, "error": error})
+        else:
+            self._record_outcome(
+                _MARK_RETRY, {"id": email_id, "error": error, "retry_in": retry_in}
+            )
+
+    def _record_outcome(self, stmt: TextClause, params: dict[str, object]) -> None:
+        # One commit per email: a failed update loses only that email's outcome.
+        try:
+            self.session.execute(stmt, params)
+            self.session.commit()
+        except SQLAlchemyError as exc:  # pragma: no cover - DB failure
+            self.session.rollback()
+            raise EmailOutboxError("No se pudo actualizar el estado del correo") from exc
+
+    @staticmethod
+    def _normalize_recipients(recipients: Iterable[str] | str) -> list[str]:
+        if isinstance(recipients, str):
+            recipients = [recipients]
+        return [recipient.strip() for recipient in recipients if recipient and recipient.strip()]
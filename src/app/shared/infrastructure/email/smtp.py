@@ -1,23 +1,118 @@
 from email.message import EmailMessage as MIMEEmailMessage
 import smtplib
+import threading
+import time
+from collections.abc import Callable, Sequence
 from typing import Iterable
 
-from app.shared.application.email import EmailDeliveryError, EmailMessage, EmailSender
+from app.shared.application.email import (
+    EmailDeliveryError,
+    EmailMessage,
+    EmailSender,
+    EmailSenderStats,
+)
 from app.shared.infrastructure.logger import logger
 from app.shared.infrastructure.settings import EmailSettings
 
+# The server closed the session (idle timeout, restart): worth one retry on a fresh connection.
+_DROPPED_CONNECTION_ERRORS = (smtplib.SMTPServerDisconnected, ConnectionError, TimeoutError)
+
 
 class SmtpEmailSender(EmailSender):
-    """SMTP implementation tuned for Gmail with STARTTLS by default."""
+    """SMTP implementation tuned for Gmail with STARTTLS by default.
+
+    EHLO/STARTTLS/LOGIN cost far more than a send, so authenticated sessions are kept in a
+    small LIFO pool (``SMTP_POOL_SIZE``) and reused until they have been idle for
+    ``SMTP_POOL_IDLE_SECONDS``. A session the server dropped is replaced and the message
+    retried once. ``send_many`` sends a whole batch over one session.
+    """
 
-    def __init__(self, settings: EmailSettings) -> None:
+    def __init__(
+        self,
+        settings: EmailSettings,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
         self._settings = settings
+        self._clock = clock
+        self._idle: list[tuple[float, smtplib.SMTP]] = []
+        self._lock = threading.Lock()
+        self._sent = 0
+        self._failed = 0
+        self._connections_opened = 0
+        self._connections_reused = 0
+        self._reconnects = 0
+        self._send_seconds_total = 0.0
+        self._send_seconds_max = 0.0
 
     def send(self, message: EmailMessage) -> None:
+        error = self.send_many([message])[0]
+        if error is not None:
+            raise error
+
+    def send_many(self, messages: Sequence[EmailMessage]) -> list[EmailDeliveryError | None]:
+        results: list[EmailDeliveryError | None] = [None] * len(messages)
         if not self._settings.enabled:
             logger.info("Email sending is disabled; skipping delivery.")
-            return
+            return results
+
+        prepared: list[tuple[int, MIMEEmailMessage]] = []
+        for index, message in enumerate(messages):
+            try:
+                prepared.append((index, self._prepare(message)))
+            except EmailDeliveryError as exc:
+                results[index] = exc
+        if not prepared:
+            return results
+
+        client: smtplib.SMTP | None = None
+        try:
+            for position, (index, mime_message) in enumerate(prepared):
+                started = time.perf_counter()
+                if client is None:
+                    try:
+                        client = self._acquire()
+                    except EmailDeliveryError as exc:
+                        # No session to be had: the rest of the batch would wait out the same
+                        # timeout, so fail it right away.
+                        for pending_index, _ in prepared[position:]:
+                            results[pending_index] = exc
+                            self._record_send(0.0, ok=False)
+                        break
+                client, results[index] = self._deliver(client, mime_message)
+                elapsed = time.perf_counter() - started
+                self._record_send(elapsed, ok=results[index] is None)
+                if results[index] is None:
+                    logger.info(
+                        "Correo enviado correctamente a %s en %.1f ms",
+                        mime_message["To"],
+                        elapsed * 1000,
+                    )
+        finally:
+            if client is not None:
+                self._release(client)
+        return results
+
+    def stats(self) -> EmailSenderStats:
+        with self._lock:
+            return EmailSenderStats(
+                sent=self._sent,
+                failed=self._failed,
+                connections_opened=self._connections_opened,
+                connections_reused=self._connections_reused,
+                reconnects=self._reconnects,
+                send_seconds_total=self._send_seconds_total,
+                send_seconds_max=self._send_seconds_max,
+            )
+
+    def close(self) -> None:
+        """Quit every pooled session."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for _, client in idle:
+            self._close(client)
 
+    def _prepare(self, message: EmailMessage) -> MIMEEmailMessage:
         recipients = self._normalize_recipients(message.to)
         if not recipients:
             raise EmailDeliveryError("No se proporcionaron destinatarios para el correo.")
@@ -30,37 +125,47 @@ class SmtpEmailSender(EmailSender):
         if not subject:
             raise EmailDeliveryError("El asunto del correo no puede estar vacío.")
 
-        smtp_username = (self._settings.smtp_username or "").strip()
-        smtp_password = (self._settings.smtp_password or "").strip()
-        if not smtp_username or not smtp_password:
-            raise EmailDeliveryError("Faltan las credenciales SMTP para enviar correos.")
-
-        mime_message = self._build_message(
+        return self._build_message(
             message=message,
             recipients=recipients,
             from_email=from_email,
         )
 
-        logger.info(
-            "Intentando enviar correo via SMTP. to=%s from=%s host=%s port=%s tls=%s ssl=%s",
-            recipients,
-            from_email,
-            self._settings.smtp_host,
-            self._settings.smtp_port,
-            self._settings.smtp_use_tls,
-            self._settings.smtp_use_ssl,
-        )
+    def _deliver(
+        self, client: smtplib.SMTP, mime_message: MIMEEmailMessage
+    ) -> tuple[smtplib.SMTP | None, EmailDeliveryError | None]:
+        """Send over ``client``: returns the session to keep using (``None`` once closed) and
+        the outcome (``None`` if sent)."""
+        reconnected = False
+        while True:
+            try:
+                client.send_message(mime_message)
+                return client, None
+            except _DROPPED_CONNECTION_ERRORS as exc:
+                self._close(client)
+                if reconnected:
+                    return None, self._delivery_error(exc)
+                logger.info("Sesión SMTP cerrada por el servidor; reconectando")
+                with self._lock:
+                    self._reconnects += 1
+                reconnected = True
+                try:
+                    client = self._connect()
+                except EmailDeliveryError as connect_error:
+                    return None, connect_error
+            except (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused) as exc:
+                # The server refused this message; the session itself is still usable.
+                return client, self._delivery_error(exc)
+            except (smtplib.SMTPException, OSError) as exc:
+                self._close(client)
+                return None, self._delivery_error(exc)
 
-        try:
-            self._send_via_smtp(
-                mime_message=mime_message,
-                username=smtp_username,
-                password=smtp_password,
-            )
-            logger.info("Correo enviado correctamente a %s", recipients)
-        except Exception as exc:  # pragma: no cover - network failures
-            logger.exception("No se pudo enviar el correo mediante SMTP")
-            raise EmailDeliveryError("No se pudo enviar el correo") from exc
+    @staticmethod
+    def _delivery_error(exc: Exception) -> EmailDeliveryError:
+        logger.warning("No se pudo enviar el correo mediante SMTP: %s", exc)
+        error = EmailDeliveryError(f"No se pudo enviar el correo: {exc}")
+        error.__cause__ = exc
+        return error
 
     def _build_message(
         self,
@@ -84,25 +189,80 @@ class SmtpEmailSender(EmailSender):
 
         return mime
 
-    def _send_via_smtp(
-        self,
-        *,
-        mime_message: MIMEEmailMessage,
-        username: str,
-        password: str,
-    ) -> None:
+    def _acquire(self) -> smtplib.SMTP:
+        stale: list[smtplib.SMTP] = []
+        client = None
+        with self._lock:
+            while self._idle:
+                released_at, candidate = self._idle.pop()
+                if self._clock() - released_at < self._settings.smtp_pool_idle_seconds:
+                    client = candidate
+                    self._connections_reused += 1
+                    break
+                stale.append(candidate)
+        for candidate in stale:
+            self._close(candidate)
+        return client if client is not None else self._connect()
+
+    def _release(self, client: smtplib.SMTP) -> None:
+        with self._lock:
+            if len(self._idle) < self._settings.smtp_pool_size:
+                self._idle.append((self._clock(), client))
+                return
+        self._close(client)
+
+    def _connect(self) -> smtplib.SMTP:
+        # Without a username the client skips AUTH, e.g. for a local SMTP stand-in like Mailpit.
+        username = (self._settings.smtp_username or "").strip()
+        password = (self._settings.smtp_password or "").strip()
+        if username and not password:
+            raise EmailDeliveryError("Falta la contraseña SMTP para enviar correos.")
+
+        logger.info(
+            "Abriendo sesión SMTP. host=%s port=%s tls=%s ssl=%s",
+            self._settings.smtp_host,
+            self._settings.smtp_port,
+            self._settings.smtp_use_tls,
+            self._settings.smtp_use_ssl,
+        )
         smtp_class = smtplib.SMTP_SSL if self._settings.smtp_use_ssl else smtplib.SMTP
-        with smtp_class(
-            host=self._settings.smtp_host,
-            port=self._settings.smtp_port,
-            timeout=self._settings.smtp_timeout,
-        ) as client:
+        client = None
+        try:
+            client = smtp_class(
+                host=self._settings.smtp_host,
+                port=self._settings.smtp_port,
+                timeout=self._settings.smtp_timeout,
+            )
             client.ehlo()
             if self._settings.smtp_use_tls and not self._settings.smtp_use_ssl:
                 client.starttls()
                 client.ehlo()
-            client.login(username, password)
-            client.send_message(mime_message)
+            if username:
+                client.login(username, password)
+        except (smtplib.SMTPException, OSError) as exc:  # pragma: no cover - network failures
+            if client is not None:
+                self._close(client)
+            logger.exception("No se pudo abrir la sesión SMTP")
+            raise EmailDeliveryError("No se pudo conectar con el servidor SMTP") from exc
+        with self._lock:
+            self._connections_opened += 1
+        return client
+
+    @staticmethod
+    def _close(client: smtplib.SMTP) -> None:
+        try:
+            client.quit()
+        except (smtplib.SMTPException, OSError):
+            client.close()
+
+    def _record_send(self, elapsed: float, *, ok: bool) -> None:
+        with self._lock:
+            if ok:
+                self._sent += 1
+            else:
+                self._failed += 1
+            self._send_seconds_total += elapsed
+            self._send_seconds_max = max(self._send_seconds_max, elapsed)
 
     @staticmethod
     def _normalize_recipients(recipients: Iterable[str] | str) -> list[str]:
@@ -0,0 +1,73 @@
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator, Sequence
+from enum import Enum
+from typing import Any
+
+from fastapi.responses import StreamingResponse
+
+# Rows are grouped before being handed to the ASGI server so a sync iterator does not pay a
+# threadpool hop per row.
+EXPORT_CHUNK_ROWS = 500
+# Separator for list-valued columns (e.g. image URLs) in CSV exports and imports.
+CSV_LIST_SEPARATOR = "|"
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+}
+
+
+def ndjson_lines(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, default=str) + "\n"
+
+
+def csv_lines(rows: Iterable[dict[str, Any]], columns: Sequence[str]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    for row in rows:
+        writer.writerow(row)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def _chunked(lines: Iterable[str], size: int = EXPORT_CHUNK_ROWS) -> Iterator[str]:
+    pending: list[str] = []
+    for line in lines:
+        pending.append(line)
+        if len(pending) >= size:
+            yield "".join(pending)
+            pending.clear()
+    if pending:
+        yield "".join(pending)
+
+
+def streaming_export(
+    rows: Iterable[dict[str, Any]],
+    *,
+    export_format: ExportFormat,
+    csv_columns: Sequence[str],
+    filename: str,
+) -> StreamingResponse:
+    """Wrap a lazily produced row iterator in a chunked NDJSON/CSV download."""
+    if export_format is ExportFormat.CSV:
+        lines = csv_lines(rows, csv_columns)
+    else:
+        lines = ndjson_lines(rows)
+    return StreamingResponse(
+        _chunked(lines),
+        media_type=_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format.value}"'},
+    )
@@ -0,0 +1,35 @@
+from collections.abc import Iterable
+
+from fastapi import HTTPException, status
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ALWAYS_INCLUDED_FIELDS = frozenset({"id"})
+
+
+def parse_fields(raw: str | None, allowed: Iterable[str]) -> frozenset[str] | None:
+    """Parse a ``fields=a,b,c`` query value; ``None`` means "every field".
+
+    ``id`` is always returned so clients can correlate trimmed items.
+    """
+    if raw is None or not raw.strip():
+        return None
+    requested = {field.strip() for field in raw.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+        )
+    return frozenset(requested | ALWAYS_INCLUDED_FIELDS)
+
+
+def sparse_item_response(item: BaseModel, fields: frozenset[str]) -> JSONResponse:
+    return JSONResponse(item.model_dump(mode="json", by_alias=True, include=set(fields)))
+
+
+def sparse_page_response(page: BaseModel, fields: frozenset[str]) -> JSONResponse:
+    """Trim every element of ``page.items`` while keeping the rest of the envelope intact."""
+    items_include = {"__all__": set(fields)}
+    include = {name: items_include if name == "items" else True for name in type(page).model_fields}
+    return JSONResponse(page.model_dump(mode="json", by_alias=True, include=include))
@@ -0,0 +1,94 @@
+from collections.abc import Sequence
+from typing import cast
+
+from sqlalchemy import (
+    Table,
+    Text,
+    and_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import DeclarativeBase, Session
+
+
+def replace_images[ImageModel: DeclarativeBase](
+    session: Session,
+    image_model: type[ImageModel],
+    owner_column: str,
+    owner_id: int,
+    image_urls: Sequence[str],
+) -> Sequence[ImageModel]:
+    """Make the owner's images match ``image_urls`` in one statement and return them by id.
+
+    Rows whose URL is still requested are kept untouched; the rest are deleted and the missing
+    URLs inserted in request order. Repeated URLs are matched one-to-one (the n-th stored copy of
+    a URL pairs with its n-th requested copy), so ``[a, a]`` keeps two rows. Runs inside the
+    caller's transaction.
+    """
+    table = cast(Table, inspect(image_model).local_table)
+    owner = table.c[owner_column]
+    owner_param = bindparam("owner_id", owner_id, type_=owner.type)
+
+    requested = (
+        func.unnest(bindparam("image_urls", list(image_urls), type_=ARRAY(Text)))
+        .table_valued("image_url", with_ordinality="position")
+        .render_derived()
+    )
+    existing = (
+        select(
+            table.c.id,
+            table.c.image_url,
+            func.row_number()
+            .over(partition_by=table.c.image_url, order_by=table.c.id)
+            .label("occurrence"),
+        )
+        .where(owner == owner_param)
+        .cte("existing")
+    )
+    wanted = select(
+        requested.c.image_url,
+        requested.c.position,
+        func.row_number()
+        .over(partition_by=requested.c.image_url, order_by=requested.c.position)
+        .label("occurrence"),
+    ).cte("wanted")
+    same_copy = and_(
+        existing.c.image_url == wanted.c.image_url,
+        existing.c.occurrence == wanted.c.occurrence,
+    )
+
+    stale = (
+        delete(table)
+        .where(
+            table.c.id.in_(
+                select(existing.c.id)
+                .outerjoin(wanted, same_copy)
+                .where(wanted.c.image_url.is_(None))
+            )
+        )
+        .returning(table.c.id)
+        .cte("stale")
+    )
+    inserted = (
+        insert(table)
+        .from_select(
+            [owner, table.c.image_url],
+            select(owner_param, wanted.c.image_url)
+            .outerjoin(existing, same_copy)
+            .where(existing.c.id.is_(None))
+            .order_by(wanted.c.position),
+        )
+        .returning(*table.c)
+        .cte("inserted")
+    )
+    # The outer SELECT still sees the rows as they were before this statement, so deleted rows
+    # are filtered out explicitly and the inserted ones come from RETURNING.
+    kept = select(*table.c).where(owner == owner_param, table.c.id.not_in(select(stale.c.id)))
+    images = union_all(kept, select(*inserted.c)).order_by(table.c.id.name)
+    return session.scalars(select(image_model).from_statement(images)).all()
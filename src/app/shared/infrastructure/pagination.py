@@ -1,10 +1,37 @@
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict, Field
 
+from app.shared.domain.pagination import CountMode, PaginatedResult
+
 
 class PaginationMeta(BaseModel):
     page: int
     page_size: int = Field(serialization_alias="pageSize")
-    total: int
-    total_pages: int = Field(serialization_alias="totalPages")
+    total: int | None
+    total_pages: int | None = Field(serialization_alias="totalPages")
+    next_cursor: str | None = Field(default=None, serialization_alias="nextCursor")
+    has_more: bool = Field(default=False, serialization_alias="hasMore")
+    count_mode: CountMode = Field(default=CountMode.EXACT, serialization_alias="count")
+
+    model_config = ConfigDict(populate_by_name=True)
+
+    @classmethod
+    def from_result(cls, result: PaginatedResult[Any]) -> "PaginationMeta":
+        return cls(
+            page=result.page,
+            page_size=result.page_size,
+            total=result.total,
+            total_pages=result.total_pages,
+            next_cursor=result.next_cursor,
+            has_more=bool(result.has_more),
+            count_mode=result.count_mode,
+        )
+
+
+class CursorPaginationMeta(BaseModel):
+    page_size: int = Field(serialization_alias="pageSize")
+    next_cursor: str | None = Field(default=None, serialization_alias="nextCursor")
+    has_more: bool = Field(serialization_alias="hasMore")
 
     model_config = ConfigDict(populate_by_name=True)
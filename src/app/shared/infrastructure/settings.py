@@ -107,6 +107,28 @@ class CorsSettings(BaseModel):
     allow_headers: list[str] = Field(default_factory=lambda: ["*"])
 
 
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(
+        env_file=(".env", ".env.prod"),
+        env_file_encoding="utf-8",
+        env_nested_delimiter="__",
+        extra="ignore",
+        case_sensitive=False,
+    )
+
+    # A zero TTL or size disables the per-process GET /records/{id} cache.
+    record_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0,
+        validation_alias=AliasChoices("RECORD_CACHE_TTL_SECONDS", "CACHE__RECORD_TTL_SECONDS"),
+    )
+    record_max_entries: int = Field(
+        default=1024,
+        ge=0,
+        validation_alias=AliasChoices("RECORD_CACHE_MAX_ENTRIES", "CACHE__RECORD_MAX_ENTRIES"),
+    )
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=(".env", ".env.prod"),
@@ -128,6 +150,7 @@ class Settings(BaseSettings):
     email: EmailSettings = Field(default_factory=EmailSettings)
     email: EmailSettings = Field(default_factory=EmailSettings)
     cors: CorsSettings = Field(default_factory=CorsSettings)
+    cache: CacheSettings = Field(default_factory=CacheSettings)
 
     @property
     def is_production(self) -> bool:
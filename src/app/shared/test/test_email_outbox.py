@@ -0,0 +1,121 @@
+from collections.abc import Sequence
+from unittest.mock import Mock
+
+from app.shared.application.email import EmailDeliveryError, EmailMessage, EmailSenderStats
+from app.shared.application.email.outbox import (
+    DispatchResult,
+    PendingEmail,
+    dispatch_pending_emails,
+    retry_delay,
+)
+
+
+class FlakySmtp:
+    """SMTP stand-in that fails for the listed recipients and records what it delivered."""
+
+    def __init__(self, failing: set[str]) -> None:
+        self.failing = failing
+        self.delivered: list[str] = []
+        self.batches = 0
+
+    def send(self, message: EmailMessage) -> None:
+        error = self.send_many([message])[0]
+        if error is not None:
+            raise error
+
+    def send_many(self, messages: Sequence[EmailMessage]) -> list[EmailDeliveryError | None]:
+        self.batches += 1
+        results: list[EmailDeliveryError | None] = []
+        for message in messages:
+            recipient = str(message.to)
+            if recipient in self.failing:
+                results.append(EmailDeliveryError("421 service not available"))
+                continue
+            self.delivered.append(recipient)
+            results.append(None)
+        return results
+
+    def stats(self) -> EmailSenderStats:
+        return EmailSenderStats(
+            sent=len(self.delivered),
+            failed=0,
+            connections_opened=self.batches,
+            connections_reused=0,
+            reconnects=0,
+            send_seconds_total=0.0,
+            send_seconds_max=0.0,
+        )
+
+
+def _pending(email_id: int, to: str, attempts: int = 0) -> PendingEmail:
+    return PendingEmail(
+        id=email_id,
+        message=EmailMessage(to=to, subject="Hola", body="Texto"),
+        attempts=attempts,
+    )
+
+
+def _dispatch(store: Mock, sender: FlakySmtp, max_attempts: int = 3) -> DispatchResult:
+    return dispatch_pending_emails(
+        store,
+        sender,
+        batch_size=10,
+        max_attempts=max_attempts,
+        lease_seconds=60,
+        retry_base_seconds=30,
+        retry_max_seconds=100,
+    )
+
+
+def test_retry_delay_doubles_until_the_cap() -> None:
+    delays = [retry_delay(attempt, base_seconds=30, max_seconds=100) for attempt in range(1, 5)]
+
+    assert delays == [30, 60, 100, 100]
+
+
+def test_dispatch_marks_delivered_emails_as_sent() -> None:
+    store = Mock()
+    store.claim.return_value = [_pending(1, "a@example.com"), _pending(2, "b@example.com")]
+    sender = FlakySmtp(failing=set())
+
+    result = _dispatch(store, sender)
+
+    assert sender.delivered == ["a@example.com", "b@example.com"]
+    assert sender.batches == 1
+    assert result.sent == 2
+    store.claim.assert_called_once_with(batch_size=10, lease_seconds=60)
+    assert [call.args for call in store.mark_sent.call_args_list] == [(1,), (2,)]
+    store.mark_failed.assert_not_called()
+
+
+def test_dispatch_backs_off_failed_emails_and_keeps_going() -> None:
+    store = Mock()
+    store.claim.return_value = [_pending(1, "down@example.com", attempts=1), _pending(2, "ok@x.co")]
+    sender = FlakySmtp(failing={"down@example.com"})
+
+    result = _dispatch(store, sender)
+
+    assert (result.sent, result.retried, result.dead) == (1, 1, 0)
+    store.mark_failed.assert_called_once_with(1, error="421 service not available", retry_in=60)
+    store.mark_sent.assert_called_once_with(2)
+
+
+def test_dispatch_dead_letters_after_max_attempts() -> None:
+    store = Mock()
+    store.claim.return_value = [_pending(1, "down@example.com", attempts=2)]
+
+    result = _dispatch(store, FlakySmtp(failing={"down@example.com"}), max_attempts=3)
+
+    assert result.dead == 1
+    store.mark_failed.assert_called_once_with(1, error="421 service not available", retry_in=None)
+
+
+def test_dispatch_skips_the_sender_when_nothing_is_due() -> None:
+    store = Mock()
+    store.claim.return_value = []
+    sender = FlakySmtp(failing=set())
+
+    result = _dispatch(store, sender)
+
+    assert result.processed == 0
+    assert sender.batches == 0
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+from app.shared.application.email import EmailTemplates, TemplateSyntaxError
+from app.shared.application.email.templates import EmailTemplate, compile_template
+
+
+def test_html_templates_escape_values_and_text_templates_do_not() -> None:
+    context = {"body": "<script>alert('x')</script> & más"}
+
+    html = compile_template("<p>{{ body }}</p>", escape=True).render(context)
+    text = compile_template("{{ body }}", escape=False).render(context)
+
+    assert html == "<p>&lt;script&gt;alert(&#x27;x&#x27;)&lt;/script&gt; &amp; más</p>"
+    assert text == context["body"]
+
+
+def test_sections_iterate_lists_for_digest_style_templates() -> None:
+    template = compile_template(
+        "{{# reviews }}<li>{{ title }} ({{ rating }}/5) en {{ city }}</li>{{/ reviews }}"
+        "{{^ reviews }}<p>Sin reseñas</p>{{/ reviews }}",
+        escape=True,
+    )
+    reviews = [{"title": "Bien", "rating": 4}, {"title": "<b>Mal</b>", "rating": 1}]
+
+    assert template.render({"reviews": reviews, "city": "Bogotá"}) == (
+        "<li>Bien (4/5) en Bogotá</li><li>&lt;b&gt;Mal&lt;/b&gt; (1/5) en Bogotá</li>"
+    )
+    assert template.render({"reviews": [], "city": "Bogotá"}) == "<p>Sin reseñas</p>"
+
+
+def test_dotted_paths_missing_values_and_current_item() -> None:
+    template = compile_template(
+        "{{ review.title }}|{{ review.missing }}|{{# tags }}[{{ . }}]{{/ tags }}", escape=False
+    )
+
+    assert template.render({"review": {"title": "Hola"}, "tags": ["a", "b"]}) == "Hola||[a][b]"
+
+
+@pytest.mark.parametrize("source", ["{{# a }}sin cerrar", "{{/ a }}", "{{# a }}{{/ b }}"])
+def test_unbalanced_sections_are_rejected_at_compile_time(source: str) -> None:
+    with pytest.raises(TemplateSyntaxError):
+        compile_template(source, escape=False)
+
+
+def test_locale_falls_back_to_language_then_default() -> None:
+    def variant(label: str) -> EmailTemplate:
+        return EmailTemplate(
+            subject=compile_template(label, escape=False),
+            text=compile_template(label, escape=False),
+        )
+
+    templates = EmailTemplates(
+        {("greeting", "es"): variant("Hola"), ("greeting", "en"): variant("Hi")}
+    )
+
+    assert templates.render("greeting", {}, to="a@b.co", locale="en-US").subject == "Hi"
+    assert templates.render("greeting", {}, to="a@b.co", locale="fr").subject == "Hola"
+    assert templates.render("greeting", {}, to="a@b.co").subject == "Hola"
+
+
+def test_templates_are_loaded_from_directory(tmp_path: Path) -> None:
+    locale_dir = tmp_path / "digest" / "es"
+    locale_dir.mkdir(parents=True)
+    (locale_dir / "subject.txt").write_text("{{ count }} reseñas nuevas\n", encoding="utf-8")
+    (locale_dir / "body.txt").write_text("{{ count }}", encoding="utf-8")
+
+    message = EmailTemplates.from_directory(tmp_path).render("digest", {"count": 3}, to="a@b.co")
+
+    assert message.subject == "3 reseñas nuevas"
+    assert message.html_body is None
+
+
+def test_bundled_review_created_template_renders_both_locales() -> None:
+    templates = EmailTemplates.from_directory()
+    context = {"title": None, "rating": 5, "body": "Muy <b>cómodo</b>"}
+
+    es = templates.render("review_created", context, to="a@b.co")
+    en = templates.render("review_created", context, to="a@b.co", locale="en")
+
+    assert es.subject == "¡Gracias por tu reseña en Rentview!"
+    assert "- Título: Sin título" in es.body
+    assert "Muy &lt;b&gt;cómodo&lt;/b&gt;" in (es.html_body or "")
+    assert "- Title: Untitled" in en.body
@@ -0,0 +1,118 @@
+import smtplib
+
+import pytest
+
+from app.shared.application.email import EmailMessage
+from app.shared.infrastructure.email.email_settings import EmailSettings
+from app.shared.infrastructure.email.smtp import SmtpEmailSender
+
+
+class FakeSMTP:
+    """In-memory SMTP server session; ``drop_next`` simulates the server closing it."""
+
+    sessions: list["FakeSMTP"] = []
+
+    def __init__(self, *, host: str, port: int, timeout: float) -> None:
+        self.logins = 0
+        self.sent: list[str] = []
+        self.drop_next = False
+        self.closed = False
+        FakeSMTP.sessions.append(self)
+
+    def ehlo(self) -> None: ...
+
+    def starttls(self) -> None: ...
+
+    def login(self, username: str, password: str) -> None:
+        self.logins += 1
+
+    def send_message(self, message: object) -> None:
+        if self.drop_next or self.closed:
+            raise smtplib.SMTPServerDisconnected("Connection unexpectedly closed")
+        if "rejected" in message["To"]:  # type: ignore[index]
+            raise smtplib.SMTPRecipientsRefused({message["To"]: (550, b"No such user")})  # type: ignore[index]
+        self.sent.append(message["To"])  # type: ignore[index]
+
+    def quit(self) -> None:
+        self.closed = True
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch: pytest.MonkeyPatch) -> type[FakeSMTP]:
+    FakeSMTP.sessions = []
+    monkeypatch.setattr("app.shared.infrastructure.email.smtp.smtplib.SMTP", FakeSMTP)
+    return FakeSMTP
+
+
+def _sender(now: list[float], **overrides: object) -> SmtpEmailSender:
+    settings = EmailSettings.model_validate(
+        {
+            "EMAIL_FROM": "noreply@example.com",
+            "SMTP_USERNAME": "user",
+            "SMTP_PASSWORD": "secret",
+            "SMTP_POOL_SIZE": 1,
+            "SMTP_POOL_IDLE_SECONDS": 60,
+            **overrides,
+        }
+    )
+    return SmtpEmailSender(settings, clock=lambda: now[0])
+
+
+def _message(to: str) -> EmailMessage:
+    return EmailMessage(to=to, subject="Hola", body="Texto")
+
+
+def test_consecutive_sends_reuse_one_authenticated_session(fake_smtp: type[FakeSMTP]) -> None:
+    sender = _sender([0.0])
+
+    sender.send(_message("a@example.com"))
+    sender.send(_message("b@example.com"))
+
+    assert len(fake_smtp.sessions) == 1
+    assert fake_smtp.sessions[0].logins == 1
+    assert fake_smtp.sessions[0].sent == ["a@example.com", "b@example.com"]
+    stats = sender.stats()
+    assert (stats.sent, stats.connections_opened, stats.connections_reused) == (2, 1, 1)
+
+
+def test_send_many_uses_one_session_and_reports_each_outcome(fake_smtp: type[FakeSMTP]) -> None:
+    sender = _sender([0.0])
+
+    errors = sender.send_many(
+        [_message("a@example.com"), _message("rejected@example.com"), _message("c@example.com")]
+    )
+
+    assert errors[0] is None and errors[2] is None
+    assert errors[1] is not None and "550" in str(errors[1])
+    assert len(fake_smtp.sessions) == 1
+    assert fake_smtp.sessions[0].sent == ["a@example.com", "c@example.com"]
+    assert sender.stats().failed == 1
+
+
+def test_dropped_session_is_replaced_and_the_message_retried(fake_smtp: type[FakeSMTP]) -> None:
+    sender = _sender([0.0])
+    sender.send(_message("a@example.com"))
+    fake_smtp.sessions[0].drop_next = True
+
+    sender.send(_message("b@example.com"))
+
+    assert len(fake_smtp.sessions) == 2
+    assert fake_smtp.sessions[0].closed
+    assert fake_smtp.sessions[1].sent == ["b@example.com"]
+    assert sender.stats().reconnects == 1
+
+
+def test_idle_sessions_past_the_limit_are_not_reused(fake_smtp: type[FakeSMTP]) -> None:
+    now = [0.0]
+    sender = _sender(now)
+    sender.send(_message("a@example.com"))
+
+    now[0] = 61.0
+    sender.send(_message("b@example.com"))
+
+    assert len(fake_smtp.sessions) == 2
+    assert fake_smtp.sessions[0].closed
+    assert sender.stats().connections_reused == 0